@@ -0,0 +1,346 @@
+"""
+Launcher agent: lets an instructor console drive this station over the network.
+
+Runs an asyncio TCP server speaking a small line-delimited JSON RPC. Each
+request is one line:
+
+    {"id": 1, "method": "launch", "params": {"name": "Heart"}}
+
+and gets exactly one reply line with the same id:
+
+    {"id": 1, "result": {...}}
+    {"id": 1, "error": {"type": "not_found", "message": "..."}}
+
+A connection stays open for any number of requests, and requests on one
+connection may overlap (replies can come back out of order; match them
+by id). If the agent has a token (--token or SURGICAL_SUITE_AGENT_TOKEN),
+the first request must be {"method": "hello", "params": {"token": ...}}.
+
+Only modules from the catalogue can be launched, by name; no paths or
+arguments are accepted from the network. Launches take the same path as
+the GUI's (station_vr), except that the agent keeps no standby pool (the
+GUI's would compete with it): build and manifest check, then the admission
+scheduler, which may queue a launch (for up to five minutes) or
+refuse it for lack of resources unless it is forced ({"name": "Heart", "force": true}). No Qt here.
+
+    python agent_vr.py                      # 127.0.0.1:48730
+    python agent_vr.py --host 0.0.0.0 --token s3cret
+"""
+import argparse
+import asyncio
+import hmac
+import inspect
+import json
+import os
+import socket
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import catalog_vr
+import launch_vr
+import logs_vr
+import process_vr
+import scheduler_vr
+import station_vr
+import telemetry_vr
+
+PROTOCOL_VERSION = 1
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 48730
+TOKEN_ENV = "SURGICAL_SUITE_AGENT_TOKEN"
+# Longest request line accepted (a request is a few hundred bytes)
+MAX_LINE = 64 * 1024
+
+
+class RpcError(Exception):
+    """An error reply; kind is a short machine-readable code."""
+
+    def __init__(self, kind, message):
+        super().__init__(message)
+        self.kind = kind
+
+
+def encode(message):
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def check_params(method, handler, params):
+    """Raise RpcError unless params is an object whose names fit the handler's arguments."""
+    if not isinstance(params, dict):
+        raise RpcError("bad_request", "'params' must be a JSON object")
+    try:
+        inspect.signature(handler).bind(None, **params)
+    except TypeError as e:
+        raise RpcError("bad_request", f"Bad params for '{method}': {e}")
+
+
+def number_param(value, name, kind=float):
+    """A numeric request parameter, or RpcError."""
+    if isinstance(value, bool):
+        raise RpcError("bad_request", f"'{name}' must be a number")
+    try:
+        return kind(value)
+    except (TypeError, ValueError):
+        raise RpcError("bad_request", f"'{name}' must be a number")
+
+
+class Agent:
+    """Serves launch/stop/status requests for the modules of one station."""
+
+    def __init__(self, catalog=None, station=None, token=None):
+        self.catalog = catalog or catalog_vr.Catalog()
+        self.station = station or station_vr.Station(self.catalog, on_queue=self.on_queue_event)
+        self.supervisor = self.station.supervisor
+        self.logs = self.station.logs
+        self.sessions = self.station.sessions
+        self.token = token
+        # Catalogue reads, build checks and Popen block, so they run off the event loop
+        self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="agent")
+        self.methods = {
+            "hello": self.rpc_hello,
+            "ping": self.rpc_ping,
+            "list": self.rpc_list,
+            "status": self.rpc_status,
+            "launch": self.rpc_launch,
+            "stop": self.rpc_stop,
+            "logs": self.rpc_logs,
+            "usage": self.rpc_usage,
+        }
+
+    def on_queue_event(self, name, state, detail):
+        # A queued launch started, failed or gave up waiting; there's no one to ask
+        print(f"Queued launch of '{name}': {state}{f' ({detail})' if detail else ''}", flush=True)
+
+    async def blocking(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+
+    # ==========================================
+    # 🔹 CONNECTIONS
+    # ==========================================
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """Start listening. Returns the asyncio server."""
+        return await asyncio.start_server(self.handle_connection, host, port, limit=MAX_LINE)
+
+    async def handle_connection(self, reader, writer):
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        session = {"authenticated": self.token is None}
+        write_lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+                    break
+                if not line:
+                    break
+                if not session["authenticated"]:
+                    # Nothing else may run until hello has succeeded
+                    await self.respond(line, session, writer, write_lock)
+                    continue
+                task = asyncio.ensure_future(self.respond(line, session, writer, write_lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+    async def respond(self, line, session, writer, write_lock):
+        request_id = None
+        try:
+            try:
+                request = json.loads(line)
+                request_id = request.get("id")
+                method = request["method"]
+                params = request.get("params") or {}
+            except (ValueError, KeyError, AttributeError):
+                raise RpcError("bad_request", "Expected a JSON object with 'method'")
+            if method != "hello" and not session["authenticated"]:
+                raise RpcError("unauthorized", "Send hello with the agent token first")
+            handler = self.methods.get(method)
+            if handler is None:
+                raise RpcError("unknown_method", f"Unknown method '{method}'")
+            check_params(method, handler, params)
+            reply = {"id": request_id, "result": await handler(session, **params)}
+        except RpcError as e:
+            reply = {"id": request_id, "error": {"type": e.kind, "message": str(e)}}
+        except Exception as e:  # one bad request must not take the agent down
+            reply = {"id": request_id, "error": {"type": "internal", "message": str(e)}}
+        async with write_lock:
+            try:
+                writer.write(encode(reply))
+                await writer.drain()
+            except ConnectionError:
+                pass
+
+    # ==========================================
+    # 🔹 METHODS
+    # ==========================================
+    async def rpc_hello(self, session, token=None):
+        if self.token is not None and not hmac.compare_digest(str(token or ""), self.token):
+            raise RpcError("unauthorized", "Wrong agent token")
+        session["authenticated"] = True
+        return {"protocol": PROTOCOL_VERSION, "station": socket.gethostname()}
+
+    async def rpc_ping(self, session):
+        return {"station": socket.gethostname()}
+
+    async def rpc_list(self, session):
+        entries = await self.blocking(self.catalog.all)
+        return [{"name": e["name"], "description": e["description"], "favorite": e["favorite"]} for e in entries]
+
+    async def rpc_status(self, session, names=None):
+        """State of the named modules (all when names is empty)."""
+        if names is not None and not (isinstance(names, list) and all(isinstance(n, str) for n in names)):
+            raise RpcError("bad_request", "'names' must be a list of module names")
+        entries = await self.blocking(self.catalog.all)
+        if names:
+            wanted = {name.lower() for name in names}
+            entries = [e for e in entries if e["name"].lower() in wanted]
+        return await self.blocking(lambda: [self.module_status(e) for e in entries])
+
+    def module_status(self, entry):
+        record = self.supervisor.get(entry["name"])
+        if record is not None and record.state == process_vr.RUNNING:
+            return dict(record.as_dict(), state=process_vr.RUNNING)
+        # Started by another launcher on this station (the GUI, the command line)
+        elsewhere = self.supervisor.registry.find(entry["name"])
+        if elsewhere is not None:
+            return elsewhere.as_dict()
+        try:
+            launch_vr.check(entry)
+            state, detail = "ready", None
+        except launch_vr.LaunchError as e:
+            state, detail = e.reason, str(e)
+        status = {"name": entry["name"], "state": state, "detail": detail}
+        if record is not None:
+            # Last run, so the console can see a crash
+            status["last_run"] = record.as_dict()
+        return status
+
+    async def find(self, name):
+        def lookup():
+            # Same case-insensitive matching as the command line
+            return self.catalog.get(name) or next(
+                (e for e in self.catalog.all() if e["name"].lower() == str(name).lower()), None
+            )
+
+        entry = await self.blocking(lookup)
+        if entry is None:
+            raise RpcError("unknown_module", f"No module named '{name}'")
+        return entry
+
+    async def rpc_launch(self, session, name, force=False):
+        """Launch like the GUI does; the reply's state is launched, switched (warm standby) or queued."""
+        entry = await self.find(name)
+
+        def run():
+            decision = self.station.launch(entry, force=bool(force))
+            if decision.state == scheduler_vr.QUEUED:
+                return {"name": entry["name"], "state": scheduler_vr.QUEUED, "position": decision.position,
+                        "detail": decision.reason}
+            if decision.state == scheduler_vr.BLOCKED:
+                running = ", ".join(decision.blockers)
+                raise RpcError("blocked", f"{decision.reason} while {running} run(s); send force to launch anyway")
+            if decision.state == scheduler_vr.REJECTED:
+                raise RpcError("rejected", f"{decision.reason}; send force to launch anyway")
+            record = decision.record
+            state = "switched" if decision.reason == station_vr.WARM else "launched"
+            return dict(record.as_dict(), state=state, detail="; ".join(record.option_problems) or None)
+
+        try:
+            return await self.blocking(run)
+        except launch_vr.LaunchError as e:
+            raise RpcError(e.reason, str(e))
+        except process_vr.AlreadyRunningError as e:
+            raise RpcError("already_running", str(e))
+        except OSError as e:
+            raise RpcError("launch_failed", str(e))
+
+    async def rpc_stop(self, session, name, timeout=5.0):
+        """Stop a module, whichever launcher on this station started it."""
+        timeout = number_param(timeout, "timeout")
+        entry = await self.find(name)
+
+        def stop():
+            if self.supervisor.terminate(entry["name"], timeout):
+                return True
+            # Started by another launcher here (the GUI, the command line): go by its pid file
+            elsewhere = self.supervisor.registry.find(entry["name"])
+            return elsewhere is not None and process_vr.terminate_pid(elsewhere.pid, timeout)
+
+        try:
+            stopped = await self.blocking(stop)
+        except OSError as e:
+            raise RpcError("stop_failed", str(e))
+        return {"name": entry["name"], "stopped": stopped}
+
+    async def rpc_logs(self, session, name, lines=200, level="debug", search=None):
+        """The newest captured output lines of a module's latest launch."""
+        lines = number_param(lines, "lines", int)
+        entry = await self.find(name)
+        log = self.logs.get(entry["name"])
+        if log is None:
+            raise RpcError("no_logs", f"No output captured for '{entry['name']}' yet")
+        levels = {label: value for value, label in logs_vr.LEVEL_NAMES.items()}
+        if level not in levels:
+            raise RpcError("bad_request", f"level must be one of {', '.join(levels)}")
+        needle = (search or "").casefold()
+        selected = [line for line in log.buffer.snapshot()
+                    if line.level >= levels[level] and needle in line.text.casefold()]
+        return {
+            "name": entry["name"],
+            "path": log.path,
+            "lines": [line.format() for line in selected[-max(0, lines):]],
+        }
+
+    async def rpc_usage(self, session, by=("module",), since=None, until=None):
+        """Session rollup of this station's own sessions (see telemetry_vr.SessionLog.rollup)."""
+        try:
+            for day in (since, until):
+                if day:
+                    telemetry_vr.day_start(day)
+        except (TypeError, ValueError):
+            raise RpcError("bad_request", "since/until must be YYYY-MM-DD")
+        return await self.blocking(self.sessions.rollup, list(by or ()), since, until, self.sessions.station)
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+        self.station.stop()
+        self.catalog.close()
+
+
+async def run_agent(host, port, token):
+    agent = Agent(token=token)
+    server = await agent.serve(host, port)
+    addresses = ", ".join(f"{a[0]}:{a[1]}" for a in (s.getsockname() for s in server.sockets))
+    print(f"Launcher agent listening on {addresses}", flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        agent.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="agent_vr.py", description="Network agent for the Surgical Simulation Suite.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"address to listen on (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"port to listen on (default: {DEFAULT_PORT})")
+    parser.add_argument("--token", default=os.environ.get(TOKEN_ENV),
+                        help=f"shared secret the console must send (default: ${TOKEN_ENV})")
+    args = parser.parse_args(argv)
+    if args.host not in ("127.0.0.1", "localhost", "::1") and not args.token:
+        print("Warning: listening on the network without a token; anyone who can reach this port "
+              "can launch and stop modules.", file=sys.stderr)
+    try:
+        asyncio.run(run_agent(args.host, args.port, args.token))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
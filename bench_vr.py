@@ -0,0 +1,364 @@
+"""
+Headless benchmarks of the launcher's hot paths, with regression checks.
+
+Builds synthetic catalogues (6 to 5,000 modules) whose entries point at
+stub "Unity builds" (a tiny executable next to a fake *_Data folder) in a
+temporary folder, then times, under Qt's offscreen platform:
+
+    startup_ms          MainWindow() until the window is built
+    first_page_ms       ... until the first page of cards is filled
+    grid_ms             create_simulation_cards() with the whole catalogue paged in
+    status_refresh_ms   a full background re-check of every build path
+    card_status_ms      status line + card refresh of every card
+    repaint_cold_ms     painting the visible grid with empty caches
+    repaint_ms          painting it again (cached card parts)
+    hover_ms            hover highlight of a card, including the repaint
+    search_ms           filtering the grid on one search keystroke
+    config_dialog_ms    opening (and closing) the path configuration dialog
+    path_update_ms      a Browse round trip: new path saved, re-checked, card refreshed
+    spawn_ms            launch_vr.start() of a stub build until the child is spawned
+
+Each metric is the median of --repeat runs. Results are appended to
+bench_history.jsonl in the data folder; with --baseline the run fails
+(exit code 1) when a metric is more than --threshold slower than the
+baseline and the difference is above the timer noise:
+
+    python bench_vr.py --save-baseline baseline.json
+    python bench_vr.py --baseline baseline.json
+    python bench_vr.py --sizes 6,100 --repeat 1     # quick run
+
+The user's own catalogue and settings are never touched: each catalogue
+lives in its own temporary data folder.
+"""
+import argparse
+import json
+import os
+import shutil
+import socket
+import statistics
+import sys
+import tempfile
+import time
+from unittest import mock
+
+# Must be set before Qt loads; a real display is never needed
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import storage_vr
+
+HISTORY_FILENAME = "bench_history.jsonl"
+DEFAULT_SIZES = (6, 100, 1000, 5000)
+DEFAULT_REPEAT = 3
+# Slower than the baseline by more than this fraction is a regression...
+DEFAULT_THRESHOLD = 0.25
+# ...unless the difference is within timer and scheduling noise
+DEFAULT_NOISE_MS = 10.0
+# How long to wait for background work (path checks) before giving up
+SETTLE_TIMEOUT = 60.0
+SPAWN_RUNS = 10
+
+ICONS = ("❤️", "🫁", "🦷", "🩸", "👃", "🩻", "🧠", "🦴")
+COLORS = ("#D64545", "#38A169", "#3182CE", "#805AD5", "#DD6B20", "#319795")
+WORDS = ("cardiac", "hepatic", "dental", "vascular", "ent", "abdominal", "neuro", "spine",
+         "trauma", "laparoscopic", "suturing", "endoscopy", "biopsy", "catheter", "ortho", "ocular")
+
+
+# ==========================================
+# 🔹 STUB BUILDS AND CATALOGUES
+# ==========================================
+def make_stub_build(folder, name):
+    """A minimal build that passes the structure check and exits at once. Returns its exe path."""
+    os.makedirs(os.path.join(folder, f"{name}_Data"), exist_ok=True)
+    with open(os.path.join(folder, f"{name}_Data", "globalgamemanagers"), "wb") as f:
+        f.write(b"\0" * 1024)
+    if sys.platform == "win32":
+        # Executed through cmd.exe by CreateProcess; close enough to a tiny player
+        exe_path = os.path.join(folder, f"{name}.bat")
+        with open(exe_path, "w") as f:
+            f.write("@exit /b 0\n")
+    else:
+        exe_path = os.path.join(folder, f"{name}.exe")
+        with open(exe_path, "w") as f:
+            f.write("#!/bin/sh\nexit 0\n")
+        os.chmod(exe_path, 0o755)
+    return exe_path
+
+
+def synthetic_entries(count, builds_root):
+    """count catalogue entries, each with its own stub build under builds_root."""
+    entries = []
+    for i in range(count):
+        name = f"Module {i:04d}"
+        folder = os.path.join(builds_root, f"module_{i:04d}")
+        entries.append({
+            "name": name,
+            "icon": ICONS[i % len(ICONS)],
+            "description": f"{WORDS[i % len(WORDS)].title()} {WORDS[(i * 7) % len(WORDS)]} VR",
+            "exe_path": make_stub_build(folder, "Player"),
+            "color": COLORS[i % len(COLORS)],
+            "favorite": i % 10 == 0,
+            "tags": [WORDS[(i * 3) % len(WORDS)]],
+        })
+    return entries
+
+
+# ==========================================
+# 🔹 MEASUREMENTS
+# ==========================================
+class Timer:
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.ms = (time.perf_counter() - self.started) * 1000.0
+
+
+def process_events_until(app, done, timeout=SETTLE_TIMEOUT):
+    deadline = time.monotonic() + timeout
+    while not done():
+        if time.monotonic() > deadline:
+            raise TimeoutError("background work did not finish in time")
+        app.processEvents()
+        time.sleep(0.001)
+
+
+def dismiss_modals(app):
+    """Close every modal dialog as soon as it opens (the measured code calls exec_())."""
+    from PyQt5.QtCore import QTimer
+    timer = QTimer()
+    timer.setInterval(0)
+    timer.timeout.connect(lambda: app.activeModalWidget() and app.activeModalWidget().close())
+    timer.start()
+    return timer
+
+
+def bench_catalogue(app, gui_vr, size, home):
+    """One run over a catalogue of *size* modules. Returns {metric: value}."""
+    import catalog_vr
+
+    os.environ[storage_vr.HOME_ENV] = home
+    catalog = catalog_vr.Catalog(seed=[])
+    catalog.add_many(synthetic_entries(size, os.path.join(home, "builds")))
+    catalog.close()
+
+    results = {}
+    with Timer() as t:
+        window = gui_vr.MainWindow()
+        window.show()
+    results["startup_ms"] = t.ms
+    try:
+        with Timer() as t:
+            process_events_until(app, lambda: not window.fill_timer.isActive())
+        results["first_page_ms"] = results["startup_ms"] + t.ms
+        # Rebuilding the grid, as after a rescan or import, with every page loaded
+        with Timer() as t:
+            window.create_simulation_cards()
+            window.load_all_simulations()
+        results["grid_ms"] = t.ms
+        paths = {sim["exe_path"] for sim in window.SIMULATIONS}
+        process_events_until(app, lambda: all(window.status_service.status(path) is not None for path in paths))
+        # Each fresh data folder probes the hardware once; don't time against it
+        window.profiles.hardware(timeout=SETTLE_TIMEOUT)
+
+        # Full re-check of every path, as after waking up or re-rooting
+        window.status_service.cache.clear()
+        with Timer() as t:
+            window.refresh_exe_status()
+            process_events_until(app, lambda: all(window.status_service.status(path) is not None for path in paths))
+        results["status_refresh_ms"] = t.ms
+
+        with Timer() as t:
+            for index in range(len(window.SIMULATIONS)):
+                window.card_status(index)
+                window.update_simulation_card(index)
+        results["card_status_ms"] = t.ms
+
+        viewport = window.card_view.viewport()
+        window.card_view.itemDelegate().pixmaps.clear()
+        with Timer() as t:
+            viewport.repaint()
+        results["repaint_cold_ms"] = t.ms
+        with Timer() as t:
+            for _ in range(10):
+                viewport.repaint()
+        results["repaint_ms"] = t.ms / 10
+
+        visible = range(min(10, len(window.SIMULATIONS)))
+        with Timer() as t:
+            for row in visible:
+                window.card_view.set_hovered_row(row)
+                viewport.repaint()
+        window.card_view.set_hovered_row(-1)
+        results["hover_ms"] = t.ms / len(visible)
+
+        with Timer() as t:
+            for text in ("c", "ca", "car", "card"):
+                window.search_bar.setText(text)
+        window.search_bar.clear()
+        results["search_ms"] = t.ms / 4
+
+        dismisser = dismiss_modals(app)
+        try:
+            with Timer() as t:
+                window.show_config_dialog()
+            results["config_dialog_ms"] = t.ms
+
+            new_path = make_stub_build(os.path.join(home, "builds", "moved"), "Player")
+            with mock.patch.object(gui_vr.QFileDialog, "getOpenFileName", return_value=(new_path, "")), \
+                    mock.patch.object(gui_vr.QMessageBox, "information"), \
+                    mock.patch.object(window, "show_config_dialog"):
+                # browse_for_exe closes the dialog it was opened from
+                opened_from = gui_vr.QDialog(window)
+                with Timer() as t:
+                    window.browse_for_exe(0, opened_from)
+                    process_events_until(app, lambda: window.status_service.status(new_path) is not None)
+            results["path_update_ms"] = t.ms
+        finally:
+            dismisser.stop()
+    finally:
+        window.close()
+        app.processEvents()
+    return results
+
+
+def bench_spawn(home, runs=SPAWN_RUNS):
+    """Median time of launch_vr.start() on a stub build until the child exists."""
+    import launch_vr
+    import process_vr
+
+    os.environ[storage_vr.HOME_ENV] = home
+    entry = {"name": "Stub", "exe_path": make_stub_build(os.path.join(home, "spawn"), "Player")}
+    supervisor = process_vr.ProcessSupervisor()
+    timings = []
+    for _ in range(runs):
+        with Timer() as t:
+            launch_vr.check(entry)
+            record, _watcher = launch_vr.start(supervisor, entry)
+        timings.append(t.ms)
+        record.process.wait()
+        while record.returncode is None:
+            time.sleep(0.001)
+    return statistics.median(timings)
+
+
+def run(sizes, repeat):
+    """{metric: value} for every size ("<size>/<metric>") plus spawn latency."""
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    import gui_vr
+
+    metrics = {}
+    scratch = tempfile.mkdtemp(prefix="surgical-bench-")
+    try:
+        for size in sizes:
+            runs = []
+            for attempt in range(repeat):
+                runs.append(bench_catalogue(app, gui_vr, size, os.path.join(scratch, f"{size}-{attempt}")))
+                print(f"  {size} modules, run {attempt + 1}/{repeat} done", file=sys.stderr)
+            for name in runs[0]:
+                metrics[f"{size}/{name}"] = round(statistics.median(r[name] for r in runs), 3)
+        metrics["spawn_ms"] = round(bench_spawn(os.path.join(scratch, "spawn")), 3)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+    return metrics
+
+
+# ==========================================
+# 🔹 BASELINES AND REPORTING
+# ==========================================
+def regressions(metrics, baseline, threshold=DEFAULT_THRESHOLD, noise_ms=DEFAULT_NOISE_MS):
+    """[(metric, baseline, now)] of metrics more than threshold (and noise_ms) slower than the baseline."""
+    found = []
+    for name, before in baseline.items():
+        now = metrics.get(name)
+        if now is None:
+            continue
+        if now > before * (1.0 + threshold) and now - before > noise_ms:
+            found.append((name, before, now))
+    return found
+
+
+def report(metrics, baseline=None, stream=sys.stdout):
+    baseline = baseline or {}
+    stream.write(f"{'metric':<32} {'now':>12} {'baseline':>12} {'change':>8}\n")
+    for name, value in metrics.items():
+        before = baseline.get(name)
+        change = f"{(value - before) / before:+.0%}" if before else ""
+        stream.write(f"{name:<32} {value:>12.3f} {'' if before is None else f'{before:.3f}':>12} {change:>8}\n")
+
+
+def record_history(history_path, metrics, sizes, repeat):
+    entry = {
+        "recorded_at": time.time(),
+        "station": socket.gethostname(),
+        "python": sys.version.split()[0],
+        "sizes": list(sizes),
+        "repeat": repeat,
+        "metrics": metrics,
+    }
+    try:
+        with open(history_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+    except OSError as e:
+        print(f"Could not save benchmark history: {e}", file=sys.stderr)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="bench_vr.py", description="Headless launcher benchmarks.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help=f"catalogue sizes to test (default: {','.join(map(str, DEFAULT_SIZES))})")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="runs per size; the median counts")
+    parser.add_argument("--baseline", metavar="FILE", help="fail if slower than this saved baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"allowed slowdown before failing (default: {DEFAULT_THRESHOLD:.0%}%)")
+    parser.add_argument("--noise-ms", type=float, default=DEFAULT_NOISE_MS,
+                        help=f"ignore slowdowns smaller than this (default: {DEFAULT_NOISE_MS:g} ms)")
+    parser.add_argument("--save-baseline", metavar="FILE", help="write this run's results as the new baseline")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    except ValueError:
+        print(f"Bad --sizes: {args.sizes}", file=sys.stderr)
+        return 2
+    baseline = None
+    if args.baseline:
+        try:
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)["metrics"]
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Cannot read baseline {args.baseline}: {e}", file=sys.stderr)
+            return 2
+
+    # Resolved before the runs point the data folder at their scratch copies
+    history_path = storage_vr.data_path(HISTORY_FILENAME)
+    home = os.environ.get(storage_vr.HOME_ENV)
+    try:
+        metrics = run(sizes, max(1, args.repeat))
+    finally:
+        if home is None:
+            os.environ.pop(storage_vr.HOME_ENV, None)
+        else:
+            os.environ[storage_vr.HOME_ENV] = home
+
+    report(metrics, baseline)
+    record_history(history_path, metrics, sizes, args.repeat)
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump({"recorded_at": time.time(), "station": socket.gethostname(), "metrics": metrics}, f, indent=2)
+
+    if baseline is not None:
+        slower = regressions(metrics, baseline, args.threshold, args.noise_ms)
+        for name, before, now in slower:
+            print(f"REGRESSION {name}: {before:.3f} -> {now:.3f} (+{(now - before) / before:.0%})", file=sys.stderr)
+        if slower:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,607 @@
+"""
+Local build cache: run builds from a local disk instead of the build share.
+
+Builds published on a shared folder are copied into the launcher's data
+folder and the module's exe_path is switched to the local copy. Each sync
+writes a new version folder next to the current one:
+
+* files unchanged since the last sync (same size and mtime on the share)
+  are hard-linked from the current version, so they cost nothing;
+* changed files are rebuilt chunk by chunk. If the share has a chunk
+  manifest ('<name>.chunks.json', written with write_chunk_manifest by
+  whoever publishes the build), chunks whose hash the local copy already
+  has are copied locally and only the others are read from the share.
+  Without one, a changed file is read from the share in full.
+
+Only when every file of the new version is in place is exe_path switched
+to it, so a launch always starts a complete build. Versions that are no
+longer current are deleted once nothing on this machine runs from them,
+whichever launcher (or anything else) started it. The cache has a
+disk quota; to make room, whole builds are evicted least recently
+launched first, and their modules go back to launching from the share.
+Every launcher on the machine shares the cache: a build is synced, evicted
+or cleaned up by one of them at a time. A plain local folder works as the
+"share". No Qt here.
+"""
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import process_vr
+import storage_vr
+import system_vr
+
+CACHE_DIRNAME = "build_cache"
+DB_FILENAME = "build_cache.sqlite3"
+SETTINGS_KEY = "build_cache"
+DEFAULT_SETTINGS = {
+    "enabled": False,
+    "share_roots": [],    # builds under these folders are cached locally
+    "quota_gb": 100,
+}
+CHUNK_SIZE = 4 * 1024 * 1024
+CHUNK_MANIFEST_SUFFIX = ".chunks.json"
+CHUNK_MANIFEST_VERSION = 1
+STATE_FILENAME = "state.json"
+# Beside each build's folder: held while a launcher syncs or deletes that build
+SYNC_LOCK_SUFFIX = ".sync.lock"
+# How often a sync waiting for another launcher's sync of the same build looks again
+SYNC_LOCK_POLL = 0.5
+# How often the background service checks the share for new builds
+CHECK_INTERVAL = 600.0
+
+SYNCING = "syncing"
+SYNCED = "synced"
+UNCHANGED = "unchanged"
+EVICTED = "evicted"
+FAILED = "failed"
+
+
+class SyncError(RuntimeError):
+    """A build couldn't be cached (share unreadable, quota too small, source changed mid-sync)."""
+
+
+def chunk_digest(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def chunk_digests(path):
+    """Digest of every CHUNK_SIZE chunk of a file."""
+    digests = []
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digests.append(chunk_digest(chunk))
+    return digests
+
+
+def chunk_manifest_path(exe_path):
+    return os.path.splitext(exe_path)[0] + CHUNK_MANIFEST_SUFFIX
+
+
+def build_members(exe_path):
+    """
+    {relative path (with '/'): os.stat_result} of every file that belongs to
+    the build: the exe, its *_Data folder and the player runtime beside it,
+    but not other builds that share the folder.
+    """
+    root = os.path.dirname(exe_path)
+    stem = os.path.splitext(os.path.basename(exe_path))[0]
+
+    def other_build(name):
+        base = name.split(".")[0] if not name.endswith("_Data") else name[:-len("_Data")]
+        return base != stem and os.path.isdir(os.path.join(root, f"{base}_Data"))
+
+    members = {}
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if other_build(entry.name):
+                continue
+            if entry.is_file():
+                members[entry.name] = entry.stat()
+            elif entry.is_dir():
+                for folder, _dirs, names in os.walk(entry.path):
+                    for name in names:
+                        path = os.path.join(folder, name)
+                        members[os.path.relpath(path, root).replace(os.sep, "/")] = os.stat(path)
+    return members
+
+
+def write_chunk_manifest(exe_path):
+    """Record the chunk hashes of a published build next to it, so caches fetch only changed chunks."""
+    manifest = {"version": CHUNK_MANIFEST_VERSION, "chunk_size": CHUNK_SIZE, "files": {}}
+    own_name = os.path.basename(chunk_manifest_path(exe_path))
+    root = os.path.dirname(exe_path)
+    for rel, st in sorted(build_members(exe_path).items()):
+        if rel != own_name:
+            manifest["files"][rel] = {"size": st.st_size, "chunks": chunk_digests(os.path.join(root, rel))}
+    path = chunk_manifest_path(exe_path)
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(temp_path, path)
+    return path
+
+
+def read_chunk_manifest(exe_path):
+    """The share's chunk manifest of a build, or None if it has none (or an unusable one)."""
+    try:
+        with open(chunk_manifest_path(exe_path), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != CHUNK_MANIFEST_VERSION or manifest.get("chunk_size") != CHUNK_SIZE:
+        return None
+    return manifest.get("files") or None
+
+
+def folder_size(folder):
+    """Bytes used by a folder, counting hard-linked files once."""
+    seen, total = set(), 0
+    for root, _dirs, names in os.walk(folder):
+        for name in names:
+            try:
+                st = os.stat(os.path.join(root, name))
+            except OSError:
+                continue
+            if (st.st_dev, st.st_ino) not in seen:
+                seen.add((st.st_dev, st.st_ino))
+                total += st.st_size
+    return total
+
+
+def link_or_copy(source, target):
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def _is_under(path, folder):
+    return bool(path) and os.path.normcase(os.path.abspath(path)).startswith(folder)
+
+
+def folder_in_use(folder, registry=None):
+    """
+    in_use callback for BuildCache: does anything on this machine run from
+    the folder? Both the modules every launcher has running (their shared
+    pid files) and every process whose executable lies in the folder count.
+    """
+    folder = os.path.normcase(os.path.abspath(folder)) + os.sep
+    registry = registry or process_vr.RunningRegistry()
+    return (any(_is_under(record.exe_path, folder) for record in registry.running())
+            or any(_is_under(path, folder) for path in system_vr.process_executables()))
+
+
+def supervisor_in_use(supervisor):
+    """
+    in_use callback for BuildCache sharing the supervisor's registry. Its
+    modules are in there too (the supervisor records them while holding the
+    module's launch lock), so its own lock is never needed.
+    """
+    return lambda folder: folder_in_use(folder, supervisor.registry)
+
+
+class SyncResult:
+    """Outcome of syncing one build."""
+
+    def __init__(self, name, exe_path, state, files=0, reused=0, fetched_bytes=0, local_bytes=0, seconds=0.0):
+        self.name = name
+        self.exe_path = exe_path
+        self.state = state
+        self.files = files
+        self.reused = reused
+        self.fetched_bytes = fetched_bytes
+        self.local_bytes = local_bytes
+        self.seconds = seconds
+
+    def summary(self):
+        if self.state == UNCHANGED:
+            return "up to date"
+        return (f"{self.files} files, {self.reused} unchanged • {self.fetched_bytes / 1e6:.1f} MB from the share, "
+                f"{self.local_bytes / 1e6:.1f} MB reused locally • {self.seconds:.1f}s")
+
+
+class BuildCache:
+    """
+    The cached builds and their index. in_use(folder) tells whether a
+    process runs from a folder (folder_in_use by default). Deleting a
+    build's files holds the module's launch lock in *registry*, so no
+    launcher can start it from them meanwhile. last_launched() returns {name: timestamp}
+    for the eviction order; on_evict(name, source_exe) is called after a
+    build was evicted. Setting *cancelled* makes a running sync give up.
+    """
+
+    def __init__(self, root=None, quota_bytes=None, in_use=None, last_launched=None, on_evict=None, workers=4,
+                 registry=None):
+        self.root = root or storage_vr.data_path(CACHE_DIRNAME)
+        os.makedirs(self.root, exist_ok=True)
+        self.quota_bytes = quota_bytes if quota_bytes is not None else DEFAULT_SETTINGS["quota_gb"] * 1024 ** 3
+        self.registry = registry or process_vr.RunningRegistry()
+        self.in_use = in_use or (lambda folder: folder_in_use(folder, self.registry))
+        self.last_launched = last_launched or dict
+        self.on_evict = on_evict
+        self.workers = workers
+        self.lock = threading.Lock()
+        self.syncing = set()
+        self.cancelled = threading.Event()
+        self.db = storage_vr.connect(os.path.join(self.root, DB_FILENAME))
+        self.db.execute(
+            """CREATE TABLE IF NOT EXISTS builds (
+                   name TEXT PRIMARY KEY,
+                   source_exe TEXT NOT NULL,
+                   cached_exe TEXT NOT NULL,
+                   bytes INTEGER NOT NULL,
+                   synced_at REAL NOT NULL
+               )"""
+        )
+        self.db.commit()
+
+    # ==========================================
+    # 🔹 INDEX
+    # ==========================================
+    def builds(self):
+        """{name: {"source_exe", "cached_exe", "bytes", "synced_at"}} of every cached build."""
+        with self.lock:
+            rows = self.db.execute("SELECT name, source_exe, cached_exe, bytes, synced_at FROM builds").fetchall()
+        return {name: {"source_exe": source, "cached_exe": cached, "bytes": size, "synced_at": synced}
+                for name, source, cached, size, synced in rows}
+
+    def source_of(self, name):
+        build = self.builds().get(name)
+        return build["source_exe"] if build else None
+
+    def is_cached_path(self, exe_path):
+        root = os.path.normcase(os.path.abspath(self.root))
+        return bool(exe_path) and os.path.normcase(os.path.abspath(exe_path)).startswith(root + os.sep)
+
+    def used_bytes(self):
+        with self.lock:
+            return self.db.execute("SELECT COALESCE(SUM(bytes), 0) FROM builds").fetchone()[0]
+
+    def build_dir(self, name):
+        safe = re.sub(r"[^\w.-]+", "_", name).strip("_") or "module"
+        return os.path.join(self.root, safe)
+
+    def sync_lock(self, name, wait=True):
+        """
+        Context manager held (by whichever launcher) while the build is synced
+        or its files deleted; yields False if wait=False and it is taken.
+        """
+        return process_vr.file_lock(self.build_dir(name) + SYNC_LOCK_SUFFIX, wait)
+
+    def load_state(self, name):
+        try:
+            with open(os.path.join(self.build_dir(name), STATE_FILENAME), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    # ==========================================
+    # 🔹 SYNC
+    # ==========================================
+    def up_to_date(self, name, source_exe):
+        """True if the cached copy matches the share by size and mtime (no file is read)."""
+        state = self.load_state(name)
+        if state is None or state.get("source") != source_exe:
+            return False
+        try:
+            members = build_members(source_exe)
+        except OSError:
+            return True  # share unreachable: keep using the cached copy
+        files = state["files"]
+        return members.keys() == files.keys() and all(
+            files[rel]["size"] == st.st_size and files[rel]["mtime_ns"] == st.st_mtime_ns
+            for rel, st in members.items()
+        )
+
+    def sync(self, name, source_exe):
+        """
+        Bring the cached copy of a build up to date with the share. Returns a
+        SyncResult whose exe_path is the (new) local exe. Raises SyncError.
+        """
+        with self.lock:
+            if name in self.syncing:
+                raise SyncError(f"'{name}' is already being synced")
+            self.syncing.add(name)
+        try:
+            # Another launcher may sync the same build: take turns, and start
+            # from the state it leaves behind
+            while True:
+                with self.sync_lock(name, wait=False) as held:
+                    if held:
+                        return self._sync(name, source_exe)
+                if self.cancelled.wait(SYNC_LOCK_POLL):
+                    raise SyncError(f"Sync of '{name}' was cancelled")
+        finally:
+            with self.lock:
+                self.syncing.discard(name)
+
+    def _sync(self, name, source_exe):
+        started = time.monotonic()
+        state = self.load_state(name)
+        if state is not None and state.get("source") != source_exe:
+            state = None  # the module now points at a different build: start over
+        current_dir = os.path.join(self.build_dir(name), f"v{state['version']}") if state else None
+        if state is not None and self.up_to_date(name, source_exe):
+            return SyncResult(name, os.path.join(current_dir, os.path.basename(source_exe)), UNCHANGED)
+
+        try:
+            members = build_members(source_exe)
+        except OSError as e:
+            raise SyncError(f"Cannot read the build on the share: {e}")
+        if os.path.basename(source_exe) not in members:
+            raise SyncError(f"'{source_exe}' not found on the share")
+        remote = read_chunk_manifest(source_exe) or {}
+        old_files = state["files"] if state else {}
+
+        # Room for the whole new version (unchanged files are links, but be safe)
+        needed = sum(st.st_size for st in members.values())
+        self.make_room(needed, keep=name)
+
+        version = (state["version"] + 1) if state else 1
+        new_dir = os.path.join(self.build_dir(name), f"v{version}")
+        shutil.rmtree(new_dir, ignore_errors=True)
+        source_root = os.path.dirname(source_exe)
+        result = SyncResult(name, os.path.join(new_dir, os.path.basename(source_exe)), SYNCED, files=len(members))
+
+        def copy_file(item):
+            rel, st = item
+            if self.cancelled.is_set():
+                raise SyncError(f"Sync of '{name}' was cancelled")
+            target = os.path.join(new_dir, rel)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            old = old_files.get(rel)
+            if old is not None and old["size"] == st.st_size and old["mtime_ns"] == st.st_mtime_ns:
+                link_or_copy(os.path.join(current_dir, rel), target)
+                return rel, {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "chunks": old["chunks"]}, 0, 0, True
+            wanted = remote.get(rel)
+            if wanted is not None and wanted["size"] != st.st_size:
+                wanted = None  # manifest is older than the file
+            chunks, fetched, reused = self.assemble(
+                os.path.join(source_root, rel), target,
+                os.path.join(current_dir, rel) if old is not None else None,
+                old["chunks"] if old is not None else [],
+                wanted["chunks"] if wanted is not None else None,
+            )
+            shutil.copymode(os.path.join(source_root, rel), target)  # keep the exe executable
+            return rel, {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "chunks": chunks}, fetched, reused, False
+
+        files = {}
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="build-cache") as pool:
+                for rel, info, fetched, reused_bytes, unchanged in pool.map(copy_file, members.items()):
+                    files[rel] = info
+                    result.fetched_bytes += fetched
+                    result.local_bytes += reused_bytes + (info["size"] if unchanged else 0)
+                    result.reused += unchanged
+        except (OSError, SyncError) as e:
+            shutil.rmtree(new_dir, ignore_errors=True)
+            raise e if isinstance(e, SyncError) else SyncError(f"Sync of '{name}' failed: {e}")
+        if self.cancelled.is_set():
+            shutil.rmtree(new_dir, ignore_errors=True)
+            raise SyncError(f"Sync of '{name}' was cancelled")
+
+        # The new version is complete: make it current
+        state_path = os.path.join(self.build_dir(name), STATE_FILENAME)
+        with open(state_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"version": version, "source": source_exe, "files": files}, f)
+        os.replace(state_path + ".tmp", state_path)
+        with self.lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO builds VALUES (?, ?, ?, ?, ?)",
+                (name, source_exe, result.exe_path, folder_size(new_dir), time.time()),
+            )
+        result.seconds = time.monotonic() - started
+        return result
+
+    def assemble(self, source, target, local, local_chunks, wanted_chunks):
+        """
+        Write target chunk by chunk. With the wanted chunk hashes known, chunks
+        the local copy already has are read from it and the rest from source.
+        Returns (chunk hashes, bytes read from source, bytes reused locally).
+        """
+        chunks, fetched, reused = [], 0, 0
+        have = {digest: index for index, digest in enumerate(local_chunks)}
+        with open(source, "rb") as src, open(target, "wb") as out:
+            local_file = open(local, "rb") if local is not None and wanted_chunks is not None else None
+            try:
+                if wanted_chunks is None:
+                    for data in iter(lambda: src.read(CHUNK_SIZE), b""):
+                        if self.cancelled.is_set():
+                            raise SyncError("Sync cancelled")
+                        chunks.append(chunk_digest(data))
+                        out.write(data)
+                        fetched += len(data)
+                    return chunks, fetched, reused
+                for index, digest in enumerate(wanted_chunks):
+                    if self.cancelled.is_set():
+                        raise SyncError("Sync cancelled")
+                    data = None
+                    if local_file is not None and digest in have:
+                        local_file.seek(have[digest] * CHUNK_SIZE)
+                        data = local_file.read(CHUNK_SIZE)
+                        if chunk_digest(data) == digest:
+                            reused += len(data)
+                        else:
+                            data = None  # local copy damaged: fetch it
+                    if data is None:
+                        src.seek(index * CHUNK_SIZE)
+                        data = src.read(CHUNK_SIZE)
+                        fetched += len(data)
+                        if chunk_digest(data) != digest:
+                            raise SyncError(f"{os.path.basename(source)} changed on the share during the sync; retry")
+                    chunks.append(digest)
+                    out.write(data)
+            finally:
+                if local_file is not None:
+                    local_file.close()
+        return chunks, fetched, reused
+
+    # ==========================================
+    # 🔹 EVICTION
+    # ==========================================
+    def make_room(self, needed, keep=None):
+        """Evict least recently launched builds until *needed* more bytes fit the quota. Raises SyncError."""
+        if needed > self.quota_bytes:
+            raise SyncError(f"Build needs {needed / 1024 ** 3:.1f} GB, more than the "
+                            f"{self.quota_bytes / 1024 ** 3:.1f} GB cache quota")
+        builds = self.builds()
+        launched = self.last_launched()
+        # The build being synced replaces its own current version
+        used = sum(build["bytes"] for name, build in builds.items() if name != keep)
+        order = sorted((name for name in builds if name != keep),
+                       key=lambda name: launched.get(name) or builds[name]["synced_at"])
+        for name in order:
+            if used + needed <= self.quota_bytes:
+                return
+            if self.evict(name):
+                used -= builds[name]["bytes"]
+        if used + needed > self.quota_bytes:
+            raise SyncError("Not enough cache space: the other cached builds are running")
+
+    def evict(self, name):
+        """Remove a cached build (unless it is running or being synced). Returns True if it was removed."""
+        folder = self.build_dir(name)
+        source = self.source_of(name)
+        with self.sync_lock(name, wait=False) as held, self.registry.lock(name):
+            if not held or self.in_use(folder):
+                return False
+            with self.lock, self.db:
+                self.db.execute("DELETE FROM builds WHERE name = ?", (name,))
+            shutil.rmtree(folder, ignore_errors=True)
+        if source is not None and self.on_evict is not None:
+            self.on_evict(name, source)
+        return True
+
+    def collect(self, name):
+        """
+        Delete the build's old versions that nothing runs from any more (left
+        for later while some launcher syncs it: its new version isn't current yet).
+        """
+        with self.sync_lock(name, wait=False) as held:
+            if not held:
+                return
+            state = self.load_state(name)
+            folder = self.build_dir(name)
+            try:
+                versions = [entry.path for entry in os.scandir(folder) if entry.is_dir()]
+            except OSError:
+                return
+            current = os.path.join(folder, f"v{state['version']}") if state else None
+            with self.registry.lock(name):
+                for path in versions:
+                    if path != current and not self.in_use(path):
+                        shutil.rmtree(path, ignore_errors=True)
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+
+class BuildCacheService:
+    """
+    Keeps the catalogue's builds on the share cached, on a background thread.
+    on_event(name, state, detail) is called from that thread after each sync
+    or eviction; the catalogue's exe_path has already been switched by then
+    (to the local copy, or back to the share). With background=False
+    nothing syncs until sync() or sync_all() is called.
+    """
+
+    def __init__(self, catalog, in_use=None, last_launched=None, on_event=None, background=True):
+        self.catalog = catalog
+        self.on_event = on_event
+        self.settings = dict(DEFAULT_SETTINGS, **(catalog.get_setting(SETTINGS_KEY) or {}))
+        self.cache = BuildCache(quota_bytes=int(self.settings["quota_gb"] * 1024 ** 3),
+                                in_use=in_use, last_launched=last_launched, on_evict=self._evicted)
+        self.wake = threading.Event()
+        self.stopping = threading.Event()
+        self.thread = None
+        if background:
+            self.thread = threading.Thread(target=self._run, name="build-cache-sync", daemon=True)
+            self.thread.start()
+
+    def configure(self, **changes):
+        self.settings.update(changes)
+        self.cache.quota_bytes = int(self.settings["quota_gb"] * 1024 ** 3)
+        self.catalog.set_setting(SETTINGS_KEY, self.settings)
+        self.wake.set()
+
+    def on_share(self, exe_path):
+        roots = [os.path.normcase(os.path.abspath(root)) for root in self.settings["share_roots"]]
+        path = os.path.normcase(os.path.abspath(exe_path or ""))
+        return any(path.startswith(root.rstrip(os.sep) + os.sep) for root in roots)
+
+    def source_of(self, entry):
+        """The share path of a module's build, or None if it isn't cached from a share."""
+        if self.cache.is_cached_path(entry["exe_path"]):
+            return self.cache.source_of(entry["name"])
+        return entry["exe_path"] if self.on_share(entry["exe_path"]) else None
+
+    def sync_all(self):
+        """Sync every module built on a share; give back the ones no longer wanted."""
+        enabled = self.settings["enabled"]
+        for entry in self.catalog.all():
+            if self.stopping.is_set():
+                return
+            source = self.source_of(entry)
+            if source is None:
+                continue
+            if not enabled or not self.on_share(source):
+                if self.cache.is_cached_path(entry["exe_path"]):
+                    self.cache.evict(entry["name"])
+                continue
+            self.sync(entry["name"], source)
+
+    def sync(self, name, source):
+        if not self.cache.up_to_date(name, source):
+            self._notify(name, SYNCING, source)
+        try:
+            result = self.cache.sync(name, source)
+        except SyncError as e:
+            if not self.stopping.is_set():
+                self._notify(name, FAILED, str(e))
+            return None
+        # Switch the module over only now that its copy is complete (and
+        # unless it was pointed at another build meanwhile)
+        entry = self.catalog.get(name)
+        if entry is not None and (entry["exe_path"] == source or self.cache.is_cached_path(entry["exe_path"])):
+            if entry["exe_path"] != result.exe_path or result.state == SYNCED:
+                self.catalog.set_exe_path(name, result.exe_path)
+                self._notify(name, SYNCED, result.summary())
+        # Old versions go only once launches no longer start from them
+        self.cache.collect(name)
+        return result
+
+    def _evicted(self, name, source):
+        # The module launches from the share again
+        entry = self.catalog.get(name)
+        if entry is not None and self.cache.is_cached_path(entry["exe_path"]):
+            self.catalog.set_exe_path(name, source)
+        self._notify(name, EVICTED, source)
+
+    def _run(self):
+        while not self.stopping.is_set():
+            try:
+                self.sync_all()
+            except Exception as e:  # keep syncing other builds later
+                print(f"Build cache error: {e}")
+            self.wake.wait(CHECK_INTERVAL)
+            self.wake.clear()
+
+    def _notify(self, name, state, detail):
+        if self.on_event is not None:
+            self.on_event(name, state, detail)
+
+    def stop(self):
+        """Cancel a running sync (its partial copy is deleted) and wait for it before closing the index."""
+        self.stopping.set()
+        self.cache.cancelled.set()
+        self.wake.set()
+        if self.thread is not None:
+            self.thread.join()
+        self.cache.close()
@@ -0,0 +1,248 @@
+"""
+Persistent simulation catalogue.
+
+Modules and their exe paths live in a SQLite database in the launcher's
+data folder, so paths chosen with Browse survive a restart. Every write
+is a transaction (atomic), the schema is versioned through
+PRAGMA user_version, and callers page through entries instead of
+loading the whole catalogue up front.
+"""
+import json
+import os
+import threading
+
+import storage_vr
+
+DB_FILENAME = "catalog.sqlite3"
+SCHEMA_VERSION = 2
+PAGE_SIZE = 100
+
+# ==========================================
+# 🔹 INITIAL SIMULATION DATA
+# Seeds a new catalogue on first start. After that, use the GUI
+# ("Configure Simulation Paths") to change paths; they are saved.
+# ==========================================
+INITIAL_SIMULATIONS = [
+    {
+        "name": "Heart",
+        "icon": "❤️",
+        "description": "Cardiac Surgery VR",
+        "exe_path": r"C:\Users\HP\Downloads\task4\HEART\UnityCrashHandler64.exe",
+        "color": "#D64545"  # Red
+    },
+    {
+        "name": "Liver",
+        "icon": "🟤",
+        "description": "Hepatic Procedures VR",
+        "exe_path": r"C:\Users\HP\Downloads\task4\liverSqueeze\My project (5).exe",
+        "color": "#E85D75"  # Pink/Red
+    },
+    {
+        "name": "Tooth",
+        "icon": "🦷",
+        "description": "Dental Training VR",
+        "exe_path": r"C:\Users\HP\Downloads\task4\teeth\My project (4).exe",
+        "color": "#4A90E2"  # Blue
+    },
+    {
+        "name": "Flow",
+        "icon": "💧",
+        "description": "Vascular Flow VR",
+        "exe_path": r"C:\Users\HP\Downloads\task4\New folder\My project (16).exe",
+        "color": "#00BCD4"  # Cyan
+    },
+    {
+        "name": "Nose",
+        "icon": "👃",
+        "description": "ENT Surgery VR",
+        "exe_path": r"C:\Users\HP\Downloads\task4\New folder\My project (16).exe",
+        "color": "#F5A623"  # Orange
+    },
+    {
+        "name": "Abdomen",
+        "icon": "🩺",
+        "description": "Abdominal Trauma VR",
+        "exe_path": r"C:\Users\HP\Downloads\task4\New folder\My project (16).exe",
+        "color": "#7B68EE"  # Purple
+    }
+]
+
+COLUMNS = ("name", "icon", "description", "exe_path", "color", "favorite", "tags")
+
+# Each entry upgrades the schema from version (key - 1) to key
+MIGRATIONS = {
+    1: """
+        CREATE TABLE simulations (
+            id INTEGER PRIMARY KEY,
+            position INTEGER NOT NULL,
+            name TEXT NOT NULL UNIQUE,
+            icon TEXT NOT NULL DEFAULT '',
+            description TEXT NOT NULL DEFAULT '',
+            exe_path TEXT NOT NULL DEFAULT '',
+            color TEXT NOT NULL DEFAULT '#4A90E2',
+            favorite INTEGER NOT NULL DEFAULT 0,
+            tags TEXT NOT NULL DEFAULT '[]'
+        );
+        CREATE INDEX simulations_position ON simulations(position);
+    """,
+    2: """
+        CREATE TABLE settings (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+    """,
+}
+
+
+class CatalogError(RuntimeError):
+    """The catalogue database is newer than this launcher or otherwise unusable."""
+
+
+def row_to_entry(row):
+    entry = dict(zip(COLUMNS, row))
+    entry["favorite"] = bool(entry["favorite"])
+    entry["tags"] = json.loads(entry["tags"] or "[]")
+    return entry
+
+
+def entry_values(entry):
+    return (
+        entry["name"],
+        entry.get("icon", ""),
+        entry.get("description", ""),
+        entry.get("exe_path", ""),
+        entry.get("color", "#4A90E2"),
+        int(bool(entry.get("favorite", False))),
+        json.dumps(list(entry.get("tags", []))),
+    )
+
+
+def reroot_path(path, old_root, new_root):
+    """Move *path* from old_root to new_root, or return None if it isn't under old_root."""
+    old = os.path.normcase(os.path.normpath(old_root)).rstrip("\\/")
+    candidate = os.path.normcase(os.path.normpath(path))
+    if candidate != old and not candidate.startswith(old + os.sep):
+        return None
+    relative = os.path.normpath(path)[len(old):].lstrip("\\/")
+    return os.path.join(new_root, relative) if relative else new_root
+
+
+class Catalog:
+    """The simulation modules, stored in SQLite and read page by page."""
+
+    def __init__(self, path=None, seed=INITIAL_SIMULATIONS):
+        self.path = path or storage_vr.data_path(DB_FILENAME)
+        self.lock = threading.Lock()
+        self.db = storage_vr.connect(self.path)
+        self.migrate()
+        if seed and self.count() == 0:
+            self.add_many(seed)
+
+    def migrate(self):
+        version = self.db.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            raise CatalogError(
+                f"Catalogue schema v{version} is newer than this launcher (v{SCHEMA_VERSION}): {self.path}"
+            )
+        for target in range(version + 1, SCHEMA_VERSION + 1):
+            with self.lock:
+                self.db.executescript(f"BEGIN; {MIGRATIONS[target]} PRAGMA user_version = {target}; COMMIT;")
+
+    def count(self):
+        with self.lock:
+            return self.db.execute("SELECT COUNT(*) FROM simulations").fetchone()[0]
+
+    def page(self, offset, limit=PAGE_SIZE):
+        """Entries in display order, starting at offset."""
+        with self.lock:
+            rows = self.db.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM simulations ORDER BY position LIMIT ? OFFSET ?",
+                (limit, offset),
+            ).fetchall()
+        return [row_to_entry(row) for row in rows]
+
+    def all(self):
+        return self.page(0, -1)
+
+    def get(self, name):
+        with self.lock:
+            row = self.db.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM simulations WHERE name = ?", (name,)
+            ).fetchone()
+        return row_to_entry(row) if row else None
+
+    def favorites(self):
+        with self.lock:
+            rows = self.db.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM simulations WHERE favorite ORDER BY position"
+            ).fetchall()
+        return [row_to_entry(row) for row in rows]
+
+    def add_many(self, entries):
+        """Append entries (or replace the ones whose name already exists) in one transaction."""
+        with self.lock, self.db:
+            position = self.db.execute("SELECT COALESCE(MAX(position), -1) FROM simulations").fetchone()[0]
+            for entry in entries:
+                position += 1
+                self.db.execute(
+                    f"""INSERT INTO simulations (position, {', '.join(COLUMNS)})
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(name) DO UPDATE SET
+                            icon = excluded.icon, description = excluded.description,
+                            exe_path = excluded.exe_path, color = excluded.color,
+                            favorite = excluded.favorite, tags = excluded.tags""",
+                    (position, *entry_values(entry)),
+                )
+
+    def update(self, entry):
+        """Save an edited entry (matched by name)."""
+        with self.lock, self.db:
+            self.db.execute(
+                """UPDATE simulations SET icon = ?, description = ?, exe_path = ?, color = ?,
+                                          favorite = ?, tags = ?
+                   WHERE name = ?""",
+                (*entry_values(entry)[1:], entry["name"]),
+            )
+
+    def set_exe_path(self, name, exe_path):
+        with self.lock, self.db:
+            self.db.execute("UPDATE simulations SET exe_path = ? WHERE name = ?", (exe_path, name))
+
+    def remove(self, name):
+        with self.lock, self.db:
+            self.db.execute("DELETE FROM simulations WHERE name = ?", (name,))
+
+    def reroot(self, old_root, new_root):
+        """
+        Point every exe_path under old_root at the same place under new_root,
+        in a single transaction. Returns {name: new_path} for the moved entries.
+        """
+        moved = {}
+        with self.lock, self.db:
+            for name, exe_path in self.db.execute("SELECT name, exe_path FROM simulations").fetchall():
+                new_path = reroot_path(exe_path, old_root, new_root) if exe_path else None
+                if new_path is not None and new_path != exe_path:
+                    moved[name] = new_path
+            self.db.executemany(
+                "UPDATE simulations SET exe_path = ? WHERE name = ?",
+                [(path, name) for name, path in moved.items()],
+            )
+        return moved
+
+    def get_setting(self, key, default=None):
+        """A launcher setting stored alongside the catalogue (JSON-decoded)."""
+        with self.lock:
+            row = self.db.execute("SELECT value FROM settings WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def set_setting(self, key, value):
+        with self.lock, self.db:
+            self.db.execute(
+                "INSERT INTO settings (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, json.dumps(value)),
+            )
+
+    def close(self):
+        with self.lock:
+            self.db.close()
@@ -0,0 +1,422 @@
+"""
+Headless command line for the Surgical Simulation Suite.
+
+Lists, checks and launches simulation modules from the same catalogue as
+the GUI, without importing PyQt5, so kiosk and lab-setup scripts pay only
+for the launch itself:
+
+    python cli_vr.py list
+    python cli_vr.py status Heart Liver
+    python cli_vr.py launch Heart Liver          # start both, return at once
+    python cli_vr.py --json launch --favorites --wait
+    python cli_vr.py launch Heart --priority high --affinity 2-7
+    python cli_vr.py launch Heart --profile low  # Unity resolution/quality preset
+    python cli_vr.py profiles                    # each module's launch profile here
+    python cli_vr.py usage --by day --since 2026-01-01
+    python cli_vr.py export-sessions sessions.csv
+    python cli_vr.py cache sync                  # copy builds on the share to the local cache
+
+Output is one line per module: tab-separated fields, or a JSON object
+per line with --json. The exit code is 0 only if every requested module
+was found and, for launch, started (and with --wait, exited cleanly).
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import buildcache_vr
+import catalog_vr
+import integrity_vr
+import launch_vr
+import metrics_vr
+import process_vr
+import profiles_vr
+import telemetry_vr
+
+READY = "ready"
+UNKNOWN = "unknown"
+LAUNCHED = "launched"
+ALREADY_RUNNING = "already_running"
+FAILED = "failed"
+
+
+class Output:
+    """Writes one result per line as JSON or tab-separated text."""
+
+    def __init__(self, as_json, stream=sys.stdout):
+        self.as_json = as_json
+        self.stream = stream
+
+    def write(self, row, fields):
+        if self.as_json:
+            line = json.dumps({key: row.get(key) for key in fields}, ensure_ascii=False)
+        else:
+            line = "\t".join("" if row.get(key) is None else str(row.get(key)) for key in fields)
+        self.stream.write(line + "\n")
+        self.stream.flush()
+
+
+def select(catalog, names, favorites=False):
+    """(entries, unknown names) for the requested modules; names match case-insensitively."""
+    entries = catalog.favorites() if favorites else []
+    if not names and not favorites:
+        return catalog.all(), []
+    by_name = {entry["name"].lower(): entry for entry in catalog.all()} if names else {}
+    unknown = []
+    for name in names:
+        entry = by_name.get(name.lower())
+        if entry is None:
+            unknown.append(name)
+        elif entry not in entries:
+            entries.append(entry)
+    return entries, unknown
+
+
+def build_state(entry, verifier=None):
+    """(state, detail) of an entry's build; full manifest check when a verifier is given."""
+    try:
+        launch_vr.check(entry)
+    except launch_vr.LaunchError as e:
+        return e.reason, str(e)
+    if verifier is not None:
+        result = verifier.verify(entry["exe_path"])
+        if result.state == integrity_vr.CORRUPT:
+            return launch_vr.INCOMPLETE, result.summary()
+    return READY, None
+
+
+# ==========================================
+# 🔹 COMMANDS
+# ==========================================
+def cmd_list(args, catalog, out):
+    fields = ("name", "exists", "favorite", "exe_path")
+    for entry in catalog.all():
+        row = dict(entry, exists=bool(entry["exe_path"]) and os.path.isfile(entry["exe_path"]))
+        out.write(row, fields)
+    return 0
+
+
+def cmd_status(args, catalog, out):
+    fields = ("name", "state", "exe_path", "detail")
+    entries, unknown = select(catalog, args.names)
+    verifier = integrity_vr.BuildVerifier() if args.verify else None
+    ok = not unknown
+    for name in unknown:
+        out.write({"name": name, "state": UNKNOWN}, fields)
+    try:
+        for entry in entries:
+            state, detail = build_state(entry, verifier)
+            ok = ok and state == READY
+            out.write(dict(entry, state=state, detail=detail), fields)
+    finally:
+        if verifier is not None:
+            verifier.cache.close()
+    return 0 if ok else 1
+
+
+def cmd_launch(args, catalog, out):
+    fields = ("name", "state", "pid", "returncode", "runtime", "profile", "exe_path", "detail")
+    entries, unknown = select(catalog, args.names, args.favorites)
+    if not entries and not unknown:
+        print("Nothing to launch.", file=sys.stderr)
+        return 1
+    ok = not unknown
+    for name in unknown:
+        out.write({"name": name, "state": UNKNOWN}, fields)
+
+    try:
+        overrides = process_vr.ProcessOptions(
+            process_vr.parse_cpus(args.affinity) if args.affinity else None, args.priority, args.nice
+        )
+    except ValueError as e:
+        print(f"Bad process option: {e}", file=sys.stderr)
+        return 1
+    supervisor = process_vr.ProcessSupervisor(options=launch_vr.options_lookup(catalog, overrides))
+    metrics = metrics_vr.MetricsStore()
+    sessions = telemetry_vr.SessionLog()
+    profiles = profiles_vr.ProfileManager(catalog)
+    profiles.watch(sessions)
+    # On a machine's first launch, worth a moment to start with its own tier
+    profiles.hardware(timeout=profiles_vr.PROBE_WAIT)
+    # Without --wait the children must outlive this process
+    popen_kwargs = {} if args.wait else launch_vr.detached_popen_kwargs()
+    launched, watchers = [], []
+    try:
+        for position, entry in enumerate(entries):
+            if position and args.stagger:
+                time.sleep(args.stagger)
+            trace = metrics_vr.LaunchTrace(entry["name"])
+            row = dict(entry)
+            try:
+                launch_vr.check(entry)
+                # Sessions can only be followed to their end while we wait for them
+                record, watcher = launch_vr.start(
+                    supervisor, entry, trace, metrics, watch=args.wait,
+                    sessions=sessions if args.wait else None, profiles=profiles, profile=args.profile,
+                    **popen_kwargs
+                )
+            except launch_vr.LaunchError as e:
+                row.update(state=e.reason, detail=str(e))
+                sessions.failed(entry["name"])
+            except process_vr.AlreadyRunningError as e:
+                row.update(state=ALREADY_RUNNING, pid=e.record.pid, detail=str(e))
+            except OSError as e:
+                row.update(state=FAILED, detail=str(e))
+                sessions.failed(entry["name"])
+            else:
+                row.update(state=LAUNCHED, pid=record.pid, profile=record.profile,
+                           detail="; ".join(record.option_problems) or None)
+                launched.append(record)
+                if watcher is not None:
+                    watchers.append(watcher)
+            ok = ok and row["state"] == LAUNCHED
+            out.write(row, fields)
+
+        if args.wait:
+            for record in launched:
+                record.process.wait()
+            # The reaper threads fill in returncode right after wait() returns
+            for record in launched:
+                while record.returncode is None:
+                    time.sleep(0.01)
+                ok = ok and record.state == process_vr.EXITED
+                out.write(dict(record.as_dict(), state=record.state), fields)
+            for watcher in watchers:
+                watcher.join()
+            # Let the session log write the sessions that just ended
+            sessions.wait()
+    finally:
+        metrics.close()
+        sessions.close()
+    return 0 if ok else 1
+
+
+def cmd_manifest(args, catalog, out):
+    fields = ("name", "state", "exe_path", "detail")
+    entries, unknown = select(catalog, args.names)
+    ok = not unknown
+    for name in unknown:
+        out.write({"name": name, "state": UNKNOWN}, fields)
+    verifier = integrity_vr.BuildVerifier()
+    try:
+        for entry in entries:
+            state, detail = build_state(entry)
+            if state == READY:
+                detail = verifier.write_manifest(entry["exe_path"])
+                if args.chunks:
+                    detail += "; " + buildcache_vr.write_chunk_manifest(entry["exe_path"])
+                state = "written"
+            else:
+                ok = False
+            out.write(dict(entry, state=state, detail=detail), fields)
+    finally:
+        verifier.cache.close()
+    return 0 if ok else 1
+
+
+def cmd_cache(args, catalog, out):
+    fields = ("name", "state", "exe_path", "detail")
+    entries, unknown = select(catalog, args.names)
+    ok = not unknown
+    for name in unknown:
+        out.write({"name": name, "state": UNKNOWN}, fields)
+    metrics = metrics_vr.MetricsStore()
+    errors = {}
+
+    def on_event(name, state, detail):
+        if state == buildcache_vr.FAILED:
+            errors[name] = detail
+
+    # Other launchers' modules and anything else running from a build count as in use
+    service = buildcache_vr.BuildCacheService(
+        catalog, in_use=buildcache_vr.folder_in_use, last_launched=lambda: {name: last for name, (_count, last) in metrics.usage().items()},
+        on_event=on_event, background=False,
+    )
+    try:
+        builds = service.cache.builds()
+        for entry in entries:
+            source = service.source_of(entry)
+            row = dict(entry, state="not_cached")
+            if args.action == "status":
+                if entry["name"] in builds:
+                    build = builds[entry["name"]]
+                    row.update(state="cached", detail=f"{build['bytes']} bytes from {build['source_exe']}")
+                elif source is not None:
+                    row.update(state="on_share")
+            elif args.action == "evict":
+                if entry["name"] in builds:
+                    if service.cache.evict(entry["name"]):
+                        row.update(state=buildcache_vr.EVICTED, exe_path=catalog.get(entry["name"])["exe_path"])
+                    else:
+                        ok = False
+                        row.update(state="in_use")
+            elif source is not None and service.settings["enabled"] and service.on_share(source):
+                result = service.sync(entry["name"], source)
+                if result is None:
+                    ok = False
+                    row.update(state=buildcache_vr.FAILED, detail=errors.get(entry["name"]))
+                else:
+                    row.update(state=result.state, exe_path=result.exe_path, detail=result.summary())
+            out.write(row, fields)
+    finally:
+        metrics.close()
+        service.stop()
+    return 0 if ok else 1
+
+
+def cmd_profiles(args, catalog, out):
+    profiles = profiles_vr.ProfileManager(catalog)
+    if args.probe:
+        profiles.probe()
+    probe = profiles.hardware(timeout=profiles_vr.PROBE_WAIT)
+    if probe is not None:
+        print(f"{probe['station']}: {probe['cores']} CPUs, {probe['memory_gb']} GB RAM, "
+              f"CPU score {probe['cpu_score']} -> {profiles_vr.tier_for(probe)}", file=sys.stderr)
+    entries, unknown = select(catalog, args.names)
+    for name in unknown:
+        out.write({"name": name, "source": UNKNOWN}, ("name", "source"))
+    for entry in entries:
+        name, source = profiles.choice(entry["name"])
+        profile = profiles.profile(name)
+        out.write({"name": entry["name"], "profile": name, "source": source, "args": " ".join(profile.args())},
+                  ("name", "profile", "source", "args"))
+    return 0 if not unknown else 1
+
+
+def cmd_usage(args, catalog, out):
+    sessions = telemetry_vr.SessionLog()
+    try:
+        rows = sessions.rollup(args.by, args.since, args.until, args.station)
+    finally:
+        sessions.close()
+    groups = [column for column in telemetry_vr.GROUPS if column in args.by] or ["module"]
+    for row in rows:
+        out.write(row, (*groups, *telemetry_vr.ROLLUP_FIELDS))
+    return 0
+
+
+def cmd_export_sessions(args, catalog, out):
+    sessions = telemetry_vr.SessionLog()
+    try:
+        count = sessions.export(args.path, args.format, args.rollup, args.since, args.until)
+    except OSError as e:
+        print(f"Cannot write {args.path}: {e}", file=sys.stderr)
+        return 1
+    finally:
+        sessions.close()
+    out.write({"path": args.path, "rows": count}, ("path", "rows"))
+    return 0
+
+
+def cmd_import_sessions(args, catalog, out):
+    sessions = telemetry_vr.SessionLog()
+    ok = True
+    try:
+        for path in args.paths:
+            try:
+                row = {"path": path, "added": sessions.import_from(path)}
+            except Exception as e:  # not a session log, or unreadable
+                ok = False
+                row = {"path": path, "detail": str(e)}
+            out.write(row, ("path", "added", "detail"))
+    finally:
+        sessions.close()
+    return 0 if ok else 1
+
+
+def add_date_range(parser):
+    parser.add_argument("--since", metavar="YYYY-MM-DD", type=date_argument, help="first day to include")
+    parser.add_argument("--until", metavar="YYYY-MM-DD", type=date_argument, help="last day to include")
+
+
+def date_argument(text):
+    try:
+        telemetry_vr.day_start(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM-DD, got '{text}'")
+    return text
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="cli_vr.py", description="Headless launcher for the Surgical Simulation Suite."
+    )
+    parser.add_argument("--json", action="store_true", help="print one JSON object per line")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="list every module in the catalogue").set_defaults(run=cmd_list)
+
+    status = commands.add_parser("status", help="check whether modules are ready to launch")
+    status.add_argument("names", nargs="*", help="modules to check (default: all)")
+    status.add_argument("--verify", action="store_true", help="also hash builds against their manifest")
+    status.set_defaults(run=cmd_status)
+
+    launch = commands.add_parser("launch", help="start one or more modules")
+    launch.add_argument("names", nargs="*", help="modules to launch")
+    launch.add_argument("--favorites", action="store_true", help="also launch every favourite module")
+    launch.add_argument("--stagger", type=float, default=0.0, metavar="SECONDS",
+                        help="pause between starts (default: start all at once)")
+    launch.add_argument("--wait", action="store_true", help="wait for the modules to exit and report how")
+    launch.add_argument("--priority", choices=process_vr.PRIORITIES,
+                        help="scheduling priority (default: the module's saved option, else inherited)")
+    launch.add_argument("--affinity", metavar="CPUS", help="CPUs to run on, e.g. 2-7 or 0,2,4")
+    launch.add_argument("--nice", type=int, metavar="N", help="POSIX nice value (-20..19), overrides --priority")
+    launch.add_argument("--profile", choices=(profiles_vr.DEFAULT, *profiles_vr.TIERS),
+                        help="launch profile (default: the module's profile on this machine)")
+    launch.set_defaults(run=cmd_launch)
+
+    profiles = commands.add_parser("profiles", help="the launch profile each module gets on this machine")
+    profiles.add_argument("names", nargs="*", help="modules (default: all)")
+    profiles.add_argument("--probe", action="store_true", help="probe the hardware again first")
+    profiles.set_defaults(run=cmd_profiles)
+
+    usage = commands.add_parser("usage", help="sessions, hours and failure rate per module (from the session log)")
+    usage.add_argument("--by", action="append", choices=telemetry_vr.GROUPS, default=[],
+                       help="group by day, station and/or module (repeatable; default: module)")
+    usage.add_argument("--station", help="only this station's sessions")
+    add_date_range(usage)
+    usage.set_defaults(run=cmd_usage)
+
+    export = commands.add_parser("export-sessions", help="write the session log (or a rollup) to a file")
+    export.add_argument("path", help="output file")
+    export.add_argument("--format", choices=["csv", "jsonl"], default="csv", help="file format (default: csv)")
+    export.add_argument("--rollup", action="append", choices=telemetry_vr.GROUPS, default=[],
+                        help="export usage grouped by these columns instead of single sessions")
+    add_date_range(export)
+    export.set_defaults(run=cmd_export_sessions)
+
+    merge = commands.add_parser("import-sessions", help="merge session logs copied from other stations")
+    merge.add_argument("paths", nargs="+", metavar="FILE", help=f"{telemetry_vr.DB_FILENAME} of another station")
+    merge.set_defaults(run=cmd_import_sessions)
+
+    manifest = commands.add_parser("manifest", help="record known-good builds as their integrity manifest")
+    manifest.add_argument("names", nargs="+", help="modules whose current build is known good")
+    manifest.add_argument("--chunks", action="store_true",
+                          help="also write the chunk manifest that lets build caches copy only changed chunks")
+    manifest.set_defaults(run=cmd_manifest)
+
+    cache = commands.add_parser("cache", help="local copies of builds on the share")
+    cache.add_argument("action", choices=["status", "sync", "evict"],
+                       help="show cached builds, bring them up to date, or remove them")
+    cache.add_argument("names", nargs="*", help="modules (default: all)")
+    cache.set_defaults(run=cmd_cache)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        catalog = catalog_vr.Catalog()
+    except catalog_vr.CatalogError as e:
+        print(e, file=sys.stderr)
+        return 2
+    try:
+        return args.run(args, catalog, Output(args.json))
+    finally:
+        catalog.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,385 @@
+"""
+Instructor console: drive the launcher agents (agent_vr.py) on many stations at once.
+
+Keeps one persistent connection per station and sends every station's
+request concurrently, so launching on 30 PCs takes about as long as the
+slowest one. Each reply is reported with its round-trip latency.
+
+    python console_vr.py --station lab-01 --station lab-02 status
+    python console_vr.py --stations-file room3.txt launch Heart
+    python console_vr.py --station 127.0.0.1:48731 ping --count 20
+
+Stations are host or host:port (default port 48730); a stations file has
+one per line, '#' starts a comment. Output is tab-separated, or one JSON
+object per line with --json. No Qt here.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import socket
+import sys
+import time
+
+import agent_vr
+import metrics_vr
+import telemetry_vr
+from cli_vr import Output, date_argument
+
+DEFAULT_TIMEOUT = 10.0
+
+
+class StationError(Exception):
+    """A station couldn't be reached or answered with an error."""
+
+    def __init__(self, kind, message):
+        super().__init__(message)
+        self.kind = kind
+
+
+def parse_station(text):
+    """'host' or 'host:port' (IPv6 as [addr]:port) -> (host, port)"""
+    text = text.strip()
+    if text.startswith("["):
+        host, _, rest = text[1:].partition("]")
+        port = rest.lstrip(":")
+    elif text.count(":") == 1:
+        host, port = text.split(":")
+    else:
+        host, port = text, ""
+    return host, int(port) if port else agent_vr.DEFAULT_PORT
+
+
+def read_stations_file(path):
+    with open(path, encoding="utf-8") as f:
+        lines = (line.split("#", 1)[0].strip() for line in f)
+        return [line for line in lines if line]
+
+
+class StationConnection:
+    """
+    One persistent connection to an agent. Requests may overlap; replies
+    are matched to their callers by id. Reconnects on the next call after
+    the connection drops.
+    """
+
+    def __init__(self, host, port, token=None, timeout=DEFAULT_TIMEOUT):
+        self.host = host
+        self.port = port
+        self.token = token
+        self.timeout = timeout
+        self.ids = itertools.count(1)
+        self.pending = {}
+        self.reader = None
+        self.writer = None
+        self.read_task = None
+        self.connect_lock = asyncio.Lock()
+
+    @property
+    def name(self):
+        return f"{self.host}:{self.port}"
+
+    @property
+    def connected(self):
+        return self.read_task is not None and not self.read_task.done()
+
+    async def ensure_connected(self):
+        async with self.connect_lock:
+            if self.connected:
+                return
+            try:
+                self.reader, self.writer = await asyncio.wait_for(
+                    asyncio.open_connection(self.host, self.port, limit=agent_vr.MAX_LINE), self.timeout
+                )
+            except (OSError, asyncio.TimeoutError) as e:
+                raise StationError("unreachable", f"Cannot connect to {self.name}: {e or 'timed out'}")
+            sock = self.writer.get_extra_info("socket")
+            if sock is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.read_task = asyncio.ensure_future(self.read_replies())
+            try:
+                await self.send("hello", {"token": self.token})
+            except StationError:
+                # Don't leave an unauthenticated connection in the pool
+                self.writer.close()
+                raise
+
+    async def read_replies(self):
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    break
+                try:
+                    reply = json.loads(line)
+                except ValueError:
+                    continue
+                future = self.pending.pop(reply.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(reply)
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            # Everyone still waiting learns the connection is gone
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(StationError("disconnected", f"{self.name} closed the connection"))
+            self.pending.clear()
+            self.writer.close()
+
+    async def send(self, method, params):
+        request_id = next(self.ids)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+        try:
+            self.writer.write(agent_vr.encode({"id": request_id, "method": method, "params": params}))
+            await self.writer.drain()
+            reply = await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            raise StationError("timeout", f"{self.name} did not answer '{method}' within {self.timeout:g}s")
+        except ConnectionError as e:
+            raise StationError("disconnected", f"{self.name}: {e}")
+        finally:
+            self.pending.pop(request_id, None)
+        if "error" in reply:
+            raise StationError(reply["error"].get("type", "error"), reply["error"].get("message", ""))
+        return reply.get("result")
+
+    async def call(self, method, **params):
+        await self.ensure_connected()
+        return await self.send(method, params)
+
+    async def close(self):
+        if self.read_task is not None:
+            self.writer.close()
+            try:
+                await self.read_task
+            except asyncio.CancelledError:
+                pass
+
+
+class StationReply:
+    """One station's answer (or error) to one request."""
+
+    def __init__(self, station, latency_ms, result=None, error=None):
+        self.station = station
+        self.latency_ms = latency_ms
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+class StationPool:
+    """Pooled connections to many stations; calls fan out concurrently."""
+
+    def __init__(self, stations, token=None, timeout=DEFAULT_TIMEOUT):
+        self.connections = [StationConnection(host, port, token, timeout) for host, port in stations]
+
+    async def call(self, connection, method, **params):
+        started = time.perf_counter()
+        try:
+            result = await connection.call(method, **params)
+            error = None
+        except StationError as e:
+            result, error = None, e
+        return StationReply(connection.name, (time.perf_counter() - started) * 1000.0, result, error)
+
+    async def call_all(self, method, **params):
+        """Send one request to every station at once. Returns replies in station order."""
+        return await asyncio.gather(*(self.call(c, method, **params) for c in self.connections))
+
+    async def close(self):
+        await asyncio.gather(*(c.close() for c in self.connections))
+
+
+# ==========================================
+# 🔹 COMMANDS
+# ==========================================
+def error_row(reply):
+    return {"station": reply.station, "state": reply.error.kind, "detail": str(reply.error),
+            "latency_ms": round(reply.latency_ms, 1)}
+
+
+async def cmd_ping(args, pool, out):
+    fields = ("station", "state", "sent", "answered", "p50_ms", "p95_ms", "max_ms", "detail")
+    samples = {c.name: [] for c in pool.connections}
+    errors = {}
+    for _ in range(args.count):
+        for reply in await pool.call_all("ping"):
+            if reply.ok:
+                samples[reply.station].append(reply.latency_ms)
+            else:
+                errors[reply.station] = reply.error
+    for station, latencies in samples.items():
+        latencies.sort()
+        row = {"station": station, "sent": args.count, "answered": len(latencies)}
+        if latencies:
+            row.update(p50_ms=round(metrics_vr.percentile(latencies, 50), 2),
+                       p95_ms=round(metrics_vr.percentile(latencies, 95), 2),
+                       max_ms=round(latencies[-1], 2))
+        error = errors.get(station)
+        row.update(state=error.kind if error else "ok", detail=str(error) if error else None)
+        out.write(row, fields)
+    return 0 if not errors else 1
+
+
+async def cmd_list(args, pool, out):
+    fields = ("station", "name", "favorite", "description", "latency_ms", "state", "detail")
+    ok = True
+    for reply in await pool.call_all("list"):
+        if not reply.ok:
+            ok = False
+            out.write(error_row(reply), fields)
+            continue
+        for module in reply.result:
+            out.write(dict(module, station=reply.station, latency_ms=round(reply.latency_ms, 1)), fields)
+    return 0 if ok else 1
+
+
+async def cmd_status(args, pool, out):
+    fields = ("station", "name", "state", "pid", "runtime", "latency_ms", "detail")
+    ok = True
+    for reply in await pool.call_all("status", names=args.names):
+        if not reply.ok:
+            ok = False
+            out.write(error_row(reply), fields)
+            continue
+        for module in reply.result:
+            out.write(dict(module, station=reply.station, latency_ms=round(reply.latency_ms, 1)), fields)
+    return 0 if ok else 1
+
+
+async def cmd_launch(args, pool, out):
+    fields = ("station", "name", "state", "pid", "latency_ms", "detail")
+    ok = True
+    for reply in await pool.call_all("launch", name=args.name, force=args.force):
+        if reply.ok:
+            row = dict(reply.result, station=reply.station, latency_ms=round(reply.latency_ms, 1))
+        else:
+            ok = False
+            row = dict(error_row(reply), name=args.name)
+        out.write(row, fields)
+    return 0 if ok else 1
+
+
+async def cmd_stop(args, pool, out):
+    fields = ("station", "name", "state", "latency_ms", "detail")
+    ok = True
+    for reply in await pool.call_all("stop", name=args.name):
+        if reply.ok:
+            state = "stopped" if reply.result["stopped"] else "not_running"
+            row = dict(reply.result, state=state, station=reply.station, latency_ms=round(reply.latency_ms, 1))
+        else:
+            ok = False
+            row = dict(error_row(reply), name=args.name)
+        out.write(row, fields)
+    return 0 if ok else 1
+
+
+async def cmd_logs(args, pool, out):
+    fields = ("station", "name", "line", "state", "detail")
+    ok = True
+    for reply in await pool.call_all("logs", name=args.name, lines=args.lines, level=args.level, search=args.search):
+        if not reply.ok:
+            ok = False
+            out.write(dict(error_row(reply), name=args.name), fields)
+            continue
+        for line in reply.result["lines"]:
+            out.write({"station": reply.station, "name": reply.result["name"], "line": line}, fields[:3])
+    return 0 if ok else 1
+
+
+async def cmd_usage(args, pool, out):
+    """Each station's session rollup, one row per station and group."""
+    groups = [column for column in telemetry_vr.GROUPS if column in args.by and column != "station"] or ["module"]
+    fields = ("station", *groups, *telemetry_vr.ROLLUP_FIELDS, "state", "detail")
+    ok = True
+    for reply in await pool.call_all("usage", by=groups, since=args.since, until=args.until):
+        if not reply.ok:
+            ok = False
+            out.write(error_row(reply), fields)
+            continue
+        for row in reply.result:
+            out.write(dict(row, station=reply.station), fields)
+    return 0 if ok else 1
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="console_vr.py", description="Instructor console for launcher agents.")
+    parser.add_argument("--station", action="append", default=[], metavar="HOST[:PORT]",
+                        help="station to control (repeatable)")
+    parser.add_argument("--stations-file", metavar="PATH", help="file with one station per line")
+    parser.add_argument("--token", default=os.environ.get(agent_vr.TOKEN_ENV), help="agent token")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, metavar="SECONDS",
+                        help=f"per-request timeout (default: {DEFAULT_TIMEOUT:g})")
+    parser.add_argument("--json", action="store_true", help="print one JSON object per line")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ping = commands.add_parser("ping", help="measure round-trip latency to every station")
+    ping.add_argument("--count", type=int, default=5, help="pings per station (default: 5)")
+    ping.set_defaults(run=cmd_ping)
+
+    commands.add_parser("list", help="list each station's modules").set_defaults(run=cmd_list)
+
+    status = commands.add_parser("status", help="module states on every station")
+    status.add_argument("names", nargs="*", help="modules to report (default: all)")
+    status.set_defaults(run=cmd_status)
+
+    for command, run, text in (("launch", cmd_launch, "start a module on every station"),
+                               ("stop", cmd_stop, "close a module on every station")):
+        sub = commands.add_parser(command, help=text)
+        sub.add_argument("name", help="module name")
+        sub.set_defaults(run=run)
+        if command == "launch":
+            sub.add_argument("--force", action="store_true",
+                             help="launch even where the station reports too few free resources")
+
+    logs = commands.add_parser("logs", help="newest output lines of a module on every station")
+    logs.add_argument("name", help="module name")
+    logs.add_argument("--lines", type=int, default=50, help="lines per station (default: 50)")
+    logs.add_argument("--level", default="debug", choices=["debug", "info", "warning", "error"],
+                      help="lowest severity to show")
+    logs.add_argument("--search", help="only lines containing this text")
+    logs.set_defaults(run=cmd_logs)
+
+    usage = commands.add_parser("usage", help="sessions, hours and failure rate per module on every station")
+    usage.add_argument("--by", action="append", choices=["day", "module"], default=[],
+                       help="group by day and/or module (repeatable; default: module)")
+    usage.add_argument("--since", metavar="YYYY-MM-DD", type=date_argument, help="first day to include")
+    usage.add_argument("--until", metavar="YYYY-MM-DD", type=date_argument, help="last day to include")
+    usage.set_defaults(run=cmd_usage)
+    return parser
+
+
+async def run_console(args, stations):
+    pool = StationPool(stations, token=args.token, timeout=args.timeout)
+    try:
+        return await args.run(args, pool, Output(args.json))
+    finally:
+        await pool.close()
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    names = list(args.station)
+    if args.stations_file:
+        try:
+            names += read_stations_file(args.stations_file)
+        except OSError as e:
+            parser.error(f"cannot read stations file: {e}")
+    if not names:
+        parser.error("give at least one --station or --stations-file")
+    try:
+        stations = [parse_station(name) for name in names]
+    except ValueError as e:
+        parser.error(f"bad station address: {e}")
+    return asyncio.run(run_console(args, stations))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
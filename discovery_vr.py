@@ -0,0 +1,166 @@
+"""
+Auto-discovery of Unity builds under configured root folders.
+
+A Unity player build is an executable with a sibling '<name>_Data'
+folder. Folders are crawled breadth-first with a thread pool, one
+listing per folder. Each folder's listing is cached with its mtime, so a
+rescan only re-lists folders that changed; unchanged ones cost a stat.
+"""
+import difflib
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import storage_vr
+
+CACHE_FILENAME = "discovery_cache.json"
+CACHE_VERSION = 1
+EXECUTABLE_SUFFIXES = (".exe", ".x86_64", ".x86")
+IGNORED_EXECUTABLES = {"unitycrashhandler64.exe", "unitycrashhandler32.exe"}
+# Minimum similarity between a module name and a build path to suggest it
+MATCH_THRESHOLD = 0.6
+
+
+def is_data_folder(name):
+    return name.endswith("_Data")
+
+
+class ScanResult:
+    """Builds found by one scan, plus how much work the cache saved."""
+
+    def __init__(self, builds, listed, reused):
+        self.builds = builds
+        self.listed = listed
+        self.reused = reused
+
+
+class BuildScanner:
+    """Crawls root folders for Unity builds, reusing cached listings of unchanged folders."""
+
+    def __init__(self, cache_path=None, workers=8):
+        self.cache_path = cache_path or storage_vr.data_path(CACHE_FILENAME)
+        self.workers = workers
+        self.lock = threading.Lock()
+        self.cache = self.load_cache()
+
+    def load_cache(self):
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != CACHE_VERSION:
+            return {}
+        return data.get("folders", {})
+
+    def save_cache(self):
+        # Write to a temp file and swap it in, so a crash never leaves half a cache
+        temp_path = self.cache_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "folders": self.cache}, f)
+        os.replace(temp_path, self.cache_path)
+
+    def visit(self, folder, fresh_cache, counters):
+        """List one folder (or reuse its cached listing). Returns its subfolders."""
+        try:
+            mtime = os.stat(folder).st_mtime_ns
+        except OSError:
+            return []
+
+        cached = self.cache.get(folder)
+        if cached is not None and cached["mtime"] == mtime:
+            entry = cached
+            key = "reused"
+        else:
+            subdirs, files = [], []
+            try:
+                with os.scandir(folder) as entries:
+                    for item in entries:
+                        try:
+                            if item.is_dir(follow_symlinks=False):
+                                subdirs.append(item.name)
+                            elif item.is_file():
+                                files.append(item.name)
+                        except OSError:
+                            pass
+            except OSError:
+                return []
+            builds = [
+                name for name in files
+                if name.lower().endswith(EXECUTABLE_SUFFIXES)
+                and name.lower() not in IGNORED_EXECUTABLES
+                and f"{os.path.splitext(name)[0]}_Data" in subdirs
+            ]
+            entry = {"mtime": mtime, "subdirs": subdirs, "builds": builds}
+            key = "listed"
+
+        with self.lock:
+            fresh_cache[folder] = entry
+            counters[key] += 1
+        # Never descend into a build's data folder or hidden folders
+        return [
+            os.path.join(folder, name) for name in entry["subdirs"]
+            if not is_data_folder(name) and not name.startswith(".")
+        ]
+
+    def scan(self, roots):
+        """Find every build under roots. Returns a ScanResult."""
+        fresh_cache = {}
+        counters = {"listed": 0, "reused": 0}
+        frontier = [os.path.normpath(root) for root in roots if os.path.isdir(root)]
+        seen = set(frontier)
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="discovery") as pool:
+            while frontier:
+                next_frontier = []
+                for subdirs in pool.map(lambda f: self.visit(f, fresh_cache, counters), frontier):
+                    for subdir in subdirs:
+                        if subdir not in seen:
+                            seen.add(subdir)
+                            next_frontier.append(subdir)
+                frontier = next_frontier
+
+        builds = sorted(
+            os.path.join(folder, name)
+            for folder, entry in fresh_cache.items()
+            for name in entry["builds"]
+        )
+        # Folders that vanished drop out of the cache with the rebuild
+        self.cache = fresh_cache
+        try:
+            self.save_cache()
+        except OSError as e:
+            print(f"Could not save discovery cache: {e}")
+        return ScanResult(builds, counters["listed"], counters["reused"])
+
+
+def tokens(text):
+    return [t for t in re.split(r"[^a-z0-9]+", text.lower()) if t]
+
+
+def match_score(entry, build_path):
+    """Similarity (0..1) between a catalogue entry's name and the words of a build path."""
+    if os.path.normcase(build_path) == os.path.normcase(entry.get("exe_path", "")):
+        return 1.0
+    wanted = entry["name"].lower()
+    best = 0.0
+    for part in tokens(build_path):
+        if part == wanted:
+            return 0.95
+        if len(part) >= 3 and (part.startswith(wanted) or wanted.startswith(part)):
+            best = max(best, 0.85)
+        else:
+            best = max(best, difflib.SequenceMatcher(None, wanted, part).ratio())
+    return best
+
+
+def match_builds(entries, builds):
+    """{module name: [build paths, best match first]} for matches above MATCH_THRESHOLD."""
+    matches = {}
+    for entry in entries:
+        scored = [(match_score(entry, build), build) for build in builds]
+        ranked = [build for score, build in sorted(scored, key=lambda s: -s[0]) if score >= MATCH_THRESHOLD]
+        matches[entry["name"]] = ranked
+    return matches
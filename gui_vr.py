@@ -1,63 +1,80 @@
 import sys
 import os
-import subprocess
+import threading
+
+import instance_vr
+import startup_vr
+
+# Arguments for the launcher: nothing (show the window) or "launch NAME..."
+REQUEST = [arg for arg in sys.argv[1:] if arg != startup_vr.FLAG]
+if __name__ == "__main__":
+    # A launcher is already running: hand it our arguments and exit before loading Qt
+    REPLY = instance_vr.forward(REQUEST)
+    if REPLY is not None:
+        print(REPLY.get("message", ""))
+        sys.exit(0 if REPLY.get("ok") else 1)
+
+# Created before the Qt imports so the profile includes them
+STARTUP = startup_vr.StartupProfiler.from_environment()
+
 from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QGridLayout, 
-    QPushButton, QLabel, QFrame, QMessageBox, QGraphicsDropShadowEffect,
-    QScrollArea, QFileDialog, QSizePolicy
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, 
+    QPushButton, QLabel, QFrame, QMessageBox, QListView, QStyledItemDelegate,
+    QScrollArea, QFileDialog, QInputDialog, QDialog, QListWidget, QComboBox, QTableWidget, QTableWidgetItem, QHeaderView,
+    QPlainTextEdit, QLineEdit, QCheckBox, QSpinBox, QShortcut,
+    QGraphicsScene, QGraphicsPixmapItem, QGraphicsBlurEffect
+)
+from PyQt5.QtCore import (
+    Qt, QEvent, QUrl, QRect, QRectF, QPoint, QSize, QObject, QThread, QTimer, QFileSystemWatcher,
+    QAbstractListModel, QModelIndex, QVariantAnimation, QAbstractAnimation, QEasingCurve,
+    pyqtSignal, pyqtSlot
+)
+from PyQt5.QtGui import (
+    QFont, QFontDatabase, QColor, QPainter, QPen, QBrush, QLinearGradient, QPixmap, QDesktopServices, QKeySequence
 )
-from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, QRect
-from PyQt5.QtGui import QFont, QColor, QCursor 
+from PyQt5.QtNetwork import QLocalServer
+
+import buildcache_vr
+import catalog_vr
+import integrity_vr
+import launch_vr
+import logs_vr
+import metrics_vr
+import prefetch_vr
+import process_vr
+import profiles_vr
+import scheduler_vr
+import search_vr
+import standby_vr
+import station_vr
+import status_vr
+import telemetry_vr
+
+STARTUP.mark("imports")
+
+# ==========================================
+# 🔹 COLD-START PREFETCH SETTINGS
+# Warms a build's *_Data folder in the OS page cache before launch.
+# Mark modules with "favorite": True to warm them at startup and on schedule.
+# ==========================================
+PREFETCH_SETTINGS = {
+    "enabled": True,
+    "on_hover": True,          # warm a card's build when the mouse rests on it
+    "hover_delay_ms": 400,
+    "interval_minutes": 30,    # re-warm favourites periodically (0 = off)
+    "budget_mb": 2048,         # upper limit, further capped by free RAM
+}
 
 # ==========================================
-# 🔹 INITIAL SIMULATION DATA
-# IMPORTANT: This list defines all your simulation modules. 
-#            Update the exe_path entries or use the GUI to set them.
+# 🔹 LOW-POWER MODE SETTINGS
+# While a simulation runs the launcher gets out of its way: no animations,
+# cached card art released, no repaints while it sits in the background,
+# and (on Windows) its own process priority lowered.
 # ==========================================
-INITIAL_SIMULATIONS = [
-    {
-        "name": "Heart",
-        "icon": "❤️",
-        "description": "Cardiac Surgery VR",
-        "exe_path": r"C:\Users\HP\Downloads\task4\HEART\UnityCrashHandler64.exe", 
-        "color": "#D64545"  # Red
-    },
-    {
-        "name": "Liver",
-        "icon": "🟤",
-        "description": "Hepatic Procedures VR",
-        "exe_path": r"C:\Users\HP\Downloads\task4\liverSqueeze\My project (5).exe",
-        "color": "#E85D75"  # Pink/Red
-    },
-    {
-        "name": "Tooth",
-        "icon": "🦷",
-        "description": "Dental Training VR",
-        "exe_path": r"C:\Users\HP\Downloads\task4\teeth\My project (4).exe",
-        "color": "#4A90E2"  # Blue
-    },
-    {
-        "name": "Flow", 
-        "icon": "💧",
-        "description": "Vascular Flow VR",
-        "exe_path": r"C:\Users\HP\Downloads\task4\New folder\My project (16).exe",
-        "color": "#00BCD4"  # Cyan
-    },
-    {
-        "name": "Nose",
-        "icon": "👃",
-        "description": "ENT Surgery VR",
-        "exe_path": r"C:\Users\HP\Downloads\task4\New folder\My project (16).exe", 
-        "color": "#F5A623"  # Orange
-    },
-    {
-        "name": "Abdomen",
-        "icon": "🩺",
-        "description": "Abdominal Trauma VR",
-        "exe_path": r"C:\Users\HP\Downloads\task4\New folder\My project (16).exe",
-        "color": "#7B68EE"  # Purple
-    }
-]
+LOW_POWER_SETTINGS = {
+    "enabled": True,
+    "priority": "below_normal",   # launcher priority while a simulation runs
+}
 
 # ==========================================
 # 🔹 COLOR PALETTE & STYLESHEET
@@ -77,6 +94,8 @@ MEDICAL_COLORS = {
     "error": "#F56565",
 }
 
+PALETTE_TONES = {color: tone for tone, color in MEDICAL_COLORS.items()}
+
 STYLESHEET = f"""
 QMainWindow {{
     background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
@@ -99,36 +118,6 @@ QLabel#SubTitle {{
     margin-bottom: 20px;
     font-weight: 500;
 }}
-QFrame.SimulationCard {{
-    background-color: {MEDICAL_COLORS['card_bg']};
-    border-radius: 20px;
-    border: 2px solid #E2E8F0;
-}}
-QFrame.SimulationCard:hover {{
-    border: 3px solid {MEDICAL_COLORS['secondary']};
-}}
-QLabel#IconBadge {{
-    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                 stop:0 #F7FAFC, stop:1 #EDF2F7);
-    border-radius: 60px;
-    border: 4px solid #E2E8F0;
-}}
-QPushButton#LaunchBtn {{
-    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                 stop:0 #00A896, stop:1 #008C7A);
-    color: white;
-    border-radius: 12px;
-    padding: 14px 24px;
-    font-size: 14px;
-    font-weight: bold;
-    border: none;
-}}
-QPushButton#LaunchBtn:hover {{
-    background: {MEDICAL_COLORS['accent']};
-}}
-QPushButton#LaunchBtn:pressed {{
-    background: #00695C;
-}}
 QPushButton#ConfigBtn {{
     background-color: {MEDICAL_COLORS['accent']};
     color: white;
@@ -167,200 +156,1277 @@ QScrollBar::handle:vertical {{
 QScrollBar::handle:vertical:hover {{
     background: #A0AEC0;
 }}
+QListView#CardGrid {{
+    background: transparent;
+    border: none;
+}}
+QFrame#StatusBar {{
+    background-color: {MEDICAL_COLORS['card_bg']};
+    border-radius: 10px;
+    padding: 10px;
+    border: 1px solid #E2E8F0;
+}}
+QLabel#StatusMessage {{
+    font-size: 13px;
+    font-weight: 500;
+    border: none;
+}}
+QLabel#DialogInfo {{
+    color: {MEDICAL_COLORS['primary']};
+    font-weight: bold;
+    margin-bottom: 10px;
+}}
+QLabel#PathLabel {{
+    color: {MEDICAL_COLORS['text_light']};
+    font-size: 12px;
+}}
+QLineEdit#SearchBar {{
+    background-color: {MEDICAL_COLORS['card_bg']};
+    border: 2px solid #E2E8F0;
+    border-radius: 20px;
+    padding: 8px 18px;
+    font-size: 15px;
+    color: {MEDICAL_COLORS['text_dark']};
+}}
+QLineEdit#SearchBar:focus {{
+    border-color: {MEDICAL_COLORS['primary']};
+}}
 """
 
+# Status bar colours are driven by the "tone" dynamic property, one rule per palette entry
+STYLESHEET += "".join(
+    f'QLabel#StatusMessage[tone="{tone}"] {{ color: {color}; }}\n'
+    for tone, color in MEDICAL_COLORS.items()
+)
+
 # ==========================================
-# 🔹 SIMULATION CARD
+# 🔹 STATUS SERVICE (background path checks)
 # ==========================================
-class SimulationCard(QFrame):
-    def __init__(self, index, simulation_data, parent_window):
+class _StatusWorker(QObject):
+    """Lives on the status thread: scans folders and watches them for changes."""
+    scanned = pyqtSignal(dict)
+
+    def __init__(self):
         super().__init__()
-        self.index = index
-        self.simulation = simulation_data
-        self.parent_window = parent_window
-        
-        self.setProperty("class", "SimulationCard")
-        self.setFixedSize(250, 350)
-        self.setCursor(Qt.PointingHandCursor)
+        self.paths = []
+        self.watcher = None
+        self.pending_folders = set()
+        self.debounce = None
 
-        # Shadow effect
-        self.shadow = QGraphicsDropShadowEffect()
-        self.shadow.setColor(QColor(0, 0, 0, 30)) 
-        self.shadow.setBlurRadius(25)
-        self.shadow.setOffset(0, 8)
-        self.setGraphicsEffect(self.shadow)
+    def _ensure_watcher(self):
+        if self.watcher is None:
+            # Created here so the watcher belongs to this thread
+            self.watcher = QFileSystemWatcher(self)
+            self.watcher.directoryChanged.connect(self.on_directory_changed)
+            self.debounce = QTimer(self)
+            self.debounce.setSingleShot(True)
+            self.debounce.setInterval(250)
+            self.debounce.timeout.connect(self.rescan_pending)
 
-        layout = QVBoxLayout(self)
-        layout.setAlignment(Qt.AlignCenter)
-        layout.setSpacing(15)
-        layout.setContentsMargins(20, 25, 20, 25)
+    @pyqtSlot(list)
+    def scan(self, paths):
+        """Scan all tracked paths and (re)arm the folder watcher."""
+        self.paths = list(paths)
+        self._ensure_watcher()
+
+        self.scanned.emit(status_vr.scan_paths(self.paths))
+
+        targets = status_vr.watch_targets(self.paths)
+        watched = set(self.watcher.directories())
+        if watched - targets:
+            self.watcher.removePaths(list(watched - targets))
+        if targets - watched:
+            self.watcher.addPaths(list(targets - watched))
+
+    @pyqtSlot(list)
+    def add(self, paths):
+        """Track more paths: scan and watch only those, the others are already known."""
+        tracked = set(self.paths)
+        new = [p for p in paths if p not in tracked]
+        if not new:
+            return
+        self.paths.extend(new)
+        self._ensure_watcher()
+        self.scanned.emit(status_vr.scan_paths(new))
+        targets = status_vr.watch_targets(new) - set(self.watcher.directories())
+        if targets:
+            self.watcher.addPaths(list(targets))
+
+    @pyqtSlot(str)
+    def on_directory_changed(self, folder):
+        # Copying a build fires many events; coalesce them
+        self.pending_folders.add(folder)
+        self.debounce.start()
+
+    def rescan_pending(self):
+        folders, self.pending_folders = self.pending_folders, set()
+        affected = [p for p in self.paths if any(status_vr.is_under(p, f) for f in folders)]
+        if affected:
+            self.scanned.emit(status_vr.scan_paths(affected))
+        # A missing folder may have appeared, so the watch targets can move
+        targets = status_vr.watch_targets(self.paths)
+        new_targets = targets - set(self.watcher.directories())
+        if new_targets:
+            self.watcher.addPaths(list(new_targets))
+
+
+class StatusService(QObject):
+    """
+    Cached executable status for every card.
+    All file system access happens on a background thread; the UI only
+    reads the cache and listens to statusChanged.
+    """
+    statusChanged = pyqtSignal(str)   # exe_path whose status changed
+    _request_scan = pyqtSignal(list)
+    _request_add = pyqtSignal(list)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.cache = {}
+        self.thread = QThread(self)
+        self.worker = _StatusWorker()
+        self.worker.moveToThread(self.thread)
+        self._request_scan.connect(self.worker.scan)
+        self._request_add.connect(self.worker.add)
+        self.worker.scanned.connect(self.on_scanned)
+        self.thread.finished.connect(self.worker.deleteLater)
+        self.thread.start()
+
+    def status(self, exe_path):
+        """True/False once checked, None while the first check is still running."""
+        return self.cache.get(exe_path)
+
+    def watch(self, paths):
+        """Track exactly these paths and schedule a fresh scan."""
+        self._request_scan.emit([p for p in dict.fromkeys(paths) if p])
+
+    def add(self, paths):
+        """Also track these paths; only they are scanned, which keeps paging the catalogue linear."""
+        self._request_add.emit([p for p in dict.fromkeys(paths) if p])
+
+    @pyqtSlot(dict)
+    def on_scanned(self, results):
+        for path, exists in results.items():
+            if self.cache.get(path) != exists:
+                self.cache[path] = exists
+                self.statusChanged.emit(path)
+
+    def stop(self):
+        self.thread.quit()
+        self.thread.wait()
+
+
+# ==========================================
+# 🔹 WORKER BRIDGES
+# Plain-Python workers report back through these queued signals
+# ==========================================
+class SupervisorBridge(QObject):
+    """Carries process supervisor callbacks (from reaper threads) onto the UI thread."""
+    processChanged = pyqtSignal(str)
+
+
+class IntegrityBridge(QObject):
+    """Carries build verification results onto the UI thread."""
+    verified = pyqtSignal(object)
+
+
+class SchedulerBridge(QObject):
+    """Carries launch queue events (name, state, detail) onto the UI thread."""
+    queueEvent = pyqtSignal(str, str, str)
+
+
+class StandbyBridge(QObject):
+    """Carries warm-standby events (name, state) onto the UI thread."""
+    standbyEvent = pyqtSignal(str, str)
+
+
+class ProfileBridge(QObject):
+    """Carries learned launch-profile changes (name, old profile, new profile) and the end of the hardware probe onto the UI thread."""
+    profileChanged = pyqtSignal(str, str, str)
+    probed = pyqtSignal()
+
+
+class BuildCacheBridge(QObject):
+    """Carries build cache events (name, state, detail) onto the UI thread."""
+    cacheEvent = pyqtSignal(str, str, str)
+
+
+# ==========================================
+# 🔹 SINGLE INSTANCE SERVER
+# Later invocations of the launcher forward their arguments here (see instance_vr)
+# ==========================================
+class InstanceServer(QObject):
+    """Answers forwarded requests with handler(argv) -> message; handler raises instance_vr.RequestError."""
+
+    def __init__(self, handler, parent=None):
+        super().__init__(parent)
+        self.handler = handler
+        self.server = QLocalServer(self)
+        self.server.newConnection.connect(self.on_new_connection)
+
+    def listen(self):
+        """Start answering. False if another launcher took the name first."""
+        name = instance_vr.server_name()
+        if self.server.listen(name):
+            return True
+        if instance_vr.forward([]) is not None:
+            return False
+        # Left behind by a launcher that didn't shut down cleanly
+        QLocalServer.removeServer(name)
+        return self.server.listen(name)
+
+    def on_new_connection(self):
+        while self.server.hasPendingConnections():
+            connection = self.server.nextPendingConnection()
+            connection.disconnected.connect(connection.deleteLater)
+            connection.readyRead.connect(lambda connection=connection: self.on_ready_read(connection))
+
+    def on_ready_read(self, connection):
+        if not connection.canReadLine():
+            return
+        try:
+            argv = instance_vr.decode(bytes(connection.readLine())).get("argv")
+            if not isinstance(argv, list) or not all(isinstance(arg, str) for arg in argv):
+                raise instance_vr.RequestError("malformed message")
+            reply = {"ok": True, "message": self.handler(argv)}
+        except instance_vr.RequestError as e:
+            reply = {"ok": False, "message": str(e)}
+        connection.write(instance_vr.encode(reply))
+        connection.flush()
+        connection.disconnectFromServer()
+
+    def close(self):
+        self.server.close()
+
+
+# ==========================================
+# 🔹 SIMULATION CARD GRID (model / delegate / view)
+# Cards are painted by a delegate instead of being widget trees,
+# so only the cards in view cost anything and columns reflow with
+# the window width.
+# ==========================================
+CARD_WIDTH, CARD_HEIGHT = 250, 350
+CARD_SPACING = 35
+HOVER_LIFT = 10
+# Cards loaded per event-loop turn while the window fills in at startup
+CARD_FILL_BATCH = 6
+
+SimulationRole = Qt.UserRole + 1
+StatusRole = Qt.UserRole + 2
+
+
+def darken_color(hex_color):
+    """Darken a hex color by 30%"""
+    hex_color = hex_color.lstrip('#')
+    r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    r, g, b = int(r * 0.7), int(g * 0.7), int(b * 0.7)
+    return f'#{r:02x}{g:02x}{b:02x}'
+
+
+class SimulationListModel(QAbstractListModel):
+    """
+    Exposes the simulation list and each module's live status to the card grid.
+    Entries are pulled from the catalogue a page at a time as the view needs them.
+
+    With skeleton > 0 the model starts with that many placeholder rows (painted
+    as grey skeleton cards) so the window can be shown before any entry is
+    read; fill() then replaces them a small batch at a time.
+    """
+
+    def __init__(self, window, skeleton=0):
+        super().__init__(window)
+        self.window = window
+        self.total = window.catalog.count()
+        self.skeleton = min(skeleton, self.total, catalog_vr.PAGE_SIZE)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else max(len(self.window.SIMULATIONS), self.skeleton)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        # Paging waits until the progressive first fill is done
+        return not parent.isValid() and not self.skeleton and len(self.window.SIMULATIONS) < self.total
+
+    def fetchMore(self, parent=QModelIndex()):
+        self.load(catalog_vr.PAGE_SIZE)
+
+    def fill(self, batch):
+        """Load the next batch of the first page. Returns True while there is more to fill."""
+        target = min(self.total, catalog_vr.PAGE_SIZE)
+        loaded = self.load(min(batch, target - len(self.window.SIMULATIONS)))
+        if loaded and len(self.window.SIMULATIONS) < target:
+            return True
+        # Drop placeholders the catalogue turned out not to have
+        filled = len(self.window.SIMULATIONS)
+        if filled < self.skeleton:
+            self.beginRemoveRows(QModelIndex(), filled, self.skeleton - 1)
+            self.skeleton = 0
+            self.endRemoveRows()
+        self.skeleton = 0
+        return False
+
+    def load(self, limit):
+        """Append up to limit entries from the catalogue, filling placeholder rows first"""
+        loaded = len(self.window.SIMULATIONS)
+        entries = self.window.catalog.page(loaded, limit) if limit > 0 else []
+        if not entries:
+            self.total = loaded
+            return 0
+        placeholders = max(0, min(self.skeleton - loaded, len(entries)))
+        if placeholders:
+            self.window.SIMULATIONS.extend(entries[:placeholders])
+            self.dataChanged.emit(self.index(loaded), self.index(loaded + placeholders - 1))
+        rest = entries[placeholders:]
+        if rest:
+            start = len(self.window.SIMULATIONS)
+            self.beginInsertRows(QModelIndex(), start, start + len(rest) - 1)
+            self.window.SIMULATIONS.extend(rest)
+            self.endInsertRows()
+        self.window.search_index.add_many(enumerate(entries, start=loaded))
+        # Only the new rows need checking; the earlier pages are already tracked
+        self.window.status_service.add([entry["exe_path"] for entry in entries])
+        return len(entries)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.window.SIMULATIONS):
+            return None
+        sim = self.window.SIMULATIONS[index.row()]
+        if role == Qt.DisplayRole:
+            return sim["name"]
+        if role == Qt.ToolTipRole:
+            result = self.window.integrity_results.get(sim["exe_path"])
+            if result is not None and result.state == integrity_vr.CORRUPT:
+                return f"{sim['exe_path']}\n{result.summary()}"
+            return sim["exe_path"]
+        if role == SimulationRole:
+            return sim
+        if role == StatusRole:
+            return self.window.card_status(index.row())
+        return None
+
+    def refresh_row(self, row):
+        """Repaint one card after its status changed"""
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [StatusRole])
+
+
+class CardPixmapCache:
+    """
+    Pre-rendered card parts (blurred shadow, card body, icon badge with its
+    glyph, launch button) keyed by size, colour and device pixel ratio.
+    Each part is rendered once and then only blitted, so hovering or
+    scrolling never re-blurs or re-parses anything.
+    """
+
+    def __init__(self):
+        self.pixmaps = {}
+
+    def get(self, key, render):
+        pixmap = self.pixmaps.get(key)
+        if pixmap is None:
+            pixmap = self.pixmaps[key] = render()
+        return pixmap
+
+    def clear(self):
+        self.pixmaps.clear()
+
+    @staticmethod
+    def blank(width, height, dpr):
+        pixmap = QPixmap(int(width * dpr), int(height * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        return pixmap
+
+    def shadow(self, size, blur, dpr):
+        """Blurred card silhouette, padded by blur on every side"""
+        def render():
+            width, height = size.width() + 2 * blur, size.height() + 2 * blur
+            silhouette = self.blank(width, height, dpr)
+            painter = QPainter(silhouette)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(0, 0, 0, 30))
+            painter.drawRoundedRect(QRectF(blur, blur, size.width(), size.height()), 20, 20)
+            painter.end()
+
+            # Blur once through a throwaway scene
+            scene = QGraphicsScene()
+            item = QGraphicsPixmapItem(silhouette)
+            effect = QGraphicsBlurEffect()
+            effect.setBlurRadius(blur)
+            item.setGraphicsEffect(effect)
+            scene.addItem(item)
+            result = self.blank(width, height, dpr)
+            painter = QPainter(result)
+            scene.render(painter, QRectF(0, 0, width, height), QRectF(0, 0, width, height))
+            painter.end()
+            return result
+        return self.get(("shadow", size.width(), size.height(), blur, dpr), render)
+
+    def body(self, size, hovered, dpr):
+        """White rounded card with its (hover) border"""
+        def render():
+            pixmap = self.blank(size.width(), size.height(), dpr)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            border = QColor(MEDICAL_COLORS['secondary'] if hovered else "#E2E8F0")
+            painter.setPen(QPen(border, 3 if hovered else 2))
+            painter.setBrush(QColor(MEDICAL_COLORS['card_bg']))
+            painter.drawRoundedRect(QRectF(0, 0, size.width(), size.height()).adjusted(1.5, 1.5, -1.5, -1.5), 20, 20)
+            painter.end()
+            return pixmap
+        return self.get(("body", size.width(), size.height(), hovered, dpr), render)
+
+    def badge(self, icon, color_name, font, dpr):
+        """Icon badge: tinted gradient disc, coloured ring and the emoji glyph"""
+        def render():
+            pixmap = self.blank(100, 100, dpr)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setRenderHint(QPainter.TextAntialiasing)
+            color = QColor(color_name)
+            tint = QColor(color)
+            tint.setAlpha(0x20)
+            gradient = QLinearGradient(0, 0, 100, 100)
+            gradient.setColorAt(0, QColor("#FFFFFF"))
+            gradient.setColorAt(1, tint)
+            painter.setBrush(QBrush(gradient))
+            painter.setPen(QPen(color, 4))
+            painter.drawEllipse(QRectF(2, 2, 96, 96))
+            painter.setFont(font)
+            painter.setPen(QColor(MEDICAL_COLORS['text_dark']))
+            painter.drawText(QRectF(0, 0, 100, 100), Qt.AlignCenter, icon)
+            painter.end()
+            return pixmap
+        return self.get(("badge", icon, color_name, font.key(), dpr), render)
+
+    def button(self, size, color_name, state, dpr):
+        """Launch button background for state 'normal', 'hover' or 'disabled'"""
+        def render():
+            pixmap = self.blank(size.width(), size.height(), dpr)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(Qt.NoPen)
+            if state == "disabled":
+                painter.setBrush(QColor("#CBD5E0"))
+            elif state == "hover":
+                painter.setBrush(QColor(color_name))
+            else:
+                gradient = QLinearGradient(0, 0, 0, size.height())
+                gradient.setColorAt(0, QColor(color_name))
+                gradient.setColorAt(1, QColor(darken_color(color_name)))
+                painter.setBrush(QBrush(gradient))
+            painter.drawRoundedRect(QRectF(0, 0, size.width(), size.height()), 12, 12)
+            painter.end()
+            return pixmap
+        return self.get(("button", size.width(), size.height(), color_name, state, dpr), render)
+
+
+class HoverAnimator(QObject):
+    """
+    One reusable animation per card, driving a 0..1 "lift" value read at paint
+    time (card offset and shadow). Crossing a card only flips the direction
+    of its existing animation from wherever it is, so fast mouse movement
+    never stacks animations and widget geometry is never touched.
+    """
+
+    def __init__(self, view, duration=250):
+        super().__init__(view)
+        self.view = view
+        self.duration = duration
+        self.enabled = True
+        self.animations = {}
+        self.values = {}
+
+    def value(self, row):
+        return self.values.get(row, 0.0)
+
+    def hover(self, row, entering):
+        """Animate a card towards lifted (entering) or resting"""
+        target = 1.0 if entering else 0.0
+        if not self.enabled:
+            self.set_value(row, target)
+            return
+
+        animation = self.animations.get(row)
+        if animation is None:
+            if self.value(row) == target:
+                return
+            animation = QVariantAnimation(self)
+            animation.setStartValue(0.0)
+            animation.setEndValue(1.0)
+            animation.setDuration(self.duration)
+            animation.valueChanged.connect(lambda value, r=row: self.set_value(r, value))
+            self.animations[row] = animation
+
+        direction = QAbstractAnimation.Forward if entering else QAbstractAnimation.Backward
+        if animation.state() == QAbstractAnimation.Running:
+            # Reverse in place, continuing from the current value
+            animation.setDirection(direction)
+        elif self.value(row) != target:
+            # Fresh start: ease out in both directions (time runs backwards when leaving)
+            animation.setEasingCurve(QEasingCurve.OutCubic if entering else QEasingCurve.InCubic)
+            animation.setDirection(direction)
+            animation.start()
+
+    def set_value(self, row, value):
+        self.values[row] = value
+        model = self.view.model()
+        if model is not None and row < model.rowCount():
+            self.view.update(model.index(row, 0))
+
+    def set_enabled(self, enabled):
+        """Global switch; when off, cards jump straight to their final state"""
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        if not enabled:
+            for row, animation in self.animations.items():
+                if animation.state() == QAbstractAnimation.Running:
+                    animation.stop()
+                    self.set_value(row, 1.0 if animation.direction() == QAbstractAnimation.Forward else 0.0)
+
+    def reset(self):
+        """Forget all per-card state (the model was reset)"""
+        for animation in self.animations.values():
+            animation.stop()
+            animation.deleteLater()
+        self.animations.clear()
+        self.values.clear()
+
+
+class SimulationCardDelegate(QStyledItemDelegate):
+    """Paints one simulation card from cached parts: status, icon badge, name, description and launch button."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pixmaps = CardPixmapCache()
+        self.fonts = None
+
+    def sizeHint(self, option, index):
+        return QSize(CARD_WIDTH + CARD_SPACING, CARD_HEIGHT + CARD_SPACING)
+
+    @staticmethod
+    def card_rect(cell_rect):
+        """The card inside its grid cell (the cell also holds the spacing)"""
+        rect = QRect(0, 0, CARD_WIDTH, CARD_HEIGHT)
+        rect.moveCenter(cell_rect.center())
+        return rect
+
+    @staticmethod
+    def button_rect(card_rect):
+        return QRect(card_rect.left() + 20, card_rect.bottom() - 25 - 44, card_rect.width() - 40, 44)
+
+    def card_fonts(self, base_font):
+        """Fonts used on every card, built once from the view font"""
+        if self.fonts is None or self.fonts["base"] != base_font:
+            def sized(pixels, bold):
+                font = QFont(base_font)
+                font.setPixelSize(pixels)
+                font.setBold(bold)
+                return font
+            glyph = QFont(base_font)
+            glyph.setPointSize(40)
+            self.fonts = {
+                "base": QFont(base_font),
+                "status": sized(11, True),
+                "name": sized(18, True),
+                "description": sized(12, False),
+                "button": sized(14, True),
+                "glyph": glyph,
+            }
+        return self.fonts
+
+    def paint_skeleton(self, painter, card, dpr):
+        """Grey placeholder shown until the card's entry is loaded"""
+        painter.save()
+        painter.drawPixmap(card.left() - 25, card.top() - 25 + 8, self.pixmaps.shadow(card.size(), 25, dpr))
+        painter.drawPixmap(card.topLeft(), self.pixmaps.body(card.size(), False, dpr))
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor("#EDF2F7"))
+        center = card.center().x()
+        painter.drawRoundedRect(QRect(center - 45, card.top() + 37, 90, 14), 7, 7)
+        painter.drawEllipse(QRect(center - 50, card.top() + 68, 100, 100))
+        painter.drawRoundedRect(QRect(center - 60, card.top() + 190, 120, 20), 8, 8)
+        painter.drawRoundedRect(QRect(center - 80, card.top() + 225, 160, 12), 6, 6)
+        painter.drawRoundedRect(self.button_rect(card), 12, 12)
+        painter.restore()
+
+    def paint(self, painter, option, index):
+        sim = index.data(SimulationRole)
+        if sim is None:
+            self.paint_skeleton(painter, self.card_rect(option.rect), painter.device().devicePixelRatioF())
+            return
+        status = index.data(StatusRole)
+        view = option.widget
+        hovered = view is not None and view.hovered_row == index.row()
+        lift = view.animator.value(index.row()) if view is not None else 0.0
+        dpr = painter.device().devicePixelRatioF()
+        fonts = self.card_fonts(option.font)
+
+        card = self.card_rect(option.rect)
+        card.translate(0, -round(HOVER_LIFT * lift))
+
+        painter.save()
+        painter.setRenderHint(QPainter.TextAntialiasing)
+
+        # Shadow: cross-fade the cached resting and lifted shadows as the card rises
+        offset = round(8 + 4 * lift)
+        for blur, opacity in ((25, 1.0 - lift), (35, lift)):
+            if opacity > 0.01:
+                painter.setOpacity(opacity)
+                painter.drawPixmap(card.left() - blur, card.top() - blur + offset,
+                                   self.pixmaps.shadow(card.size(), blur, dpr))
+        painter.setOpacity(1.0)
+
+        # Card body
+        painter.drawPixmap(card.topLeft(), self.pixmaps.body(card.size(), hovered, dpr))
+
+        y = card.top() + 35
 
         # Status indicator
-        status_container = QWidget()
-        status_layout = QVBoxLayout(status_container)
-        status_layout.setContentsMargins(0, 0, 0, 0)
-        
-        self.status_label = QLabel() 
-        self.status_label.setAlignment(Qt.AlignCenter)
-        status_layout.addWidget(self.status_label)
-        layout.addWidget(status_container)
-
-        # Icon with colored background
-        icon_label = QLabel(simulation_data["icon"])
-        icon_label.setObjectName("IconBadge")
-        icon_label.setFixedSize(100, 100)
-        icon_label.setAlignment(Qt.AlignCenter)
-        font = self.parent_window.font()
-        font.setPointSize(40)
-        icon_label.setFont(font)
-        
-        # Add colored border matching simulation type
-        icon_label.setStyleSheet(f"""
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                         stop:0 #FFFFFF, stop:1 {simulation_data['color']}20);
-            border-radius: 50px;
-            border: 4px solid {simulation_data['color']};
-        """)
-        layout.addWidget(icon_label)
-
-        layout.addSpacing(5)
+        painter.setFont(fonts["status"])
+        painter.setPen(QColor(status["color"]))
+        painter.drawText(QRect(card.left() + 10, y, card.width() - 20, 18), Qt.AlignCenter, status["text"])
+        y += 18 + 15
+
+        # Icon badge with colored border matching simulation type
+        painter.drawPixmap(card.center().x() - 50, y, self.pixmaps.badge(sim["icon"], sim["color"], fonts["glyph"], dpr))
+        y += 100 + 20
 
         # Simulation Name
-        lbl_name = QLabel(simulation_data["name"])
-        lbl_name.setStyleSheet(f"""
-            font-size: 18px; 
-            font-weight: bold; 
-            color: {MEDICAL_COLORS['text_header']};
-        """)
-        lbl_name.setAlignment(Qt.AlignCenter)
-        lbl_name.setWordWrap(True)
-        layout.addWidget(lbl_name)
+        painter.setFont(fonts["name"])
+        painter.setPen(QColor(MEDICAL_COLORS['text_header']))
+        painter.drawText(QRect(card.left() + 20, y, card.width() - 40, 24), Qt.AlignCenter | Qt.TextWordWrap, sim["name"])
+        y += 24 + 15
 
         # Description
-        lbl_desc = QLabel(simulation_data["description"])
-        lbl_desc.setStyleSheet(f"font-size: 12px; color: {MEDICAL_COLORS['text_light']};")
-        lbl_desc.setAlignment(Qt.AlignCenter)
-        layout.addWidget(lbl_desc)
-
-        layout.addSpacing(10)
-
-        # Launch Button
-        self.btn_launch = QPushButton("🚀 LAUNCH")
-        self.btn_launch.setObjectName("LaunchBtn")
-        self.btn_launch.setCursor(Qt.PointingHandCursor)
-        self.btn_launch.clicked.connect(self.launch_simulation)
-        
-        # Customize button color based on the simulation
-        launch_style = f"""
-            QPushButton#LaunchBtn {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                             stop:0 {simulation_data['color']}, 
-                                             stop:1 {self.darken_color(simulation_data['color'])});
-                color: white;
-                border-radius: 12px;
-                padding: 10px 15px;
-                font-size: 14px;
-                font-weight: bold;
-                border: none;
-            }}
-            QPushButton#LaunchBtn:hover {{
-                background: {simulation_data['color']};
-            }}
-        """
-        self.btn_launch.setStyleSheet(launch_style)
-        layout.addWidget(self.btn_launch)
-        
-        self.update_status_indicator()
+        painter.setFont(fonts["description"])
+        painter.setPen(QColor(MEDICAL_COLORS['text_light']))
+        painter.drawText(QRect(card.left() + 20, y, card.width() - 40, 18), Qt.AlignCenter, sim["description"])
 
-    def update_status_indicator(self):
-        """Update the 'Ready/Not Found' label based on the current exe_path"""
-        exe_path = self.parent_window.SIMULATIONS[self.index]["exe_path"]
-        exists = os.path.exists(exe_path)
-        
-        status_text = "✅ Ready" if exists else "⚠️ Not Found"
-        status_color = MEDICAL_COLORS['success'] if exists else MEDICAL_COLORS['error']
-        
-        self.status_label.setText(status_text)
-        self.status_label.setStyleSheet(f"font-size: 11px; color: {status_color}; font-weight: bold;")
-        self.btn_launch.setEnabled(exists)
+        # Launch Button (colored after the simulation)
+        button = self.button_rect(card)
+        if not status["enabled"]:
+            state = "disabled"
+        elif hovered and button.contains(view.hover_pos):
+            state = "hover"
+        else:
+            state = "normal"
+        painter.drawPixmap(button.topLeft(), self.pixmaps.button(button.size(), sim["color"], state, dpr))
+        painter.setFont(fonts["button"])
+        painter.setPen(QColor("white"))
+        painter.drawText(button, Qt.AlignCenter, status["button"])
 
-    def darken_color(self, hex_color):
-        """Darken a hex color by 20%"""
-        hex_color = hex_color.lstrip('#')
-        r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        r, g, b = int(r * 0.7), int(g * 0.7), int(b * 0.7)
-        return f'#{r:02x}{g:02x}{b:02x}'
+        painter.restore()
 
-    def launch_simulation(self):
-        """
-        Launch the Unity executable.
-        Uses cwd=os.path.dirname(exe_path) to ensure the executable finds its data files.
-        """
-        exe_path = self.parent_window.SIMULATIONS[self.index]["exe_path"]
-        
-        if not os.path.exists(exe_path):
-            QMessageBox.warning(self, "Launch Failed", "File not found. Please use 'Configure Paths' to set the correct location.")
-            self.parent_window.update_status(f"❌ '{self.simulation['name']}' not found", MEDICAL_COLORS['error'])
+
+class SimulationGridView(QListView):
+    """Wrapping icon-mode list of cards; only visible cards are painted."""
+    launchRequested = pyqtSignal(int)
+    hoveredRowChanged = pyqtSignal(int)   # -1 when the mouse leaves the cards
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.hovered_row = -1
+        self.hover_pos = QPoint()
+        self.animator = HoverAnimator(self)
+
+        self.setViewMode(QListView.IconMode)
+        self.setResizeMode(QListView.Adjust)
+        self.setMovement(QListView.Static)
+        self.setWrapping(True)
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(100)
+        self.setGridSize(QSize(CARD_WIDTH + CARD_SPACING, CARD_HEIGHT + CARD_SPACING))
+        self.setSelectionMode(QListView.NoSelection)
+        self.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.verticalScrollBar().setSingleStep(30)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setMouseTracking(True)
+        self.setObjectName("CardGrid")
+        self.viewport().setCursor(Qt.PointingHandCursor)
+        self.setItemDelegate(SimulationCardDelegate(self))
+
+    def card_row_at(self, pos):
+        """Row of the card under pos, or -1 (the spacing between cards doesn't count)"""
+        index = self.indexAt(pos)
+        # Skeleton cards (not loaded yet) can't be hovered or launched
+        if index.isValid() and index.data(SimulationRole) is not None and SimulationCardDelegate.card_rect(self.visualRect(index)).contains(pos):
+            return index.row()
+        return -1
+
+    def set_hovered_row(self, row):
+        if row == self.hovered_row:
             return
-        
-        try:
-            # 1. Define the launch command (just the executable path)
-            launch_command = [exe_path]
-            
-            # 2. CRITICAL STEP: Get the directory where the .exe file resides
-            # This is the directory that must contain the *_Data folder.
-            cwd_path = os.path.dirname(exe_path)
-            
-            # 3. Launch the process, setting the CWD
-            process = subprocess.Popen(launch_command, cwd=cwd_path)
-            
-            print(f"Launching: {exe_path} (PID: {process.pid})")
-            
-            self.parent_window.update_status(
-                f"✅ Launching '{self.simulation['name']}'...", 
-                MEDICAL_COLORS['success']
-            )
-        except Exception as e:
-            QMessageBox.critical(
-                self, 
-                "Launch Error", 
-                f"Failed to launch simulation (Error):\n\n{str(e)}"
-            )
-            self.parent_window.update_status(
-                f"❌ Failed to launch '{self.simulation['name']}'", 
-                MEDICAL_COLORS['error']
-            )
-    
-    # --- Hover/Animation methods ---
-    def enterEvent(self, event):
-        self.anim = QPropertyAnimation(self, b"geometry")
-        self.anim.setDuration(250)
-        self.anim.setStartValue(self.geometry())
-        rect = self.geometry()
-        rect.translate(0, -10)
-        self.anim.setEndValue(rect)
-        self.anim.setEasingCurve(QEasingCurve.OutCubic)
-        self.anim.start()
-        self.shadow.setBlurRadius(35)
-        self.shadow.setOffset(0, 12)
-        super().enterEvent(event)
+        previous, self.hovered_row = self.hovered_row, row
+        for r, entering in ((previous, False), (row, True)):
+            if r >= 0:
+                self.animator.hover(r, entering)
+                self.update(self.model().index(r, 0))
+        self.hoveredRowChanged.emit(row)
+
+    def resizeEvent(self, event):
+        # Keep the reflowed columns centred like the old grid layout
+        cell = self.gridSize().width()
+        width = self.width() - self.verticalScrollBar().sizeHint().width()
+        margin = max(0, (width - max(1, width // cell) * cell) // 2)
+        self.setViewportMargins(margin, 0, 0, 0)
+        super().resizeEvent(event)
+
+    def mouseMoveEvent(self, event):
+        self.hover_pos = event.pos()
+        self.set_hovered_row(self.card_row_at(event.pos()))
+        if self.hovered_row >= 0:
+            self.update(self.model().index(self.hovered_row, 0))
+        super().mouseMoveEvent(event)
 
     def leaveEvent(self, event):
-        self.anim = QPropertyAnimation(self, b"geometry")
-        self.anim.setDuration(250)
-        self.anim.setStartValue(self.geometry())
-        rect = self.geometry()
-        rect.translate(0, 10)
-        self.anim.setEndValue(rect)
-        self.anim.setEasingCurve(QEasingCurve.OutCubic)
-        self.anim.start()
-        self.shadow.setBlurRadius(25)
-        self.shadow.setOffset(0, 8)
+        self.set_hovered_row(-1)
         super().leaveEvent(event)
 
     def mousePressEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            self.launch_simulation()
+        row = self.card_row_at(event.pos())
+        if event.button() == Qt.LeftButton and row >= 0:
+            self.launchRequested.emit(row)
+            return
+        super().mousePressEvent(event)
+
+
+class SearchBar(QLineEdit):
+    """Search field for the card grid: Up/Down move between hits, Esc clears."""
+    stepped = pyqtSignal(int)   # +1 / -1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("SearchBar")
+        self.setPlaceholderText("🔍 Search modules by name, description or tag • Enter launches the highlighted one")
+        self.setClearButtonEnabled(True)
+
+    def keyPressEvent(self, event):
+        if event.key() in (Qt.Key_Down, Qt.Key_Up):
+            self.stepped.emit(1 if event.key() == Qt.Key_Down else -1)
+        elif event.key() == Qt.Key_Escape:
+            self.clear()
+        else:
+            super().keyPressEvent(event)
+
+
+# ==========================================
+# 🔹 BUILD DISCOVERY DIALOG
+# ==========================================
+class DiscoveryBridge(QObject):
+    """Carries a finished background scan onto the UI thread."""
+    finished = pyqtSignal(object)
+
+
+class DiscoveryDialog(QDialog):
+    """Crawl root folders for Unity builds and offer them as paths for each module."""
+    KEEP_CURRENT = "(keep current path)"
+
+    def __init__(self, window):
+        super().__init__(window)
+        self.window = window
+        # Imported on first use: only this dialog needs it, so startup doesn't pay for it
+        import discovery_vr
+        self.scanner = discovery_vr.BuildScanner()
+        self.bridge = DiscoveryBridge(self)
+        self.bridge.finished.connect(self.show_matches)
+        self.combos = {}
+
+        self.setWindowTitle("Find Unity Builds")
+        self.resize(900, 560)
+        layout = QVBoxLayout(self)
+
+        info_label = QLabel("Builds are found under these folders (an executable next to its '<name>_Data' folder).")
+        info_label.setObjectName("DialogInfo")
+        layout.addWidget(info_label)
+
+        self.roots_list = QListWidget()
+        self.roots_list.addItems(window.catalog.get_setting("discovery_roots", []))
+        self.roots_list.setMaximumHeight(110)
+        layout.addWidget(self.roots_list)
+
+        root_buttons = QHBoxLayout()
+        for text, handler in (("Add Folder...", self.add_root), ("Remove Folder", self.remove_root),
+                              ("🔍 Scan", self.start_scan)):
+            button = QPushButton(text)
+            button.setObjectName("BrowseBtn")
+            button.clicked.connect(handler)
+            root_buttons.addWidget(button)
+        root_buttons.addStretch()
+        layout.addLayout(root_buttons)
+
+        self.result_label = QLabel("Press Scan to look for builds.")
+        self.result_label.setObjectName("PathLabel")
+        layout.addWidget(self.result_label)
+
+        self.table = QTableWidget(0, 2)
+        self.table.setHorizontalHeaderLabels(["Module", "Build"])
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        layout.addWidget(self.table)
+
+        self.btn_apply = QPushButton("Apply Selected Paths")
+        self.btn_apply.setObjectName("ConfigBtn")
+        self.btn_apply.setEnabled(False)
+        self.btn_apply.clicked.connect(self.apply)
+        layout.addWidget(self.btn_apply, alignment=Qt.AlignRight)
+
+    def roots(self):
+        return [self.roots_list.item(i).text() for i in range(self.roots_list.count())]
+
+    def add_root(self):
+        folder = QFileDialog.getExistingDirectory(self, "Folder containing Unity builds")
+        if folder and folder not in self.roots():
+            self.roots_list.addItem(folder)
+            self.window.catalog.set_setting("discovery_roots", self.roots())
+
+    def remove_root(self):
+        for item in self.roots_list.selectedItems():
+            self.roots_list.takeItem(self.roots_list.row(item))
+        self.window.catalog.set_setting("discovery_roots", self.roots())
+
+    def start_scan(self):
+        """Crawl on a worker thread; show_matches runs when it is done"""
+        roots = self.roots()
+        if not roots:
+            self.result_label.setText("Add at least one folder to scan.")
+            return
+        self.result_label.setText("Scanning...")
+        self.btn_apply.setEnabled(False)
+        threading.Thread(
+            target=lambda: self.bridge.finished.emit(self.scanner.scan(roots)),
+            name="discovery-scan", daemon=True
+        ).start()
+
+    def show_matches(self, result):
+        self.window.load_all_simulations()
+        import discovery_vr
+        matches = discovery_vr.match_builds(self.window.SIMULATIONS, result.builds)
+        self.result_label.setText(
+            f"Found {len(result.builds)} builds • {result.listed} folders read, {result.reused} unchanged"
+        )
+
+        self.table.setRowCount(len(self.window.SIMULATIONS))
+        self.combos = {}
+        for row, sim in enumerate(self.window.SIMULATIONS):
+            self.table.setItem(row, 0, QTableWidgetItem(sim["name"]))
+            combo = QComboBox()
+            combo.addItem(self.KEEP_CURRENT)
+            # Best match first, the rest of the builds after it
+            candidates = matches[sim["name"]]
+            combo.addItems(candidates + [b for b in result.builds if b not in candidates])
+            if candidates and candidates[0] != sim["exe_path"]:
+                combo.setCurrentIndex(1)
+            self.table.setCellWidget(row, 1, combo)
+            self.combos[sim["name"]] = combo
+        self.btn_apply.setEnabled(bool(result.builds))
+
+    def apply(self):
+        """Save every module whose build selection differs from its current path"""
+        changed = 0
+        for index, sim in enumerate(self.window.SIMULATIONS):
+            combo = self.combos.get(sim["name"])
+            if combo is None or combo.currentText() == self.KEEP_CURRENT:
+                continue
+            if combo.currentText() != sim["exe_path"]:
+                sim["exe_path"] = combo.currentText()
+                self.window.catalog.set_exe_path(sim["name"], sim["exe_path"])
+                self.window.update_simulation_card(index)
+                changed += 1
+        self.window.refresh_exe_status()
+        self.window.update_status(f"🔍 Updated {changed} simulation paths from discovered builds", MEDICAL_COLORS['success'])
+        self.accept()
+
+
+# ==========================================
+# 🔹 LOG VIEWER
+# ==========================================
+class LogViewerDialog(QDialog):
+    """
+    Live view of a module's captured output. New lines are appended from the
+    ring buffer on a timer, a batch at a time; searching or changing the
+    severity filter rebuilds the view from the buffer (at most BUFFER_LINES).
+    """
+    REFRESH_MS = 250
+    LEVELS = [("All messages", logs_vr.DEBUG), ("Warnings and errors", logs_vr.WARNING), ("Errors only", logs_vr.ERROR)]
+
+    def __init__(self, window, name=None):
+        super().__init__(window)
+        self.window = window
+        self.log = None
+        self.next_seq = 0
+        self.setWindowTitle("Simulation Logs")
+        self.resize(1000, 620)
+        layout = QVBoxLayout(self)
+
+        controls = QHBoxLayout()
+        self.module_combo = QComboBox()
+        self.module_combo.addItems(window.logs.names())
+        if name is not None and self.module_combo.findText(name) >= 0:
+            self.module_combo.setCurrentText(name)
+        self.module_combo.currentTextChanged.connect(self.select_module)
+        controls.addWidget(self.module_combo)
+
+        self.search = QLineEdit()
+        self.search.setPlaceholderText("Search...")
+        self.search.setClearButtonEnabled(True)
+        controls.addWidget(self.search, 1)
+
+        self.level_combo = QComboBox()
+        self.level_combo.addItems([label for label, _level in self.LEVELS])
+        controls.addWidget(self.level_combo)
+
+        self.follow = QCheckBox("Follow")
+        self.follow.setChecked(True)
+        controls.addWidget(self.follow)
+        layout.addLayout(controls)
+
+        self.view = QPlainTextEdit()
+        self.view.setReadOnly(True)
+        self.view.setUndoRedoEnabled(False)
+        self.view.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.view.setMaximumBlockCount(logs_vr.BUFFER_LINES)
+        self.view.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        layout.addWidget(self.view)
+
+        footer = QHBoxLayout()
+        self.info_label = QLabel()
+        self.info_label.setObjectName("PathLabel")
+        footer.addWidget(self.info_label, 1)
+        btn_folder = QPushButton("Open Log Folder")
+        btn_folder.setObjectName("BrowseBtn")
+        btn_folder.clicked.connect(self.open_folder)
+        footer.addWidget(btn_folder)
+        layout.addLayout(footer)
+
+        # Typing re-filters after a short pause rather than on every key
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(150)
+        self.filter_timer.timeout.connect(self.rebuild)
+        self.search.textChanged.connect(self.filter_timer.start)
+        self.level_combo.currentIndexChanged.connect(self.rebuild)
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(self.REFRESH_MS)
+        self.refresh_timer.timeout.connect(self.append_new)
+        self.refresh_timer.start()
+
+        self.select_module(self.module_combo.currentText())
+
+    def matches(self, line):
+        if line.level < self.LEVELS[self.level_combo.currentIndex()][1]:
+            return False
+        needle = self.search.text().casefold()
+        return not needle or needle in line.text.casefold()
+
+    def select_module(self, name):
+        self.log = self.window.logs.get(name) if name else None
+        self.rebuild()
+
+    def rebuild(self):
+        """Re-fill the view with every buffered line that passes the filters"""
+        self.view.clear()
+        self.next_seq = 0
+        if self.log is None:
+            self.info_label.setText("No simulation output captured yet. Logs appear here after a launch.")
+            return
+        self.append_new()
+
+    def append_new(self):
+        """Append lines that arrived since the last refresh"""
+        if self.log is None:
+            return
+        lines = self.log.buffer.since(self.next_seq)
+        if lines:
+            self.next_seq = lines[-1].seq + 1
+            shown = [line for line in lines if self.matches(line)]
+            if shown:
+                bar = self.view.verticalScrollBar()
+                at_bottom = bar.value() == bar.maximum()
+                self.view.appendPlainText(logs_vr.format_lines(shown))
+                if self.follow.isChecked() and at_bottom:
+                    bar.setValue(bar.maximum())
+        dropped = self.log.buffer.dropped
+        older = f" • {dropped:,} older lines only on disk" if dropped else ""
+        lost = f" • {self.log.lost:,} lines not written (disk busy)" if self.log.lost else ""
+        self.info_label.setText(f"{self.log.path}{older}{lost}")
+
+    def open_folder(self):
+        folder = os.path.dirname(self.log.path) if self.log is not None else logs_vr.module_log_dir("")
+        QDesktopServices.openUrl(QUrl.fromLocalFile(folder))
+
+
+# ==========================================
+# 🔹 PROCESS OPTIONS
+# ==========================================
+class ProcessOptionsDialog(QDialog):
+    """Per-module CPU affinity, priority, nice value and launch profile, applied each time the module starts."""
+    INHERIT = "(inherit)"
+    NICE_AUTO = -21   # spin box value shown as "auto"
+
+    def __init__(self, window):
+        super().__init__(window)
+        self.window = window
+        self.setWindowTitle("Process Options")
+        self.resize(900, 560)
+        layout = QVBoxLayout(self)
+
+        info_label = QLabel(
+            f"CPUs: e.g. 2-7 or 0,2,4 (empty = all {os.cpu_count() or 1}). "
+            "Nice overrides the priority on Linux/macOS; raising priority there needs privileges."
+        )
+        info_label.setObjectName("DialogInfo")
+        info_label.setWordWrap(True)
+        layout.addWidget(info_label)
+
+        profiles = window.profiles
+        probe = profiles.hardware()
+        machine = profiles.machine_tier()
+        if probe is not None:
+            profile_label = QLabel(
+                f"This PC: {probe['cores']} CPUs, {probe['memory_gb']} GB RAM, CPU score {probe['cpu_score']} • "
+                f"automatic launch profile: {machine} ({profiles.profile(machine).describe()}). "
+                "Modules that keep crashing on automatic step down a profile."
+            )
+        else:
+            profile_label = QLabel(
+                "This PC is still being measured • automatic launch profiles use "
+                f"'{profiles_vr.DEFAULT}' until then."
+            )
+        profile_label.setObjectName("DialogInfo")
+        profile_label.setWordWrap(True)
+        layout.addWidget(profile_label)
+
+        saved = launch_vr.saved_options(window.catalog)
+        self.table = QTableWidget(len(window.SIMULATIONS), 5)
+        self.table.setHorizontalHeaderLabels(["Module", "Priority", "CPUs", "Nice", "Launch profile"])
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        self.rows = []
+        for row, sim in enumerate(window.SIMULATIONS):
+            options = saved.get(sim["name"]) or process_vr.ProcessOptions()
+            self.table.setItem(row, 0, QTableWidgetItem(sim["name"]))
+            priority = QComboBox()
+            priority.addItems([self.INHERIT, *process_vr.PRIORITIES])
+            priority.setCurrentText(options.priority or self.INHERIT)
+            self.table.setCellWidget(row, 1, priority)
+            cpus = QLineEdit(process_vr.format_cpus(options.affinity or []))
+            cpus.setPlaceholderText("all")
+            self.table.setCellWidget(row, 2, cpus)
+            nice = QSpinBox()
+            nice.setRange(self.NICE_AUTO, 19)
+            nice.setSpecialValueText("auto")
+            nice.setValue(options.nice if options.nice is not None else self.NICE_AUTO)
+            self.table.setCellWidget(row, 3, nice)
+            profile = QComboBox()
+            current, source = profiles.choice(sim["name"])
+            automatic = f"{profiles_vr.AUTO} ({current}{', learned' if source == profiles_vr.LEARNED else ''})"
+            profile.addItem(automatic, profiles_vr.AUTO)
+            for name in (profiles_vr.DEFAULT, *profiles_vr.TIERS):
+                profile.addItem(name, name)
+            if source == profiles_vr.CHOSEN:
+                profile.setCurrentIndex(profile.findData(current))
+            self.table.setCellWidget(row, 4, profile)
+            self.rows.append((sim["name"], priority, cpus, nice, profile))
+        layout.addWidget(self.table)
+
+        self.error_label = QLabel()
+        self.error_label.setObjectName("PathLabel")
+        layout.addWidget(self.error_label)
+
+        btn_save = QPushButton("Save")
+        btn_save.setObjectName("ConfigBtn")
+        btn_save.clicked.connect(self.save)
+        layout.addWidget(btn_save, alignment=Qt.AlignRight)
+
+    def save(self):
+        options = {}
+        for name, priority, cpus, nice, _profile in self.rows:
+            try:
+                options[name] = process_vr.ProcessOptions(
+                    process_vr.parse_cpus(cpus.text()),
+                    None if priority.currentText() == self.INHERIT else priority.currentText(),
+                    None if nice.value() == self.NICE_AUTO else nice.value(),
+                )
+            except ValueError as e:
+                self.error_label.setText(f"⚠️ {name}: {e}")
+                return
+        launch_vr.save_options(self.window.catalog, options)
+        for name, _priority, _cpus, _nice, profile in self.rows:
+            chosen = self.window.profiles.choice(name)
+            if profile.currentData() != profiles_vr.AUTO or chosen[1] == profiles_vr.CHOSEN:
+                self.window.profiles.choose(name, profile.currentData())
+        configured = sum(1 for o in options.values() if o)
+        self.window.update_status(
+            f"⚙️ Process options saved for {configured} modules (applied from their next launch)",
+            MEDICAL_COLORS['primary']
+        )
+        self.accept()
+
+
+# ==========================================
+# 🔹 WARM STANDBY SETTINGS
+# ==========================================
+class StandbyDialog(QDialog):
+    """Choose the modules kept running in the background, their memory budget and the keep-warm policy."""
+    POLICIES = [("Most recently used", "lru"), ("Most often used", "frequency")]
+
+    def __init__(self, window):
+        super().__init__(window)
+        self.window = window
+        settings = window.standby.settings
+        self.setWindowTitle("Warm Standby")
+        self.resize(520, 560)
+        layout = QVBoxLayout(self)
+
+        info_label = QLabel(
+            "Checked modules are started minimised in the background, so launching one "
+            "only brings it forward. They are closed again when a launch needs the memory. "
+            "A standby instance runs windowed; when it is brought forward it fills the screen "
+            "borderless (unless its launch profile is windowed), not in exclusive fullscreen."
+        )
+        info_label.setObjectName("DialogInfo")
+        info_label.setWordWrap(True)
+        layout.addWidget(info_label)
+
+        self.enabled = QCheckBox("Keep modules warm")
+        self.enabled.setChecked(settings["enabled"])
+        layout.addWidget(self.enabled)
+
+        self.modules = QListWidget()
+        for sim in window.SIMULATIONS:
+            self.modules.addItem(sim["name"])
+            item = self.modules.item(self.modules.count() - 1)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked if sim["name"] in settings["modules"] else Qt.Unchecked)
+        layout.addWidget(self.modules)
+
+        options = QGridLayout()
+        options.addWidget(QLabel("Memory budget"), 0, 0)
+        self.budget = QSpinBox()
+        self.budget.setRange(512, 256 * 1024)
+        self.budget.setSingleStep(512)
+        self.budget.setSuffix(" MB")
+        self.budget.setValue(settings["budget_mb"])
+        options.addWidget(self.budget, 0, 1)
+        options.addWidget(QLabel("Keep warm first"), 1, 0)
+        self.policy = QComboBox()
+        self.policy.addItems([label for label, _policy in self.POLICIES])
+        self.policy.setCurrentIndex(next(
+            (i for i, (_label, policy) in enumerate(self.POLICIES) if policy == settings["policy"]), 0
+        ))
+        options.addWidget(self.policy, 1, 1)
+        layout.addLayout(options)
+
+        btn_save = QPushButton("Save")
+        btn_save.setObjectName("ConfigBtn")
+        btn_save.clicked.connect(self.save)
+        layout.addWidget(btn_save, alignment=Qt.AlignRight)
+
+    def save(self):
+        modules = [self.modules.item(i).text() for i in range(self.modules.count())
+                   if self.modules.item(i).checkState() == Qt.Checked]
+        self.window.standby.configure(
+            enabled=self.enabled.isChecked(),
+            modules=modules,
+            budget_mb=self.budget.value(),
+            policy=self.POLICIES[self.policy.currentIndex()][1],
+        )
+        state = f"on for {len(modules)} modules" if self.enabled.isChecked() else "off"
+        self.window.update_status(f"🔥 Warm standby {state}", MEDICAL_COLORS['primary'])
+        self.accept()
+
+
+# ==========================================
+# 🔹 BUILD CACHE SETTINGS
+# ==========================================
+class BuildCacheDialog(QDialog):
+    """Choose the share folders whose builds run from a local copy, and the cache's disk quota."""
+
+    def __init__(self, window):
+        super().__init__(window)
+        self.window = window
+        service = window.build_cache
+        settings = service.settings
+        self.setWindowTitle("Local Build Cache")
+        self.resize(640, 560)
+        layout = QVBoxLayout(self)
+
+        info_label = QLabel(
+            "Builds under these folders are copied to this computer and launched from there. "
+            "Updates on the share are synced in the background (only the changed parts are copied); "
+            "the least recently launched builds are removed when the cache is full."
+        )
+        info_label.setObjectName("DialogInfo")
+        info_label.setWordWrap(True)
+        layout.addWidget(info_label)
+
+        self.enabled = QCheckBox("Run builds from a local copy")
+        self.enabled.setChecked(settings["enabled"])
+        layout.addWidget(self.enabled)
+
+        self.roots = QListWidget()
+        self.roots.addItems(settings["share_roots"])
+        layout.addWidget(self.roots)
+        roots_layout = QHBoxLayout()
+        btn_add = QPushButton("Add Share Folder...")
+        btn_add.setObjectName("BrowseBtn")
+        btn_add.clicked.connect(self.add_root)
+        roots_layout.addWidget(btn_add)
+        btn_remove = QPushButton("Remove")
+        btn_remove.setObjectName("BrowseBtn")
+        btn_remove.clicked.connect(lambda: self.roots.takeItem(self.roots.currentRow()))
+        roots_layout.addWidget(btn_remove)
+        roots_layout.addStretch()
+        roots_layout.addWidget(QLabel("Disk quota"))
+        self.quota = QSpinBox()
+        self.quota.setRange(1, 64 * 1024)
+        self.quota.setSuffix(" GB")
+        self.quota.setValue(int(settings["quota_gb"]))
+        roots_layout.addWidget(self.quota)
+        layout.addLayout(roots_layout)
+
+        builds = service.cache.builds()
+        table = QTableWidget(len(builds), 3)
+        table.setHorizontalHeaderLabels(["Module", "Size", "Synced"])
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        table.verticalHeader().setVisible(False)
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        for row, (name, build) in enumerate(sorted(builds.items())):
+            table.setItem(row, 0, QTableWidgetItem(name))
+            table.setItem(row, 1, QTableWidgetItem(f"{build['bytes'] / 1024 ** 3:.2f} GB"))
+            table.setItem(row, 2, QTableWidgetItem(telemetry_vr.iso_time(build["synced_at"]).replace("T", " ")))
+        layout.addWidget(table)
+        used = sum(build["bytes"] for build in builds.values())
+        layout.addWidget(QLabel(f"{len(builds)} builds cached • {used / 1024 ** 3:.2f} GB in {service.cache.root}"))
+
+        btn_save = QPushButton("Save and Sync Now")
+        btn_save.setObjectName("ConfigBtn")
+        btn_save.clicked.connect(self.save)
+        layout.addWidget(btn_save, alignment=Qt.AlignRight)
+
+    def add_root(self):
+        folder = QFileDialog.getExistingDirectory(self, "Folder the builds are published in")
+        if folder and not self.roots.findItems(folder, Qt.MatchExactly):
+            self.roots.addItem(folder)
+
+    def save(self):
+        roots = [self.roots.item(i).text() for i in range(self.roots.count())]
+        self.window.build_cache.configure(
+            enabled=self.enabled.isChecked(),
+            share_roots=roots,
+            quota_gb=self.quota.value(),
+        )
+        state = f"on for {len(roots)} share folders" if self.enabled.isChecked() else "off"
+        self.window.update_status(f"💾 Local build cache {state}", MEDICAL_COLORS['primary'])
+        self.accept()
 
 
 # ==========================================
@@ -369,12 +1435,86 @@ class SimulationCard(QFrame):
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.SIMULATIONS = INITIAL_SIMULATIONS
-        self.simulation_cards = []
+        # Modules come from the persistent catalogue; SIMULATIONS holds the
+        # entries loaded so far (the card model pages in the rest on demand)
+        self.catalog = catalog_vr.Catalog()
+        self.SIMULATIONS = []
+        
+        # Path checks run in the background; cards read the cached result
+        self.status_service = StatusService(self)
+        self.status_service.statusChanged.connect(self.on_exe_status_changed)
+        
+        # Launch services shared with the network agent (station_vr): every
+        # launched simulation is owned by the supervisor; launches go through
+        # the scheduler, which admits, queues or blocks them depending on free
+        # RAM/CPU and each module's learned cost; chosen modules can be kept
+        # running minimised so switching to one is instant; builds on the
+        # share run from a local copy, synced in the background; Unity
+        # resolution/quality arguments are picked per module from a one-time
+        # hardware probe. Their worker threads report back through queued signals.
+        self.supervisor_bridge = SupervisorBridge(self)
+        self.supervisor_bridge.processChanged.connect(self.on_process_changed)
+        self.scheduler_bridge = SchedulerBridge(self)
+        self.scheduler_bridge.queueEvent.connect(self.on_queue_event)
+        self.standby_bridge = StandbyBridge(self)
+        self.standby_bridge.standbyEvent.connect(self.on_standby_event)
+        self.caching = set()
+        self.build_cache_bridge = BuildCacheBridge(self)
+        self.build_cache_bridge.cacheEvent.connect(self.on_build_cache_event)
+        self.profile_bridge = ProfileBridge(self)
+        self.profile_bridge.profileChanged.connect(self.on_profile_changed)
+        self.profile_bridge.probed.connect(self.on_hardware_probed)
+        self.station = station_vr.Station(
+            self.catalog,
+            on_process=self.supervisor_bridge.processChanged.emit,
+            on_queue=self.scheduler_bridge.queueEvent.emit,
+            on_standby=self.standby_bridge.standbyEvent.emit,
+            on_cache=self.build_cache_bridge.cacheEvent.emit,
+            on_profile=self.profile_bridge.profileChanged.emit,
+            on_probed=self.profile_bridge.probed.emit,
+            standby=True,
+        )
+        self.supervisor = self.station.supervisor
+        self.metrics = self.station.metrics
+        self.sessions = self.station.sessions
+        self.logs = self.station.logs
+        self.profiles = self.station.profiles
+        self.scheduler = self.station.scheduler
+        self.standby = self.station.standby
+        self.build_cache = self.station.build_cache
+        
+        # Build verification (structure + manifest hashes) in the background
+        self.integrity_results = {}
+        self.awaiting_verification = {}   # module name -> LaunchTrace of a click made before its check finished
+        self.integrity_bridge = IntegrityBridge(self)
+        self.integrity_bridge.verified.connect(self.on_build_verified)
+        self.integrity = integrity_vr.IntegrityChecker(on_result=self.integrity_bridge.verified.emit)
+        
+        # Page-cache warmer for cold starts (optional)
+        self.prefetcher = None
+        if PREFETCH_SETTINGS["enabled"]:
+            self.prefetcher = prefetch_vr.Prefetcher(budget_mb=PREFETCH_SETTINGS["budget_mb"])
+            self.prefetch_schedule = QTimer(self)
+            self.prefetch_schedule.timeout.connect(self.prefetch_favorites)
+            if PREFETCH_SETTINGS["interval_minutes"]:
+                self.prefetch_schedule.start(PREFETCH_SETTINGS["interval_minutes"] * 60 * 1000)
+        
+        # Resting the mouse on a card warms its build before the click
+        self.prefetch_timer = QTimer(self)
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.setInterval(PREFETCH_SETTINGS["hover_delay_ms"])
+        self.prefetch_timer.timeout.connect(self.prefetch_hovered)
+        
+        # Ticks the runtime shown on cards while something is running
+        self.runtime_timer = QTimer(self)
+        self.runtime_timer.setInterval(1000)
+        self.runtime_timer.timeout.connect(self.refresh_running_cards)
+        self.low_power = False
         
         self.setWindowTitle("Surgical Simulation Suite")
         self.setGeometry(100, 50, 1600, 900)
-        self.setStyleSheet(STYLESHEET)
+        with STARTUP.phase("stylesheet"):
+            self.setStyleSheet(STYLESHEET)
 
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -401,8 +1541,9 @@ class MainWindow(QMainWindow):
         main_layout.addSpacing(10)
 
         # Configuration Button (Uses the dynamic path method)
-        config_layout = QVBoxLayout()
+        config_layout = QHBoxLayout()
         config_layout.setAlignment(Qt.AlignCenter)
+        config_layout.setSpacing(15)
         
         btn_config = QPushButton("⚙️ Configure Simulation Paths")
         btn_config.setObjectName("ConfigBtn")
@@ -411,70 +1552,576 @@ class MainWindow(QMainWindow):
         btn_config.setFixedWidth(300)
         config_layout.addWidget(btn_config)
         
-        main_layout.addLayout(config_layout)
-        main_layout.addSpacing(20)
-
-        # Scroll Area for Cards
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setFrameShape(QFrame.NoFrame)
-        self.scroll_area.setStyleSheet("background: transparent; border: none;")
+        btn_metrics = QPushButton("📊 Launch Metrics")
+        btn_metrics.setObjectName("ConfigBtn")
+        btn_metrics.setCursor(Qt.PointingHandCursor)
+        btn_metrics.clicked.connect(self.show_metrics_dialog)
+        btn_metrics.setFixedWidth(220)
+        config_layout.addWidget(btn_metrics)
         
-        self.scroll_content = QWidget()
-        self.scroll_content.setStyleSheet("background: transparent;")
+        btn_logs = QPushButton("📜 Logs")
+        btn_logs.setObjectName("ConfigBtn")
+        btn_logs.setCursor(Qt.PointingHandCursor)
+        btn_logs.clicked.connect(lambda: self.show_log_viewer())
+        btn_logs.setFixedWidth(140)
+        config_layout.addWidget(btn_logs)
         
-        self.grid_layout = QGridLayout(self.scroll_content)
-        self.grid_layout.setSpacing(35)
-        self.grid_layout.setAlignment(Qt.AlignTop | Qt.AlignHCenter)
+        main_layout.addLayout(config_layout)
+        main_layout.addSpacing(10)
+
+        # Filters the grid as you type; Enter launches the highlighted hit
+        self.search_bar = SearchBar()
+        self.search_bar.setFixedWidth(640)
+        self.search_bar.textChanged.connect(self.apply_search)
+        self.search_bar.returnPressed.connect(self.launch_search_hit)
+        self.search_bar.stepped.connect(lambda step: self.pick_search_hit(self.search_pick + step))
+        QShortcut(QKeySequence.Find, self, activated=self.search_bar.setFocus)
+        main_layout.addWidget(self.search_bar, alignment=Qt.AlignCenter)
+        main_layout.addSpacing(10)
 
-        self.create_simulation_cards()
+        # Card grid (scrolls and reflows by itself)
+        # Name/description/tag index of the loaded cards, keyed by row
+        self.search_index = search_vr.SearchIndex()
+        self.search_hits = []
+        self.search_pick = 0
+        self.hidden_rows = set()
+        self.card_view = SimulationGridView()
+        self.card_view.launchRequested.connect(self.launch_simulation)
+        self.card_view.hoveredRowChanged.connect(self.on_card_hovered)
+
+        # Cards fill in after the window is up; until then the grid shows skeletons
+        self.fill_timer = QTimer(self)
+        self.fill_timer.setInterval(0)
+        self.fill_timer.timeout.connect(self.fill_cards)
+        self.create_simulation_cards(progressive=True)
+        if STARTUP.enabled:
+            self.card_view.viewport().installEventFilter(self)
         
-        self.scroll_area.setWidget(self.scroll_content)
-        main_layout.addWidget(self.scroll_area)
+        main_layout.addWidget(self.card_view)
 
         # Status Bar
         status_container = QFrame()
-        status_container.setStyleSheet(f"""
-            background-color: {MEDICAL_COLORS['card_bg']};
-            border-radius: 10px;
-            padding: 10px;
-            border: 1px solid #E2E8F0;
-        """)
+        status_container.setObjectName("StatusBar")
         status_layout = QVBoxLayout(status_container)
         
         self.status_label = QLabel("🟢 System Ready • Waiting for input")
-        self.status_label.setStyleSheet(f"color: {MEDICAL_COLORS['text_light']}; font-size: 13px; font-weight: 500;")
+        self.status_label.setObjectName("StatusMessage")
+        self.status_label.setProperty("tone", "text_light")
         self.status_label.setAlignment(Qt.AlignCenter)
         status_layout.addWidget(self.status_label)
         
         main_layout.addWidget(status_container)
 
-    def create_simulation_cards(self):
-        """Create and display all simulation cards"""
-        row, col = 0, 0
-        max_cols = 6 
+        self.refresh_exe_status()
+        # Typing starts a search straight away
+        self.search_bar.setFocus()
+        STARTUP.mark("window_built")
+
+    def eventFilter(self, obj, event):
+        """Startup profiling only: note the first paint of the card grid, then the first one with real cards"""
+        if event.type() == QEvent.Paint and obj is self.card_view.viewport():
+            STARTUP.mark("first_paint")
+            if "cards_filled" in STARTUP.milestones:
+                STARTUP.mark("cards_painted")
+                obj.removeEventFilter(self)
+                QTimer.singleShot(0, STARTUP.report)
+        return super().eventFilter(obj, event)
+
+    def refresh_exe_status(self):
+        """Ask the status service to (re)check every configured executable"""
+        self.status_service.watch([sim["exe_path"] for sim in self.SIMULATIONS])
+
+    def on_exe_status_changed(self, exe_path):
+        """Refresh the cards that point at exe_path"""
+        if self.status_service.status(exe_path):
+            self.integrity.request(exe_path)
+        else:
+            self.integrity_results.pop(exe_path, None)
+        for index, sim in enumerate(self.SIMULATIONS):
+            if sim["exe_path"] == exe_path:
+                self.update_simulation_card(index)
+                # Favourites are warmed as soon as we know their build is there
+                if sim.get("favorite") and self.status_service.status(exe_path):
+                    self.prefetch(exe_path)
+
+    def on_build_verified(self, result):
+        """Store a verification result and repaint the cards using that build"""
+        # A build that vanished during the check has no result worth keeping
+        if self.status_service.status(result.exe_path):
+            self.integrity_results[result.exe_path] = result
+        for index, sim in enumerate(self.SIMULATIONS):
+            if sim["exe_path"] == result.exe_path:
+                waiting = self.awaiting_verification.pop(sim["name"], None)
+                self.update_simulation_card(index)
+                # A launch clicked while the check ran goes ahead, or fails (missing or incomplete), now
+                if waiting is not None:
+                    self.launch_simulation(index, waiting)
+
+    def build_is_complete(self, exe_path):
+        """True once verification has passed, False if it found a problem, None while it is still running"""
+        result = self.integrity_results.get(exe_path)
+        if result is None:
+            return None
+        return result.state == integrity_vr.OK
+
+    def prefetch(self, exe_path):
+        """Warm a build's data files unless prefetching is off"""
+        if self.prefetcher is not None:
+            self.prefetcher.request(exe_path)
+
+    def on_card_hovered(self, row):
+        if PREFETCH_SETTINGS["enabled"] and PREFETCH_SETTINGS["on_hover"] and row >= 0:
+            self.prefetch_timer.start()
+        else:
+            self.prefetch_timer.stop()
+
+    def prefetch_hovered(self):
+        """Warm the *_Data folder of the card under the mouse"""
+        row = self.card_view.hovered_row
+        if row >= 0:
+            exe_path = self.SIMULATIONS[row]["exe_path"]
+            if self.status_service.status(exe_path):
+                self.prefetch(exe_path)
+                # Cheap with the hash cache; catches a build re-copied since the last check
+                self.integrity.request(exe_path)
+
+    def prefetch_favorites(self):
+        """Scheduled re-warm of every favourite module that is present"""
+        for sim in self.catalog.favorites():
+            if self.status_service.status(sim["exe_path"]):
+                self.prefetch(sim["exe_path"])
+
+    def on_process_changed(self, name):
+        """A simulation started or ended: refresh its card and the status bar"""
+        for index, sim in enumerate(self.SIMULATIONS):
+            if sim["name"] == name:
+                self.update_simulation_card(index)
+        
+        record = self.supervisor.get(name)
+        if self.standby.was_released(record) or self.standby.is_standby(name):
+            pass  # standby instances come and go quietly; see on_standby_event
+        elif record is not None and record.state == process_vr.CRASHED:
+            self.update_status(f"💥 '{name}' crashed (exit code {record.returncode}) • see 📜 Logs", MEDICAL_COLORS['error'])
+        elif record is not None and record.state == process_vr.EXITED:
+            self.update_status(f"⏹ '{name}' closed after {process_vr.format_runtime(record.runtime)}")
+        
+        self.update_power_mode()
+
+    def update_power_mode(self):
+        """Enter or leave low-power mode as simulations start and end, and as the window gains or loses focus"""
+        running = self.supervisor.running()
+        sessions = [record for record in running if not self.standby.is_standby(record.name)]
+        # Hover animations are switched off while a simulation needs the GPU
+        self.card_view.animator.set_enabled(not sessions)
+        
+        low_power = bool(sessions) and LOW_POWER_SETTINGS["enabled"]
+        if low_power != self.low_power:
+            self.low_power = low_power
+            if low_power:
+                # Re-rendered on the next paint; until then the memory is better spent on the simulation
+                self.card_view.itemDelegate().pixmaps.clear()
+                if self.prefetcher is not None:
+                    self.prefetch_schedule.stop()
+            elif self.prefetcher is not None and PREFETCH_SETTINGS["interval_minutes"]:
+                self.prefetch_schedule.start()
+            if sys.platform == "win32":
+                # Only on Windows: a POSIX process can't raise its nice value back without privileges
+                try:
+                    process_vr.set_priority(os.getpid(), LOW_POWER_SETTINGS["priority"] if low_power else "normal")
+                except OSError as e:
+                    self.update_status(f"⚠️ Could not change the launcher's priority: {e}", MEDICAL_COLORS['error'])
+        
+        # Nothing to repaint while the launcher sits behind the simulation
+        visible = not low_power or self.isActiveWindow()
+        if self.card_view.updatesEnabled() != visible:
+            self.card_view.setUpdatesEnabled(visible)
+        if running and visible:
+            if not self.runtime_timer.isActive():
+                self.runtime_timer.start()
+        else:
+            self.runtime_timer.stop()
+
+    def changeEvent(self, event):
+        if event.type() in (QEvent.ActivationChange, QEvent.WindowStateChange):
+            self.update_power_mode()
+        super().changeEvent(event)
+
+    def refresh_running_cards(self):
+        running = {record.name for record in self.supervisor.running()}
+        for index, sim in enumerate(self.SIMULATIONS):
+            if sim["name"] in running:
+                self.update_simulation_card(index)
+
+    def closeEvent(self, event):
+        self.status_service.stop()
+        if self.prefetcher is not None:
+            self.prefetcher.stop()
+        self.integrity.stop()
+        self.station.stop()
+        self.catalog.close()
+        super().closeEvent(event)
+
+    def create_simulation_cards(self, progressive=False):
+        """
+        Attach the card model to the grid; cards are painted on demand.
+        progressive=True shows skeleton cards at once and loads the first page
+        in small batches from the event loop, so the window never waits on it.
+        """
+        self.fill_timer.stop()
+        self.card_view.animator.reset()
+        self.search_index.clear()
+        self.hidden_rows = set()
+        self.SIMULATIONS = []
+        self.card_model = SimulationListModel(self, skeleton=CARD_FILL_BATCH * 2 if progressive else 0)
+        self.card_view.setModel(self.card_model)
+        if progressive:
+            self.fill_timer.start()
+        elif self.card_model.canFetchMore():
+            self.card_model.fetchMore()
+
+    def apply_search(self, text):
+        """Show only the cards matching the search; the best hit is highlighted for Enter"""
+        if text.strip():
+            # Searching covers the whole catalogue, not just the pages loaded so far
+            self.load_all_simulations()
+        hits = self.search_index.search(text)
+        hidden = set() if hits is None else set(range(len(self.SIMULATIONS))).difference(hits)
+        # Only cards whose visibility changes are touched
+        for row in hidden.symmetric_difference(self.hidden_rows):
+            self.card_view.setRowHidden(row, row in hidden)
+        self.hidden_rows = hidden
+        self.search_hits = hits or []
+        self.pick_search_hit(0)
+        if hits is not None:
+            self.update_status(f"🔍 {len(hits)} module{'s' if len(hits) != 1 else ''} match '{text.strip()}'",
+                               MEDICAL_COLORS['primary'] if hits else MEDICAL_COLORS['error'])
+
+    def pick_search_hit(self, position):
+        """Highlight one of the search hits (wrapping around) and scroll it into view"""
+        if not self.search_hits:
+            self.search_pick = 0
+            self.card_view.set_hovered_row(-1)
+            return
+        self.search_pick = position % len(self.search_hits)
+        row = self.search_hits[self.search_pick]
+        self.card_view.set_hovered_row(row)
+        self.card_view.scrollTo(self.card_model.index(row, 0))
+
+    def launch_search_hit(self):
+        """Enter in the search bar: launch the highlighted hit as if its card was clicked"""
+        if self.search_hits:
+            self.launch_simulation(self.search_hits[self.search_pick])
+
+    def fill_cards(self):
+        """One progressive-fill step; stops itself once the first page is loaded"""
+        with STARTUP.phase("cards"):
+            more = self.card_model.fill(CARD_FILL_BATCH)
+        if not more:
+            self.fill_timer.stop()
+            STARTUP.mark("cards_filled")
+            self.card_view.viewport().update()
+
+    def card_status(self, index):
+        """Status line and launch button state for a card, from the cached exe status and the supervisor"""
+        sim = self.SIMULATIONS[index]
+        exists = self.status_service.status(sim["exe_path"])
+        record = self.supervisor.get(sim["name"])
+        running = record is not None and record.state == process_vr.RUNNING
+        position = self.scheduler.position(sim["name"])
+        
+        if running and self.standby.is_standby(sim["name"]):
+            return {
+                "text": "🔥 Warm standby • instant start",
+                "color": MEDICAL_COLORS['success'],
+                "button": "🚀 LAUNCH",
+                "enabled": True,
+            }
+        elif running:
+            status_text = f"🟢 Running • {process_vr.format_runtime(record.runtime)}"
+            status_color = MEDICAL_COLORS['accent']
+        elif position is not None:
+            return {
+                "text": f"⏳ Queued • #{position}",
+                "color": MEDICAL_COLORS['primary'],
+                "button": "✖ CANCEL",
+                "enabled": True,
+            }
+        elif exists is None:
+            status_text, status_color = "⏳ Checking...", MEDICAL_COLORS['text_light']
+        elif not exists:
+            status_text, status_color = "⚠️ Not Found", MEDICAL_COLORS['error']
+        elif sim["name"] in self.awaiting_verification:
+            status_text, status_color = "🔍 Verifying build • starts when done", MEDICAL_COLORS['primary']
+        elif self.build_is_complete(sim["exe_path"]) is None:
+            status_text, status_color = "🔍 Verifying build...", MEDICAL_COLORS['text_light']
+        elif not self.build_is_complete(sim["exe_path"]):
+            status_text, status_color = "🧩 Incomplete Build", MEDICAL_COLORS['error']
+            exists = False
+        elif record is not None and record.state == process_vr.CRASHED and not self.standby.was_released(record):
+            status_text = f"💥 Crashed (exit {record.returncode}) • Ready"
+            status_color = MEDICAL_COLORS['error']
+        elif record is not None:
+            status_text = f"✅ Ready • last run {process_vr.format_runtime(record.runtime)}"
+            status_color = MEDICAL_COLORS['success']
+        elif sim["name"] in self.caching:
+            status_text, status_color = "✅ Ready • copying to local disk...", MEDICAL_COLORS['success']
+        else:
+            status_text, status_color = "✅ Ready", MEDICAL_COLORS['success']
+        
+        return {
+            "text": status_text,
+            "color": status_color,
+            "button": "🪟 SHOW" if running else "🚀 LAUNCH",
+            "enabled": running or bool(exists),
+        }
+
+    def launch_simulation(self, index, trace=None):
+        """
+        Launch the Unity executable through the process supervisor.
+        The supervisor runs it with cwd=os.path.dirname(exe_path) so it finds its data files,
+        and refuses a second copy while one is running (we focus that one instead).
+        """
+        sim = self.SIMULATIONS[index]
+        trace = trace or metrics_vr.LaunchTrace(sim['name'])
+        exe_path = sim["exe_path"]
+        
+        # A warm standby instance only needs to be brought forward
+        warm = self.station.claim(sim['name'])
+        if warm is not None:
+            self.update_simulation_card(index)
+            self.update_status(f"⚡ Switched to warm '{sim['name']}' (PID {warm.pid})", MEDICAL_COLORS['success'])
+            return
+        
+        current = self.supervisor.get(sim['name'])
+        if current is not None and current.state == process_vr.RUNNING:
+            process_vr.focus_process(current.pid)
+            self.update_status(
+                f"ℹ️ '{sim['name']}' is already running (PID {current.pid})",
+                MEDICAL_COLORS['primary']
+            )
+            return
+        
+        # Clicking a queued card lets the user stop waiting: launch now, or drop it
+        if self.scheduler.position(sim['name']) is not None:
+            self.confirm_queued_launch(sim)
+            return
         
-        for index, simulation in enumerate(self.SIMULATIONS):
-            card = SimulationCard(index, simulation, self) 
-            self.simulation_cards.append(card)
-            self.grid_layout.addWidget(card, row, col)
+        if not self.status_service.status(exe_path):
+            self.sessions.failed(sim['name'])
+            QMessageBox.warning(self, "Launch Failed", "File not found. Please use 'Configure Paths' to set the correct location.")
+            self.update_status(f"❌ '{sim['name']}' not found", MEDICAL_COLORS['error'])
+            return
+        
+        complete = self.build_is_complete(exe_path)
+        if complete is None:
+            # Not verified yet: start it as soon as the check passes
+            self.awaiting_verification[sim['name']] = trace
+            self.integrity.request(exe_path)
+            self.update_status(f"🔍 Verifying '{sim['name']}' build; it starts when the check passes",
+                               MEDICAL_COLORS['primary'])
+            return
+        if not complete:
+            self.sessions.failed(sim['name'])
+            QMessageBox.warning(
+                self, "Launch Blocked",
+                f"The build looks incomplete or corrupt:\n\n{self.integrity_results[exe_path].summary()}\n\n"
+                "Copy the build again, then retry."
+            )
+            self.update_status(f"🧩 '{sim['name']}' build is incomplete", MEDICAL_COLORS['error'])
+            return
+        
+        self.submit_launch(sim, trace)
+
+    def submit_launch(self, sim, trace=None, force=False):
+        """Hand a checked module to the scheduler and report whether it started, queued or was refused"""
+        try:
+            # The supervisor sets the CWD to the folder holding the *_Data folder
+            decision = self.station.submit(sim, trace, force=force)
             
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
+            if decision.state == scheduler_vr.QUEUED:
+                self.update_status(
+                    f"⏳ '{sim['name']}' queued (#{decision.position}) • {decision.reason}",
+                    MEDICAL_COLORS['primary']
+                )
+                self.refresh_queued_cards()
+            elif decision.state in (scheduler_vr.BLOCKED, scheduler_vr.REJECTED):
+                self.confirm_blocked_launch(sim, decision.reason, decision.blockers)
+            elif decision.record.option_problems:
+                self.update_status(
+                    f"⚠️ Launching '{sim['name']}', but could not set {'; '.join(decision.record.option_problems)}",
+                    MEDICAL_COLORS['error']
+                )
+            else:
+                self.update_status(
+                    f"✅ Launching '{sim['name']}' (PID {decision.record.pid})...",
+                    MEDICAL_COLORS['success']
+                )
+        except Exception as e:
+            if not isinstance(e, process_vr.AlreadyRunningError):
+                self.sessions.failed(sim['name'])
+            QMessageBox.critical(
+                self, 
+                "Launch Error", 
+                f"Failed to launch simulation (Error):\n\n{str(e)}"
+            )
+            self.update_status(
+                f"❌ Failed to launch '{sim['name']}'", 
+                MEDICAL_COLORS['error']
+            )
+
+    def confirm_blocked_launch(self, sim, reason, blockers):
+        """Not enough resources (while other modules run, or at all): let the user close one first or launch anyway"""
+        self.update_status(f"⛔ '{sim['name']}' needs resources • {reason}", MEDICAL_COLORS['error'])
+        if blockers:
+            advice = f"Close {', '.join(repr(name) for name in blockers)} first for the best frame rate, or launch anyway?"
+        else:
+            advice = "It may run slowly or fail to start on this machine. Launch anyway?"
+        answer = QMessageBox.question(
+            self,
+            "Not Enough Resources",
+            f"'{sim['name']}' may not run smoothly right now ({reason}).\n\n{advice}",
+            QMessageBox.Yes | QMessageBox.Cancel,
+            QMessageBox.Cancel,
+        )
+        if answer == QMessageBox.Yes:
+            self.submit_launch(sim, force=True)
+
+    def confirm_queued_launch(self, sim):
+        """A queued card was clicked: launch it now anyway, take it out of the queue, or keep waiting"""
+        reason = self.scheduler.queued_reason(sim['name']) or "waiting for resources"
+        box = QMessageBox(self)
+        box.setWindowTitle("Queued Launch")
+        box.setText(f"'{sim['name']}' is waiting for resources ({reason}).")
+        launch_now = box.addButton("Launch Anyway", QMessageBox.AcceptRole)
+        remove = box.addButton("Remove from Queue", QMessageBox.DestructiveRole)
+        box.addButton("Keep Waiting", QMessageBox.RejectRole)
+        box.exec_()
+        if box.clickedButton() is launch_now:
+            self.submit_launch(sim, force=True)
+        elif box.clickedButton() is remove:
+            self.scheduler.cancel(sim['name'])
+
+    def on_queue_event(self, name, state, detail):
+        """A queued launch was started, refused, failed or cancelled"""
+        self.refresh_queued_cards()
+        sim = next((s for s in self.SIMULATIONS if s["name"] == name), None)
+        if state == scheduler_vr.ADMITTED:
+            self.update_status(f"✅ Launching queued '{name}' ({detail})...", MEDICAL_COLORS['success'])
+        elif state == scheduler_vr.FAILED:
+            self.update_status(f"❌ Failed to launch queued '{name}': {detail}", MEDICAL_COLORS['error'])
+        elif state == scheduler_vr.CANCELLED:
+            self.update_status(f"ℹ️ '{name}' removed from the launch queue", MEDICAL_COLORS['primary'])
+        elif state == scheduler_vr.BLOCKED and sim is not None:
+            self.confirm_blocked_launch(sim, detail, [r.name for r in self.supervisor.running()])
+
+    def on_standby_event(self, name, state):
+        """A standby instance was started or closed"""
+        for index, sim in enumerate(self.SIMULATIONS):
+            if sim["name"] == name:
+                self.update_simulation_card(index)
+        if state == standby_vr.RELEASED:
+            self.update_status(f"ℹ️ Closed warm standby '{name}' to free resources", MEDICAL_COLORS['primary'])
+
+    def on_build_cache_event(self, name, state, detail):
+        """A build finished syncing to (or was evicted from) the local cache: follow its new exe_path"""
+        entry = self.catalog.get(name)
+        if state == buildcache_vr.SYNCING:
+            self.caching.add(name)
+        else:
+            self.caching.discard(name)
+        for index, sim in enumerate(self.SIMULATIONS):
+            if sim["name"] == name:
+                if entry is not None:
+                    sim["exe_path"] = entry["exe_path"]
+                self.update_simulation_card(index)
+        if state == buildcache_vr.SYNCING:
+            return
+        if state == buildcache_vr.FAILED:
+            self.update_status(f"💾 Could not cache '{name}' locally: {detail}", MEDICAL_COLORS['error'])
+            return
+        self.refresh_exe_status()
+        if state == buildcache_vr.SYNCED:
+            self.update_status(f"💾 '{name}' now runs from the local cache • {detail}", MEDICAL_COLORS['success'])
+        elif state == buildcache_vr.EVICTED:
+            self.update_status(f"💾 '{name}' removed from the local cache; it runs from the share", MEDICAL_COLORS['primary'])
+
+    def handle_request(self, argv):
+        """
+        A request from a later invocation of the launcher (or from our own
+        command line): bring the window forward and launch the named modules
+        as if their cards were clicked. Returns a message for the caller.
+        """
+        command, names = instance_vr.parse_request(argv)
+        if self.isMinimized():
+            self.showNormal()
+        self.raise_()
+        self.activateWindow()
+        if command == instance_vr.SHOW:
+            return "Launcher brought to the front"
+        
+        self.load_all_simulations()
+        rows = {sim["name"].lower(): index for index, sim in enumerate(self.SIMULATIONS)}
+        unknown = [name for name in names if name.lower() not in rows]
+        if unknown:
+            raise instance_vr.RequestError(f"Unknown module: {', '.join(unknown)}")
+        # Launched after the reply is sent, so the caller can exit at once
+        for name in names:
+            QTimer.singleShot(0, lambda index=rows[name.lower()]: self.launch_requested(index))
+        return f"Launching {', '.join(self.SIMULATIONS[rows[name.lower()]]['name'] for name in names)}"
+
+    def launch_requested(self, index, attempts=50):
+        """Launch a requested module, first giving a just-started launcher time to check its path"""
+        if self.status_service.status(self.SIMULATIONS[index]["exe_path"]) is None and attempts:
+            QTimer.singleShot(100, lambda: self.launch_requested(index, attempts - 1))
+            return
+        self.launch_simulation(index)
+
+    def on_profile_changed(self, name, old, new):
+        """A module kept crashing with its automatic launch profile and was moved down a tier"""
+        self.update_status(
+            f"⚙️ '{name}' crashed repeatedly on the '{old}' profile • it will start with '{new}' from now on",
+            MEDICAL_COLORS['primary']
+        )
+
+    def on_hardware_probed(self):
+        """This PC's one-time hardware probe finished: automatic launch profiles use its tier from now on"""
+        self.update_status(
+            f"🖥️ This PC was measured • automatic launch profile: '{self.profiles.machine_tier()}'",
+            MEDICAL_COLORS['primary']
+        )
+
+    def show_process_options_dialog(self, dialog_parent):
+        dialog_parent.close()
+        self.load_all_simulations()
+        ProcessOptionsDialog(self).exec_()
+
+    def show_standby_dialog(self, dialog_parent):
+        dialog_parent.close()
+        self.load_all_simulations()
+        StandbyDialog(self).exec_()
+
+    def show_build_cache_dialog(self, dialog_parent):
+        dialog_parent.close()
+        BuildCacheDialog(self).exec_()
+
+    def refresh_queued_cards(self):
+        """Queue positions shift whenever the queue changes, so repaint every card (cheap: cached parts)"""
+        self.card_view.viewport().update()
 
     def update_status(self, message, color=None):
         """Update status bar message"""
-        if color is None:
-            color = MEDICAL_COLORS['text_light']
+        # Map the palette colour to a tone so the shared stylesheet does the styling
+        tone = PALETTE_TONES.get(color, "text_light")
         
         self.status_label.setText(message)
-        self.status_label.setStyleSheet(f"color: {color}; font-size: 13px; font-weight: 500;")
+        if self.status_label.property("tone") != tone:
+            self.status_label.setProperty("tone", tone)
+            self.status_label.style().unpolish(self.status_label)
+            self.status_label.style().polish(self.status_label)
 
     def update_simulation_card(self, index):
-        """Called after a path is set to refresh the status indicator"""
-        self.simulation_cards[index].update_status_indicator()
+        """Called after a path or status changes to repaint the card"""
+        self.card_model.refresh_row(index)
 
     # ===============================================
     # 🔹 CONFIGURATION DIALOG METHODS
@@ -485,12 +2132,15 @@ class MainWindow(QMainWindow):
         dialog.setWindowTitle("Configure Simulation Paths")
         dialog.setIcon(QMessageBox.Information)
 
+        # The dialog lists every module, so page in the rest of the catalogue
+        self.load_all_simulations()
+
         main_widget = QWidget()
         main_layout = QVBoxLayout(main_widget)
         main_layout.setContentsMargins(0, 0, 0, 0)
         
-        info_label = QLabel("Click 'Browse' to set the full path for any Unity executable (.exe).")
-        info_label.setStyleSheet(f"color: {MEDICAL_COLORS['primary']}; font-weight: bold; margin-bottom: 10px;")
+        info_label = QLabel("Click 'Browse' to set the full path for any Unity executable (.exe). Paths are saved.")
+        info_label.setObjectName("DialogInfo")
         main_layout.addWidget(info_label)
 
         config_list_widget = QWidget()
@@ -503,7 +2153,7 @@ class MainWindow(QMainWindow):
             sim_layout.setContentsMargins(0, 5, 0, 5)
 
             # Status and Name Label (Column 0)
-            exists = os.path.exists(sim["exe_path"])
+            exists = self.status_service.status(sim["exe_path"]) and self.build_is_complete(sim["exe_path"]) is not False
             status_color = MEDICAL_COLORS['success'] if exists else MEDICAL_COLORS['error']
             
             status_label = QLabel(f"<span style='color:{status_color}; font-weight: bold;'>{sim['name']}</span>")
@@ -512,8 +2162,8 @@ class MainWindow(QMainWindow):
 
             # Path Label (Column 1)
             path_label = QLabel(sim["exe_path"])
-            path_label.setTextElideMode(Qt.ElideLeft)
-            path_label.setStyleSheet(f"color: {MEDICAL_COLORS['text_light']}; font-size: 12px;")
+            path_label.setToolTip(sim["exe_path"])
+            path_label.setObjectName("PathLabel")
             sim_layout.addWidget(path_label, 0, 1)
 
             # Browse Button (Column 2)
@@ -533,11 +2183,170 @@ class MainWindow(QMainWindow):
         scroll_area.setWidget(config_list_widget)
         main_layout.addWidget(scroll_area)
         
+        tools_layout = QHBoxLayout()
+        discover_btn = QPushButton("🔍 Find Builds...")
+        discover_btn.setObjectName("BrowseBtn")
+        discover_btn.clicked.connect(lambda: self.show_discovery_dialog(dialog))
+        tools_layout.addWidget(discover_btn)
+        
+        reroot_btn = QPushButton("Move Build Folder...")
+        reroot_btn.setObjectName("BrowseBtn")
+        reroot_btn.clicked.connect(lambda: self.reroot_paths(dialog))
+        tools_layout.addWidget(reroot_btn)
+        
+        options_btn = QPushButton("Process Options...")
+        options_btn.setObjectName("BrowseBtn")
+        options_btn.clicked.connect(lambda: self.show_process_options_dialog(dialog))
+        tools_layout.addWidget(options_btn)
+        
+        standby_btn = QPushButton("🔥 Warm Standby...")
+        standby_btn.setObjectName("BrowseBtn")
+        standby_btn.clicked.connect(lambda: self.show_standby_dialog(dialog))
+        tools_layout.addWidget(standby_btn)
+        
+        cache_btn = QPushButton("💾 Local Build Cache...")
+        cache_btn.setObjectName("BrowseBtn")
+        cache_btn.clicked.connect(lambda: self.show_build_cache_dialog(dialog))
+        tools_layout.addWidget(cache_btn)
+        tools_layout.addStretch()
+        main_layout.addLayout(tools_layout)
+        
         dialog.layout().addWidget(main_widget)
         dialog.setStandardButtons(QMessageBox.Ok)
         dialog.exec_()
 
 
+    def load_all_simulations(self):
+        """Page in every remaining catalogue entry"""
+        while self.fill_timer.isActive():
+            self.fill_cards()
+        while self.card_model.canFetchMore():
+            self.card_model.fetchMore()
+
+    def show_discovery_dialog(self, dialog_parent):
+        """Offer discovered builds for every module instead of browsing one by one."""
+        dialog_parent.close()
+        DiscoveryDialog(self).exec_()
+        self.show_config_dialog()
+
+    def reroot_paths(self, dialog_parent):
+        """Re-point every exe_path under one folder to another folder, in one transaction."""
+        dialog_parent.close()
+
+        paths = [sim["exe_path"] for sim in self.SIMULATIONS if sim["exe_path"]]
+        try:
+            common = os.path.dirname(os.path.commonpath(paths)) if len(paths) > 1 else ""
+        except ValueError:  # paths on different drives
+            common = ""
+        old_root, ok = QInputDialog.getText(
+            self, "Move Build Folder", "Folder the builds used to be in:", text=common
+        )
+        if ok and old_root:
+            new_root = QFileDialog.getExistingDirectory(self, "Folder the builds are in now", old_root)
+            if new_root:
+                moved = self.catalog.reroot(old_root, new_root)
+                for sim in self.SIMULATIONS:
+                    if sim["name"] in moved:
+                        sim["exe_path"] = moved[sim["name"]]
+                self.refresh_exe_status()
+                for index in range(len(self.SIMULATIONS)):
+                    self.update_simulation_card(index)
+                self.update_status(f"📁 Moved {len(moved)} simulation paths to {new_root}", MEDICAL_COLORS['success'])
+
+        self.show_config_dialog()
+
+    # ===============================================
+    # 🔹 LAUNCH METRICS
+    # ===============================================
+    def show_metrics_dialog(self):
+        """Show p50/p95 launch stage timings per module, with CSV export."""
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Launch Metrics")
+        dialog.resize(900, 360)
+        layout = QVBoxLayout(dialog)
+
+        info_label = QLabel("Time from click to each launch stage (p50 / p95).")
+        info_label.setObjectName("DialogInfo")
+        layout.addWidget(info_label)
+
+        summary = self.metrics.summary()
+        headers = ["Module", "Launches"] + [stage.replace("_", " ").title() for stage in metrics_vr.STAGES]
+        table = QTableWidget(len(summary), len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        table.verticalHeader().setVisible(False)
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+
+        for row, (module, entry) in enumerate(sorted(summary.items())):
+            cells = [module, str(entry["launches"])]
+            for stage in metrics_vr.STAGES:
+                timing = entry[stage]
+                cells.append("—" if timing is None else
+                             f"{metrics_vr.format_ms(timing[0])} / {metrics_vr.format_ms(timing[1])}")
+            for column, text in enumerate(cells):
+                table.setItem(row, column, QTableWidgetItem(text))
+        layout.addWidget(table)
+
+        usage = self.sessions.rollup(("module",))
+        usage_label = QLabel(
+            "Sessions on this station: " + (", ".join(
+                f"{row['module']} {row['sessions']}× ({row['hours']:g} h, {row['failure_rate']:.0%} failed)"
+                for row in usage[:6]
+            ) or "none yet")
+        )
+        usage_label.setObjectName("PathLabel")
+        usage_label.setWordWrap(True)
+        layout.addWidget(usage_label)
+
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        btn_sessions = QPushButton("Export Sessions")
+        btn_sessions.setObjectName("BrowseBtn")
+        btn_sessions.setFixedWidth(160)
+        btn_sessions.clicked.connect(lambda: self.export_sessions(dialog))
+        buttons.addWidget(btn_sessions)
+        btn_export = QPushButton("Export CSV")
+        btn_export.setObjectName("BrowseBtn")
+        btn_export.setFixedWidth(140)
+        btn_export.clicked.connect(lambda: self.export_metrics(dialog))
+        buttons.addWidget(btn_export)
+        layout.addLayout(buttons)
+
+        dialog.exec_()
+
+    def show_log_viewer(self, name=None):
+        """Captured output of the launched simulations (a crashed one, else the latest launch, by default)."""
+        if name is None:
+            names = self.logs.names()
+            crashed = [n for n in names if (self.supervisor.get(n) or None) is not None
+                       and self.supervisor.get(n).state == process_vr.CRASHED]
+            name = (crashed or names or [None])[-1]
+        LogViewerDialog(self, name).exec_()
+
+    def export_metrics(self, dialog_parent):
+        """Save every recorded launch trace to a CSV file."""
+        file_path, _ = QFileDialog.getSaveFileName(
+            dialog_parent,
+            "Export Launch Metrics",
+            metrics_vr.default_export_path(),
+            "CSV Files (*.csv)"
+        )
+        if file_path:
+            count = self.metrics.export_csv(file_path)
+            self.update_status(f"📊 Exported {count} launches to {file_path}", MEDICAL_COLORS['success'])
+
+    def export_sessions(self, dialog_parent):
+        """Save the session log (start, end, outcome of every session) to a CSV file."""
+        file_path, _ = QFileDialog.getSaveFileName(
+            dialog_parent,
+            "Export Sessions",
+            os.path.join(os.path.expanduser("~"), "sessions.csv"),
+            "CSV Files (*.csv)"
+        )
+        if file_path:
+            count = self.sessions.export(file_path)
+            self.update_status(f"📊 Exported {count} sessions to {file_path}", MEDICAL_COLORS['success'])
+
     def browse_for_exe(self, index, dialog_parent):
         """Browse for the correct executable file and update the configuration."""
         
@@ -553,10 +2362,14 @@ class MainWindow(QMainWindow):
         )
         
         if file_path:
-            # Update the SIMULATIONS list in memory
+            # Update the loaded entry and save it to the catalogue
             self.SIMULATIONS[index]["exe_path"] = file_path
+            self.catalog.set_exe_path(self.SIMULATIONS[index]['name'], file_path)
+            # A build on a cached share is copied locally right away
+            self.build_cache.wake.set()
             
-            # Refresh the card status indicator
+            # Re-check paths in the background and refresh the card
+            self.refresh_exe_status()
             self.update_simulation_card(index) 
 
             # Display success message
@@ -564,7 +2377,7 @@ class MainWindow(QMainWindow):
                 self, 
                 "Path Updated", 
                 f"✅ Path for '{self.SIMULATIONS[index]['name']}' updated to:\n{file_path}\n\n"
-                "The changes are active for this session. Click 'Launch' to test."
+                "The change has been saved. Click 'Launch' to test."
             )
 
         self.show_config_dialog() 
@@ -581,5 +2394,15 @@ if __name__ == "__main__":
     app.setFont(font)
     
     window = MainWindow()
+    # Later invocations hand their arguments to this window instead of starting another
+    instance_server = InstanceServer(window.handle_request, window)
+    if not instance_server.listen():
+        print("Another launcher is starting; this one won't receive forwarded requests")
     window.show()
+    STARTUP.mark("window_shown")
+    if REQUEST:
+        try:
+            print(window.handle_request(REQUEST))
+        except instance_vr.RequestError as e:
+            print(e)
     sys.exit(app.exec_())
\ No newline at end of file
@@ -0,0 +1,120 @@
+"""
+Single-instance support for the GUI launcher.
+
+The first launcher listens on a local socket (a QLocalServer in gui_vr;
+a Unix socket, or a named pipe on Windows). A later invocation of
+gui_vr.py calls forward() before it imports Qt: if a launcher answers, it
+hands over its arguments and exits, so desktop shortcuts and kiosk
+hotkeys never start a second window. Requests are one JSON line each way:
+
+    -> {"argv": ["launch", "Heart"]}
+    <- {"ok": true, "message": "Launching 'Heart'"}
+
+Commands: "show" (the default, brings the window forward) and
+"launch NAME...". No Qt here.
+"""
+import hashlib
+import json
+import os
+import socket
+import sys
+import tempfile
+
+import storage_vr
+
+SHOW = "show"
+LAUNCH = "launch"
+COMMANDS = (SHOW, LAUNCH)
+# The running launcher answers at once (launches are started afterwards)
+REPLY_TIMEOUT = 2.0
+
+
+class RequestError(ValueError):
+    """Arguments a launcher can't act on."""
+
+
+def server_name():
+    """
+    The local socket of this data folder's launcher: launchers with
+    different SURGICAL_SUITE_HOME folders don't see each other. On POSIX
+    it is a full path, so Qt and plain sockets agree on where it lives.
+    """
+    digest = hashlib.sha1(os.path.abspath(storage_vr.data_dir()).encode("utf-8")).hexdigest()[:12]
+    name = f"surgical-suite-{digest}"
+    if sys.platform == "win32":
+        return name
+    return os.path.join(tempfile.gettempdir(), name)
+
+
+def parse_request(argv):
+    """(command, module names) from launcher arguments. Raises RequestError."""
+    if not argv:
+        return SHOW, []
+    command, names = argv[0].lower(), list(argv[1:])
+    if command not in COMMANDS:
+        raise RequestError(f"unknown command '{argv[0]}' (expected: {', '.join(COMMANDS)})")
+    if command == LAUNCH and not names:
+        raise RequestError("launch needs at least one module name")
+    return command, names
+
+
+def encode(message):
+    return (json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def decode(line):
+    """A request or reply line -> dict. Raises RequestError."""
+    try:
+        message = json.loads(line.decode("utf-8"))
+    except (UnicodeDecodeError, ValueError):
+        raise RequestError("malformed message")
+    if not isinstance(message, dict):
+        raise RequestError("malformed message")
+    return message
+
+
+def forward(argv, timeout=REPLY_TIMEOUT):
+    """
+    Hand argv to the running launcher. Returns its reply ({"ok", "message"}),
+    or None if no launcher is listening.
+    """
+    request = encode({"argv": list(argv)})
+    try:
+        if sys.platform == "win32":
+            reply = _exchange_pipe(r"\\.\pipe" + "\\" + server_name(), request)
+        else:
+            reply = _exchange_socket(server_name(), request, timeout)
+    except OSError:
+        return None
+    if not reply:
+        return None
+    try:
+        return decode(reply)
+    except RequestError:
+        return None
+
+
+def _exchange_socket(path, request, timeout):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path)
+        sock.sendall(request)
+        reply = b""
+        while not reply.endswith(b"\n"):
+            data = sock.recv(4096)
+            if not data:
+                break
+            reply += data
+    return reply
+
+
+def _exchange_pipe(path, request):
+    with open(path, "r+b", buffering=0) as pipe:
+        pipe.write(request)
+        reply = b""
+        while not reply.endswith(b"\n"):
+            data = pipe.read(4096)
+            if not data:
+                break
+            reply += data
+    return reply
@@ -0,0 +1,332 @@
+"""
+Build integrity verification.
+
+A half-copied build (truncated *_Data folder) launches and then hangs the
+headset, so before a card counts as Ready we check the build:
+
+* structure: the *_Data folder exists, holds Unity's core data file and
+  no zero-byte asset files;
+* content: when the build ships a '<name>.manifest.json' (written with
+  write_manifest from a known-good copy), every listed file is hashed
+  and compared.
+
+Hashing is parallel, reads files in memory-mapped chunks, and reuses the
+digest of any file whose (size, mtime, inode) is unchanged. Re-verifying
+a multi-GB build after a small patch therefore only hashes the patched
+files.
+"""
+import hashlib
+import json
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import storage_vr
+import unity_vr
+
+DB_FILENAME = "integrity.sqlite3"
+MANIFEST_VERSION = 1
+HASH_ALGORITHM = "blake2b"
+CHUNK_SIZE = 8 * 1024 * 1024
+# One of these must exist in *_Data for the player to start
+CORE_DATA_FILES = ("globalgamemanagers", "data.unity3d", "mainData")
+ASSET_SUFFIXES = (".assets", ".resS", ".resource", ".bundle")
+
+OK = "ok"
+CORRUPT = "corrupt"
+
+
+class IntegrityResult:
+    """Outcome of verifying one build."""
+
+    def __init__(self, exe_path, problems, checked=0, hashed=0, has_manifest=False):
+        self.exe_path = exe_path
+        self.problems = problems
+        self.checked = checked
+        self.hashed = hashed
+        self.has_manifest = has_manifest
+
+    @property
+    def state(self):
+        return CORRUPT if self.problems else OK
+
+    def summary(self):
+        if not self.problems:
+            return "Build complete"
+        more = f" (+{len(self.problems) - 3} more)" if len(self.problems) > 3 else ""
+        return "; ".join(self.problems[:3]) + more
+
+
+def manifest_path(exe_path):
+    return os.path.splitext(exe_path)[0] + ".manifest.json"
+
+
+def build_files(exe_path):
+    """Relative paths (with '/') of the files that make up a build."""
+    root = os.path.dirname(exe_path)
+    files = [os.path.basename(exe_path)]
+    data = unity_vr.data_folder(exe_path)
+    for folder, _dirs, names in os.walk(data):
+        for name in names:
+            files.append(os.path.relpath(os.path.join(folder, name), root).replace(os.sep, "/"))
+    # Player runtime libraries next to the exe
+    try:
+        with os.scandir(root) as entries:
+            files += [e.name for e in entries if e.is_file() and e.name.lower().endswith(".dll")]
+    except OSError:
+        pass
+    return sorted(files)
+
+
+def hash_file(path):
+    """Digest of a file, read through mmap in CHUNK_SIZE slices."""
+    digest = hashlib.new(HASH_ALGORITHM)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return digest.hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                for offset in range(0, size, CHUNK_SIZE):
+                    # hashlib releases the GIL for large buffers, so threads hash in parallel
+                    digest.update(view[offset:offset + CHUNK_SIZE])
+            finally:
+                view.release()
+    return digest.hexdigest()
+
+
+def structure_problems(exe_path):
+    """Cheap checks that catch most half-copied builds without hashing."""
+    data = unity_vr.data_folder(exe_path)
+    if not os.path.isdir(data):
+        return [f"missing {os.path.basename(data)} folder"]
+    problems = []
+    if not any(os.path.exists(os.path.join(data, name)) for name in CORE_DATA_FILES):
+        problems.append("Unity core data file missing")
+    for folder, _dirs, names in os.walk(data):
+        for name in names:
+            if name.endswith(ASSET_SUFFIXES):
+                path = os.path.join(folder, name)
+                try:
+                    if os.path.getsize(path) == 0:
+                        problems.append(f"empty asset {os.path.relpath(path, data)}")
+                except OSError:
+                    pass
+    return problems
+
+
+# exe_path -> (structure_signature, problems) of the last structure check
+_structure_results = {}
+_structure_lock = threading.Lock()
+
+
+def structure_signature(exe_path):
+    """(name, size, mtime) of every entry at the top of the *_Data folder, or None if it is missing."""
+    try:
+        with os.scandir(unity_vr.data_folder(exe_path)) as entries:
+            return sorted((e.name, e.stat().st_size, e.stat().st_mtime_ns) for e in entries)
+    except OSError:
+        return None
+
+
+def cached_structure_problems(exe_path, refresh=False):
+    """
+    structure_problems, reused while nothing at the top of the *_Data folder
+    (where Unity keeps its core data and asset files) has changed, so status
+    polls and launches don't walk the whole build each time. refresh=True
+    always walks; full verification does, and so catches deeper changes.
+    """
+    signature = structure_signature(exe_path)
+    if signature is None:
+        return structure_problems(exe_path)
+    with _structure_lock:
+        cached = _structure_results.get(exe_path)
+    if not refresh and cached is not None and cached[0] == signature:
+        return list(cached[1])
+    problems = structure_problems(exe_path)
+    with _structure_lock:
+        _structure_results[exe_path] = (signature, problems)
+    return list(problems)
+
+
+class HashCache:
+    """Digests keyed by (path, size, mtime, inode), so unchanged files are never re-read."""
+
+    def __init__(self, path=None):
+        self.path = path or storage_vr.data_path(DB_FILENAME)
+        self.lock = threading.Lock()
+        self.db = storage_vr.connect(self.path)
+        self.db.execute(
+            """CREATE TABLE IF NOT EXISTS file_hashes (
+                   path TEXT PRIMARY KEY,
+                   size INTEGER NOT NULL,
+                   mtime_ns INTEGER NOT NULL,
+                   inode INTEGER NOT NULL,
+                   digest TEXT NOT NULL
+               )"""
+        )
+        self.db.commit()
+
+    def lookup(self, path, stat):
+        with self.lock:
+            row = self.db.execute(
+                "SELECT digest FROM file_hashes WHERE path = ? AND size = ? AND mtime_ns = ? AND inode = ?",
+                (path, stat.st_size, stat.st_mtime_ns, stat.st_ino),
+            ).fetchone()
+        return row[0] if row else None
+
+    def store(self, entries):
+        """entries: iterable of (path, stat, digest)"""
+        with self.lock, self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO file_hashes VALUES (?, ?, ?, ?, ?)",
+                [(path, st.st_size, st.st_mtime_ns, st.st_ino, digest) for path, st, digest in entries],
+            )
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+
+class BuildVerifier:
+    """Hashes build files in parallel, backed by a HashCache."""
+
+    def __init__(self, cache=None, workers=4):
+        self.cache = cache or HashCache()
+        self.workers = workers
+        # Set to make a running verification skip the files it hasn't hashed yet
+        self.cancelled = threading.Event()
+
+    def digests(self, root, relative_paths):
+        """
+        ({relative path: (size, digest)}, number of files actually hashed) for
+        every readable file; cached digests are reused.
+        """
+        results, to_hash = {}, []
+        for rel in relative_paths:
+            path = os.path.join(root, rel)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            digest = self.cache.lookup(path, st)
+            if digest is None:
+                to_hash.append((rel, path, st))
+            else:
+                results[rel] = (st.st_size, digest)
+
+        def work(item):
+            rel, path, st = item
+            if self.cancelled.is_set():
+                return rel, path, st, None
+            try:
+                return rel, path, st, hash_file(path)
+            except OSError:
+                return rel, path, st, None
+
+        fresh = []
+        if to_hash:
+            # Biggest files first so one huge asset doesn't finish last on its own
+            to_hash.sort(key=lambda item: -item[2].st_size)
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="integrity") as pool:
+                for rel, path, st, digest in pool.map(work, to_hash):
+                    if digest is not None:
+                        results[rel] = (st.st_size, digest)
+                        fresh.append((path, st, digest))
+            self.cache.store(fresh)
+        return results, len(fresh)
+
+    def write_manifest(self, exe_path):
+        """Record the current (known-good) build as its reference manifest. Returns the file path."""
+        root = os.path.dirname(exe_path)
+        files, _hashed = self.digests(root, build_files(exe_path))
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "algorithm": HASH_ALGORITHM,
+            "files": {rel: [size, digest] for rel, (size, digest) in sorted(files.items())},
+        }
+        path = manifest_path(exe_path)
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(temp_path, path)
+        return path
+
+    def verify(self, exe_path):
+        """Check a build's structure and, if it has a manifest, its content."""
+        problems = cached_structure_problems(exe_path, refresh=True)
+        try:
+            with open(manifest_path(exe_path), encoding="utf-8") as f:
+                manifest = json.load(f)
+        except OSError:
+            return IntegrityResult(exe_path, problems)
+        except ValueError:
+            return IntegrityResult(exe_path, problems + ["unreadable manifest"], has_manifest=True)
+
+        if manifest.get("version") != MANIFEST_VERSION or manifest.get("algorithm") != HASH_ALGORITHM:
+            return IntegrityResult(exe_path, problems + ["unsupported manifest"], has_manifest=True)
+
+        expected = manifest["files"]
+        root = os.path.dirname(exe_path)
+
+        # Missing and truncated files are caught by size alone; only hash the rest
+        same_size = []
+        for rel, (size, _digest) in expected.items():
+            try:
+                actual_size = os.path.getsize(os.path.join(root, rel))
+            except OSError:
+                problems.append(f"missing {rel}")
+                continue
+            if actual_size != size:
+                problems.append(f"{rel} is {actual_size} of {size} bytes")
+            else:
+                same_size.append(rel)
+
+        actual, hashed = self.digests(root, same_size)
+        for rel in same_size:
+            found = actual.get(rel)
+            if found is None:
+                problems.append(f"unreadable {rel}")
+            elif found[1] != expected[rel][1]:
+                problems.append(f"{rel} differs")
+        return IntegrityResult(exe_path, problems, checked=len(expected), hashed=hashed,
+                               has_manifest=True)
+
+
+class IntegrityChecker:
+    """
+    Background verification of builds, one at a time.
+    on_result(result) is called from the worker thread, never after stop().
+    """
+
+    def __init__(self, on_result, verifier=None):
+        self.on_result = on_result
+        self.verifier = verifier or BuildVerifier()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="integrity-check")
+        self.lock = threading.Lock()
+        self.pending = set()
+
+    def request(self, exe_path):
+        with self.lock:
+            if exe_path in self.pending or self.verifier.cancelled.is_set():
+                return
+            self.pending.add(exe_path)
+        self.executor.submit(self._run, exe_path)
+
+    def _run(self, exe_path):
+        with self.lock:
+            self.pending.discard(exe_path)
+        try:
+            result = self.verifier.verify(exe_path)
+        except Exception as e:  # a failed check must not kill the worker
+            result = IntegrityResult(exe_path, [f"verification failed: {e}"])
+        if not self.verifier.cancelled.is_set():
+            self.on_result(result)
+
+    def stop(self):
+        """Cancel queued checks, wait for the running one to wind down, then close the hash cache."""
+        self.verifier.cancelled.set()
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self.verifier.cache.close()
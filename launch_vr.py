@@ -0,0 +1,126 @@
+"""
+Launching one catalogue entry, shared by the GUI and the command line.
+
+Checks that the build is present and complete, starts it through a
+ProcessSupervisor and hands the launch trace to the metrics store.
+Per-module process options (CPU affinity, priority) are kept in the
+catalogue settings and applied by the supervisor; Unity launch arguments
+come from the module's launch profile (profiles_vr).
+No Qt here, so the headless CLI can use it without loading PyQt5.
+"""
+import os
+import subprocess
+import sys
+
+import integrity_vr
+import metrics_vr
+import process_vr
+import profiles_vr
+
+NOT_FOUND = "not_found"
+INCOMPLETE = "incomplete"
+# Catalogue setting: {module name: ProcessOptions.as_dict()}
+OPTIONS_SETTING = "process_options"
+
+
+class LaunchError(RuntimeError):
+    """A build that can't be launched; reason is NOT_FOUND or INCOMPLETE."""
+
+    def __init__(self, name, reason, message):
+        super().__init__(message)
+        self.name = name
+        self.reason = reason
+
+
+def check(entry):
+    """Raise LaunchError unless the entry's build exists and looks complete (cheap: see cached_structure_problems)."""
+    exe_path = entry["exe_path"]
+    if not exe_path or not os.path.isfile(exe_path):
+        raise LaunchError(entry["name"], NOT_FOUND, f"'{entry['name']}' not found: {exe_path}")
+    problems = integrity_vr.cached_structure_problems(exe_path)
+    if problems:
+        result = integrity_vr.IntegrityResult(exe_path, problems)
+        raise LaunchError(entry["name"], INCOMPLETE, f"'{entry['name']}' build is incomplete: {result.summary()}")
+
+
+def saved_options(catalog):
+    """{module name: ProcessOptions} saved in the catalogue (invalid entries are skipped)."""
+    options = {}
+    for name, data in (catalog.get_setting(OPTIONS_SETTING) or {}).items():
+        try:
+            options[name] = process_vr.ProcessOptions.from_dict(data)
+        except (ValueError, TypeError) as e:
+            print(f"Ignoring process options of '{name}': {e}")
+    return options
+
+
+def save_options(catalog, options):
+    catalog.set_setting(OPTIONS_SETTING, {name: o.as_dict() for name, o in options.items() if o})
+
+
+def options_lookup(catalog, overrides=None):
+    """
+    ProcessSupervisor options callback: a module's saved options, with any
+    field set in *overrides* (e.g. from the command line) taking precedence.
+    """
+    def lookup(name):
+        options = saved_options(catalog).get(name) or process_vr.ProcessOptions()
+        return options.merged(overrides) if overrides else options
+    return lookup
+
+
+def detached_popen_kwargs():
+    """Popen options for a child that outlives the launcher and doesn't share its console."""
+    kwargs = {
+        "stdin": subprocess.DEVNULL,
+        "stdout": subprocess.DEVNULL,
+        "stderr": subprocess.DEVNULL,
+    }
+    if sys.platform == "win32":
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+    return kwargs
+
+
+def start(supervisor, entry, trace=None, metrics=None, watch=True, logs=None, sessions=None,
+          profiles=None, profile=None, args=(), **popen_kwargs):
+    """
+    Spawn an already checked entry. Returns (ProcessRecord, metrics thread or None).
+
+    Marks the trace's validated/spawned stages; with watch=True a daemon thread
+    follows the child to its first frame and then stores the trace in *metrics*,
+    otherwise the trace is stored right away. With a logs_vr.LogManager the
+    child's output and Player.log are captured; with a telemetry_vr.SessionLog
+    the session is logged when it ends. With a profiles_vr.ProfileManager the
+    module's launch profile (or the named *profile*) comes before *args*.
+    Raises process_vr.AlreadyRunningError or OSError.
+    """
+    trace = trace or metrics_vr.LaunchTrace(entry["name"])
+    if profiles is not None:
+        profile, profile_args = profiles.args_for(entry["name"], profile)
+        args = profiles_vr.combine(profile_args, args)
+    if logs is not None:
+        popen_kwargs = {**logs.popen_kwargs(entry["name"]), **popen_kwargs}
+    trace.mark("validated")
+    try:
+        record = supervisor.launch(entry["name"], entry["exe_path"], args, **popen_kwargs)
+    except (process_vr.AlreadyRunningError, OSError):
+        if logs is not None:
+            logs.abandon(entry["name"])
+        raise
+    trace.mark("spawned")
+    if profiles is not None:
+        record.profile = profile
+        profiles.launched(entry["name"], profile)
+    if logs is not None:
+        logs.attach(entry["name"], record.process, trace.clicked_wall, entry["exe_path"])
+    if sessions is not None:
+        sessions.begin(record, trace.clicked_wall)
+    watcher = None
+    if metrics is not None:
+        if watch:
+            watcher = metrics_vr.watch_launch(trace, record.process, metrics, entry["exe_path"])
+        else:
+            metrics.record(trace)
+    return record, watcher
@@ -0,0 +1,478 @@
+"""
+Log capture for launched simulations.
+
+A child's stdout and stderr go to capture files in the data folder, not
+to pipes, so it never depends on the launcher: it keeps running (and
+writing) after the launcher closes. Daemon threads follow those files and
+the Unity Player.log the build writes. Every line goes into a bounded
+in-memory ring buffer (for the log viewer) and is queued for a writer
+thread that appends it to a size-rotated session log in the data folder.
+A capture file is emptied each time a megabyte of it has been read, so it
+stays small however long the child runs, and deleted once the child has
+ended.
+
+Following never waits on anything else: if the disk writer falls behind,
+its queue drops lines (and counts them) instead of stalling. No Qt here.
+"""
+import collections
+import itertools
+import os
+import queue
+import re
+import subprocess
+import sys
+import threading
+import time
+
+import storage_vr
+import unity_vr
+
+LOG_DIRNAME = "logs"
+BUFFER_LINES = 20000
+# Lines longer than this are split (a runaway line must not grow without bound)
+MAX_LINE_BYTES = 16 * 1024
+# Files are followed in chunks of whatever is new, up to this size
+READ_CHUNK = 64 * 1024
+ROTATE_BYTES = 5 * 1024 * 1024
+ROTATE_BACKUPS = 3
+# Log files kept per module (oldest sessions are deleted)
+KEEP_SESSIONS = 20
+# Batches of lines waiting for the disk writer before new ones are dropped
+WRITE_QUEUE_BATCHES = 2000
+TAIL_INTERVAL = 0.25
+# A capture file is emptied once this much of it has been read into the session log
+CAPTURE_TRUNCATE_BYTES = 1024 * 1024
+
+DEBUG = 0
+INFO = 1
+WARNING = 2
+ERROR = 3
+LEVEL_NAMES = {DEBUG: "debug", INFO: "info", WARNING: "warning", ERROR: "error"}
+
+STDOUT = "stdout"
+STDERR = "stderr"
+PLAYER_LOG = "player"
+# Capture file suffix of each output stream
+CAPTURE_SUFFIXES = {STDOUT: ".out", STDERR: ".err"}
+
+# Lower-case markers; plain substring tests are much cheaper than a regex per line
+ERROR_MARKERS = ("exception", "error", "fatal", "crash", "failed to", "assert")
+WARNING_MARKERS = ("warn", "deprecated")
+
+
+def classify(text, source=STDOUT):
+    """Best-effort severity of one log line (Unity doesn't tag every line)."""
+    lowered = text.lower()
+    if any(marker in lowered for marker in ERROR_MARKERS):
+        return ERROR
+    if any(marker in lowered for marker in WARNING_MARKERS):
+        return WARNING
+    return WARNING if source == STDERR and text.strip() else INFO
+
+
+class LogLine:
+    __slots__ = ("seq", "time", "source", "text", "_level")
+
+    def __init__(self, seq, when, source, text):
+        self.seq = seq
+        self.time = when
+        self.source = source
+        self.text = text
+        self._level = None
+
+    @property
+    def level(self):
+        # Classified on first use (by the viewer's filter), never on the reader thread
+        if self._level is None:
+            self._level = classify(self.text, self.source)
+        return self._level
+
+    def format(self, stamp=None):
+        stamp = stamp or time.strftime("%H:%M:%S", time.localtime(self.time))
+        return f"{stamp} [{self.source}] {self.text}"
+
+
+def format_lines(lines):
+    """Display/file text of many lines, formatting each timestamp second only once."""
+    stamps = {}
+    text = []
+    for line in lines:
+        second = int(line.time)
+        stamp = stamps.get(second)
+        if stamp is None:
+            stamp = stamps[second] = time.strftime("%H:%M:%S", time.localtime(second))
+        text.append(line.format(stamp))
+    return "\n".join(text)
+
+
+class RingBuffer:
+    """The newest *capacity* lines, each numbered so readers can ask for what's new."""
+
+    def __init__(self, capacity=BUFFER_LINES):
+        self.lines = collections.deque(maxlen=capacity)
+        self.lock = threading.Lock()
+        self.next_seq = 0
+
+    def extend(self, source, texts):
+        """Add lines from one source under a single lock. Returns the new LogLines."""
+        now = time.time()
+        with self.lock:
+            seq = self.next_seq
+            lines = [LogLine(seq + i, now, source, text) for i, text in enumerate(texts)]
+            self.next_seq += len(lines)
+            self.lines.extend(lines)
+        return lines
+
+    def since(self, seq):
+        """Lines numbered seq or later that are still in the buffer."""
+        with self.lock:
+            if not self.lines or self.lines[-1].seq < seq:
+                return []
+            skip = max(0, seq - self.lines[0].seq)
+            return list(self.lines)[skip:]
+
+    def snapshot(self):
+        with self.lock:
+            return list(self.lines)
+
+    @property
+    def dropped(self):
+        """Lines that have already fallen out of the buffer."""
+        with self.lock:
+            return self.next_seq - len(self.lines)
+
+
+class RotatingWriter:
+    """Appends lines to a file, rotating it to .1, .2, ... when it grows past max_bytes."""
+
+    def __init__(self, path, max_bytes=ROTATE_BYTES, backups=ROTATE_BACKUPS):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.file = open(path, "a", encoding="utf-8", errors="replace")
+        self.size = self.file.tell()
+
+    def write(self, text):
+        if self.size + len(text) > self.max_bytes and self.size:
+            self.rotate()
+        self.file.write(text)
+        self.size += len(text)
+
+    def rotate(self):
+        self.file.close()
+        for index in range(self.backups - 1, 0, -1):
+            older = f"{self.path}.{index}"
+            if os.path.exists(older):
+                os.replace(older, f"{self.path}.{index + 1}")
+        if self.backups:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self.file = open(self.path, "w", encoding="utf-8", errors="replace")
+        self.size = 0
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def module_log_dir(name):
+    safe = re.sub(r"[^\w.-]+", "_", name).strip("_") or "module"
+    path = os.path.join(storage_vr.data_path(LOG_DIRNAME), safe)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def prune_sessions(folder, keep=KEEP_SESSIONS):
+    """Delete the oldest session logs (and their rotations) beyond *keep*."""
+    try:
+        sessions = sorted(
+            (entry for entry in os.scandir(folder) if entry.name.endswith(".log")),
+            key=lambda entry: entry.stat().st_mtime,
+        )
+    except OSError:
+        return
+    for entry in sessions[:-keep] if keep else sessions:
+        for path in [entry.path] + [f"{entry.path}.{i}" for i in range(1, ROTATE_BACKUPS + 1)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def prune_captures(folder, keep=KEEP_SESSIONS):
+    """
+    Delete capture files beyond the newest *keep* launches. Normally they
+    are deleted once read; these were left by a launcher that closed while
+    its child was still running.
+    """
+    try:
+        captures = sorted(
+            (entry for entry in os.scandir(folder) if entry.name.endswith(tuple(CAPTURE_SUFFIXES.values()))),
+            key=lambda entry: entry.stat().st_mtime,
+        )
+    except OSError:
+        return
+    for entry in captures[:-keep * len(CAPTURE_SUFFIXES)] if keep else captures:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+_capture_ids = itertools.count(1)
+
+
+def open_for_append(path):
+    """
+    Create *path* for writing such that every write, also by a child that
+    inherits the handle, lands at the current end of the file. The file can
+    then be truncated while the child still writes to it.
+    """
+    if sys.platform == "win32":
+        import _winapi
+        import msvcrt
+        FILE_APPEND_DATA = 0x0004
+        SYNCHRONIZE = 0x00100000
+        FILE_SHARE_READ_WRITE_DELETE = 0x7
+        CREATE_ALWAYS = 2
+        FILE_ATTRIBUTE_NORMAL = 0x80
+        # Append-only access: Windows has no O_APPEND that survives into a child
+        handle = _winapi.CreateFile(path, FILE_APPEND_DATA | SYNCHRONIZE, FILE_SHARE_READ_WRITE_DELETE, 0,
+                                    CREATE_ALWAYS, FILE_ATTRIBUTE_NORMAL, 0)
+        return os.fdopen(msvcrt.open_osfhandle(handle, os.O_APPEND), "ab", buffering=0)
+    return open(path, "ab", buffering=0)
+
+
+class CaptureFiles:
+    """The files a child's stdout and stderr are written to, created before it is spawned."""
+
+    def __init__(self, name):
+        folder = module_log_dir(name)
+        prune_captures(folder, KEEP_SESSIONS - 1)
+        stem = os.path.join(folder, f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{next(_capture_ids)}")
+        self.paths = {source: stem + suffix for source, suffix in CAPTURE_SUFFIXES.items()}
+        self.files = {}
+        try:
+            for source, path in self.paths.items():
+                self.files[source] = open_for_append(path)
+        except OSError:
+            self.discard()
+            raise
+
+    def popen_kwargs(self):
+        return {"stdin": subprocess.DEVNULL, "stdout": self.files[STDOUT], "stderr": self.files[STDERR]}
+
+    def close(self):
+        """Close the launcher's handles (the child has its own)."""
+        for handle in self.files.values():
+            handle.close()
+
+    def discard(self):
+        """Close and delete the files (the child was never spawned)."""
+        self.close()
+        for path in self.paths.values():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+class ProcessLog:
+    """Captured output of one launched process: ring buffer plus rotated file on disk."""
+
+    def __init__(self, name, pid, capacity=BUFFER_LINES):
+        self.name = name
+        self.pid = pid
+        self.buffer = RingBuffer(capacity)
+        self.player_log = None
+        self.lost = 0
+        folder = module_log_dir(name)
+        prune_sessions(folder, KEEP_SESSIONS - 1)
+        self.path = os.path.join(folder, f"{time.strftime('%Y%m%d-%H%M%S')}-{pid}.log")
+        self.queue = queue.Queue(maxsize=WRITE_QUEUE_BATCHES)
+        self.readers = []
+        self.writer_thread = threading.Thread(target=self._write, name=f"log-writer-{name}", daemon=True)
+        self.writer_thread.start()
+
+    def add(self, source, texts):
+        """Record a batch of lines from one source."""
+        if not texts:
+            return
+        lines = self.buffer.extend(source, texts)
+        try:
+            self.queue.put_nowait(lines)
+        except queue.Full:
+            # Disk is behind: drop rather than block the reader (and so the child)
+            self.lost += len(lines)
+
+    def _write(self):
+        try:
+            writer = RotatingWriter(self.path)
+        except OSError as e:
+            print(f"Could not open log file {self.path}: {e}")
+            writer = None
+        while True:
+            lines = self.queue.get()
+            if lines is None:
+                break
+            if writer is None:
+                continue
+            try:
+                writer.write(format_lines(lines) + "\n")
+                if self.queue.empty():
+                    writer.flush()
+            except OSError as e:
+                print(f"Could not write log file {self.path}: {e}")
+                writer = None
+        if writer is not None:
+            writer.close()
+
+    def finish(self):
+        """Called once every reader has stopped: flush and close the file."""
+        self.queue.put(None)
+
+
+def split_lines(pending, chunk):
+    """(complete lines as text, unfinished remainder) after appending chunk to pending."""
+    *complete, pending = (pending + chunk).split(b"\n")
+    if len(pending) > MAX_LINE_BYTES:
+        complete.append(pending)
+        pending = b""
+    return [raw.decode("utf-8", errors="replace").rstrip("\r") for raw in complete], pending
+
+
+def follow_file(process, log, source, locate, on_found=None, truncate_at=None):
+    """
+    Follow the file locate() returns (None until it exists) into the log
+    until the process exits, then read whatever is left. Unity rewrites
+    Player.log on start, so a shrinking file is read again from the top.
+    on_found(path) is called once the file is located. With truncate_at,
+    the file (one opened with open_for_append) is emptied whenever that
+    much has been read, so it never grows past about that size.
+    """
+    path, handle, position, pending = None, None, 0, b""
+    try:
+        while True:
+            # Checked before reading, so everything written before the exit is read
+            running = process.poll() is None
+            if path is None:
+                path = locate()
+                if path is not None and on_found is not None:
+                    on_found(path)
+            if path is not None:
+                try:
+                    if handle is None:
+                        handle = open(path, "rb")
+                    if os.fstat(handle.fileno()).st_size < position:
+                        handle.seek(0)
+                        position, pending = 0, b""
+                    for chunk in iter(lambda: handle.read(READ_CHUNK), b""):
+                        position += len(chunk)
+                        lines, pending = split_lines(pending, chunk)
+                        log.add(source, lines)
+                    if truncate_at and position >= truncate_at and running:
+                        # Read to the end: what it held is in the session log now. Only
+                        # output written in the instant between that read and this is lost.
+                        os.truncate(path, 0)
+                        handle.seek(0)
+                        position = 0
+                except OSError:
+                    pass
+            if not running:
+                break
+            time.sleep(TAIL_INTERVAL)
+        if pending:
+            log.add(source, [pending.decode("utf-8", errors="replace").rstrip("\r")])
+    finally:
+        if handle is not None:
+            handle.close()
+
+
+def follow_capture(process, log, source, path):
+    """
+    Follow one capture file until the process exits, emptying it as it goes
+    (its lines are in the session log), then delete it.
+    """
+    follow_file(process, log, source, lambda: path, truncate_at=CAPTURE_TRUNCATE_BYTES)
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def tail_player_log(process, log, since, exe_path):
+    """Follow the Player.log this launch writes (fresh mtime after *since*) until the process exits."""
+    def found(path):
+        log.player_log = path
+
+    follow_file(process, log, PLAYER_LOG, lambda: unity_vr.find_player_log(exe_path, since), found)
+
+
+class LogManager:
+    """Captures the output of every launched process; keeps the latest log of each module."""
+
+    def __init__(self, capacity=BUFFER_LINES, tail_player_log=True):
+        self.capacity = capacity
+        self.tail_player_log = tail_player_log
+        self.lock = threading.Lock()
+        self.logs = {}
+        self.captures = {}    # module -> CaptureFiles waiting for attach()
+
+    def popen_kwargs(self, name):
+        """
+        Popen options that send module *name*'s output to new capture files.
+        Follow with attach() once spawned, or abandon() if the spawn failed.
+        Raises OSError if the files can't be created.
+        """
+        capture = CaptureFiles(name)
+        with self.lock:
+            stale = self.captures.pop(name, None)
+            self.captures[name] = capture
+        if stale is not None:
+            stale.discard()
+        return capture.popen_kwargs()
+
+    def abandon(self, name):
+        with self.lock:
+            capture = self.captures.pop(name, None)
+        if capture is not None:
+            capture.discard()
+
+    def attach(self, name, process, since, exe_path=None):
+        """Start capturing a process spawned with popen_kwargs(name). Returns its ProcessLog."""
+        with self.lock:
+            capture = self.captures.pop(name, None)
+        log = ProcessLog(name, process.pid, self.capacity)
+        targets = []
+        if capture is not None:
+            capture.close()
+            targets += [(follow_capture, (process, log, source, path), source)
+                        for source, path in capture.paths.items()]
+        if self.tail_player_log and exe_path:
+            targets.append((tail_player_log, (process, log, since, exe_path), PLAYER_LOG))
+        for target, args, source in targets:
+            thread = threading.Thread(target=target, args=args, name=f"log-{source}-{name}", daemon=True)
+            thread.start()
+            log.readers.append(thread)
+        # Close the file once all readers are done
+        threading.Thread(target=self._finish, args=(log,), name=f"log-finish-{name}", daemon=True).start()
+        with self.lock:
+            self.logs[name] = log
+        return log
+
+    @staticmethod
+    def _finish(log):
+        for thread in log.readers:
+            thread.join()
+        log.finish()
+
+    def get(self, name):
+        with self.lock:
+            return self.logs.get(name)
+
+    def names(self):
+        with self.lock:
+            return list(self.logs)
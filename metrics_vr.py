@@ -0,0 +1,175 @@
+"""
+Launch-latency instrumentation.
+
+Every launch is split into timed stages measured from the click:
+
+    validated    path checked, about to spawn
+    spawned      Popen returned
+    alive        the child was seen running after spawn
+    first_frame  first window mapped (Windows) or first Player.log write
+
+One row per launch goes into a small SQLite store so we can compare
+p50/p95 per module before and after a build or machine change.
+"""
+import csv
+import math
+import os
+import threading
+import time
+
+import process_vr
+import storage_vr
+import unity_vr
+
+STAGES = ("validated", "spawned", "alive", "first_frame")
+DB_FILENAME = "launch_metrics.sqlite3"
+# Give up waiting for the first frame after this long
+FIRST_FRAME_TIMEOUT = 180.0
+POLL_INTERVAL = 0.05
+LOG_POLL_INTERVAL = 0.5
+
+
+class LaunchTrace:
+    """Stage timings of one launch, in milliseconds since the click."""
+
+    def __init__(self, module):
+        self.module = module
+        self.clicked_wall = time.time()
+        self.clicked = time.perf_counter()
+        self.stages = {}
+        self.first_frame_source = None
+
+    def mark(self, stage):
+        self.stages.setdefault(stage, (time.perf_counter() - self.clicked) * 1000.0)
+
+    def as_row(self):
+        return (self.module, self.clicked_wall, *(self.stages.get(s) for s in STAGES), self.first_frame_source)
+
+
+class MetricsStore:
+    """Append-only table of launch traces."""
+
+    def __init__(self, path=None):
+        self.path = path or storage_vr.data_path(DB_FILENAME)
+        self.lock = threading.Lock()
+        self.db = storage_vr.connect(self.path)
+        self.db.execute(
+            """CREATE TABLE IF NOT EXISTS launches (
+                   id INTEGER PRIMARY KEY,
+                   module TEXT NOT NULL,
+                   clicked_at REAL NOT NULL,
+                   validated_ms REAL,
+                   spawned_ms REAL,
+                   alive_ms REAL,
+                   first_frame_ms REAL,
+                   first_frame_source TEXT
+               )"""
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS launches_module ON launches(module, clicked_at)")
+        self.db.commit()
+
+    def record(self, trace):
+        with self.lock:
+            self.db.execute("INSERT INTO launches VALUES (NULL, ?, ?, ?, ?, ?, ?, ?)", trace.as_row())
+            self.db.commit()
+
+    def summary(self, since=None):
+        """{module: {"launches": n, "<stage>": (p50, p95) or None}} over launches after *since*."""
+        query = "SELECT module, validated_ms, spawned_ms, alive_ms, first_frame_ms FROM launches"
+        params = ()
+        if since is not None:
+            query += " WHERE clicked_at >= ?"
+            params = (since,)
+        with self.lock:
+            rows = self.db.execute(query, params).fetchall()
+
+        per_module = {}
+        for module, *values in rows:
+            per_module.setdefault(module, []).append(values)
+
+        summary = {}
+        for module, launches in per_module.items():
+            entry = {"launches": len(launches)}
+            for i, stage in enumerate(STAGES):
+                samples = sorted(v[i] for v in launches if v[i] is not None)
+                entry[stage] = (percentile(samples, 50), percentile(samples, 95)) if samples else None
+            summary[module] = entry
+        return summary
+
+    def usage(self):
+        """{module: (launch count, last clicked_at)} over every recorded launch."""
+        with self.lock:
+            rows = self.db.execute("SELECT module, COUNT(*), MAX(clicked_at) FROM launches GROUP BY module").fetchall()
+        return {module: (count, last) for module, count, last in rows}
+
+    def export_csv(self, path):
+        """Write every recorded launch to a CSV file. Returns the number of rows."""
+        with self.lock:
+            cursor = self.db.execute("SELECT * FROM launches ORDER BY clicked_at")
+            header = [column[0] for column in cursor.description]
+            rows = cursor.fetchall()
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+        return len(rows)
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+
+def percentile(sorted_samples, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_samples:
+        return None
+    rank = math.ceil(pct / 100.0 * len(sorted_samples))
+    return sorted_samples[max(0, min(len(sorted_samples), rank) - 1)]
+
+
+def watch_launch(trace, process, store, exe_path=None):
+    """
+    Follow a freshly spawned process on a daemon thread until its first frame
+    (or exit / timeout), then write the trace to *store*. With the build's
+    *exe_path*, a fresh Player.log of that build also counts as the first frame.
+    """
+    def run():
+        deadline = time.monotonic() + FIRST_FRAME_TIMEOUT
+        next_log_check = 0.0
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                break
+            trace.mark("alive")
+            if process_vr.find_window(process.pid) is not None:
+                trace.first_frame_source = "window"
+                break
+            now = time.monotonic()
+            if exe_path and now >= next_log_check:
+                next_log_check = now + LOG_POLL_INTERVAL
+                if unity_vr.find_player_log(exe_path, trace.clicked_wall) is not None:
+                    trace.first_frame_source = "player_log"
+                    break
+            time.sleep(POLL_INTERVAL)
+        if trace.first_frame_source is not None:
+            trace.mark("first_frame")
+        try:
+            store.record(trace)
+        except Exception as e:  # metrics must never break a launch
+            print(f"Could not store launch metrics: {e}")
+
+    thread = threading.Thread(target=run, name=f"launch-metrics-{trace.module}", daemon=True)
+    thread.start()
+    return thread
+
+
+def format_ms(value):
+    """Human-readable duration for the metrics table."""
+    if value is None:
+        return "—"
+    if value >= 1000:
+        return f"{value / 1000.0:.2f}s"
+    return f"{value:.0f}ms"
+
+
+def default_export_path():
+    return os.path.join(os.path.expanduser("~"), "launch_metrics.csv")
@@ -0,0 +1,169 @@
+"""
+Cold-start accelerator: warms the OS page cache with a Unity build's
+*_Data folder so the player doesn't read its assets from cold disk.
+
+Files are warmed in parallel, with posix_fadvise(WILLNEED) where the
+platform has it and plain sequential reads elsewhere. The amount
+warmed is capped by a memory budget that never exceeds a fraction of
+the currently *available* RAM, so the page cache of a running
+simulation is not evicted to make room. Within the budget, files are
+taken in the order the player reads them when it starts; one that
+doesn't fit what is left is skipped and smaller ones still go in.
+"""
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import system_vr
+import unity_vr
+
+CHUNK_SIZE = 1024 * 1024
+# Never use more than this share of the currently free RAM
+AVAILABLE_MEMORY_FRACTION = 0.5
+# *_Data files a player reads before its first scene loads
+BOOT_FILES = ("boot.config", "globalgamemanagers", "globalgamemanagers.assets", "data.unity3d", "maindata",
+              "resources.assets", "unity default resources")
+# Scripting code, loaded right after the boot files
+CODE_FOLDERS = ("managed", "il2cpp_data")
+# levelN and sharedassetsN(.assets, .resS): scene N in build order
+SCENE_FILE = re.compile(r"(?:level|sharedassets)(\d+)(?:\.|$)")
+
+
+def cold_start_rank(relative_path):
+    """
+    Sort key of a *_Data file by when a starting player reads it: boot and
+    global data, then code, then scenes in build order (the first scene
+    first), then the rest (resources.resource, StreamingAssets).
+    """
+    parts = relative_path.replace(os.sep, "/").lower().split("/")
+    if len(parts) == 1:
+        if parts[0] in BOOT_FILES:
+            return 0, 0
+        match = SCENE_FILE.match(parts[0])
+        if match:
+            return 2, int(match.group(1))
+    elif parts[0] in CODE_FOLDERS:
+        return 1, 0
+    return 3, 0
+
+
+def list_files(folder):
+    """All (path, size) pairs under folder, in cold-start order (smallest first within a rank)."""
+    files = []
+    for root, _dirs, names in os.walk(folder):
+        for name in names:
+            path = os.path.join(root, name)
+            try:
+                files.append((path, os.path.getsize(path)))
+            except OSError:
+                pass
+    files.sort(key=lambda item: (cold_start_rank(os.path.relpath(item[0], folder)), item[1]))
+    return files
+
+
+def warm_file(path, size, buffer):
+    """Pull one file into the page cache. Returns the number of bytes warmed."""
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    except OSError:
+        return 0
+    try:
+        if hasattr(os, "posix_fadvise"):
+            # Kernel reads ahead asynchronously; no data is copied to us
+            os.posix_fadvise(fd, 0, size, os.POSIX_FADV_WILLNEED)
+            return size
+        warmed = 0
+        with open(fd, "rb", buffering=0, closefd=False) as f:
+            view = memoryview(buffer)
+            while True:
+                read = f.readinto(view)
+                if not read:
+                    break
+                warmed += read
+        return warmed
+    except OSError:
+        return 0
+    finally:
+        os.close(fd)
+
+
+def memory_budget(limit_bytes):
+    """The bytes we may warm right now: the configured limit capped by free RAM."""
+    available = system_vr.available_memory()
+    if available is None:
+        return limit_bytes
+    return min(limit_bytes, int(available * AVAILABLE_MEMORY_FRACTION))
+
+
+class Prefetcher:
+    """
+    Background page-cache warmer.
+    request(exe_path) is cheap and safe to call from the UI thread; repeat
+    requests for a build that is being (or was recently) warmed are ignored.
+    """
+
+    def __init__(self, budget_mb=2048, workers=4, refresh_seconds=600):
+        self.budget_bytes = budget_mb * 1024 * 1024
+        self.workers = workers
+        self.refresh_seconds = refresh_seconds
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        self.lock = threading.Lock()
+        self.in_flight = set()
+        self.warmed_at = {}
+        self.stopped = False
+
+    def request(self, exe_path):
+        """Schedule a warm-up of exe_path's data folder. Returns a Future or None if skipped."""
+        with self.lock:
+            if self.stopped or not exe_path or exe_path in self.in_flight:
+                return None
+            last = self.warmed_at.get(exe_path)
+            if last is not None and time.monotonic() - last < self.refresh_seconds:
+                return None
+            self.in_flight.add(exe_path)
+        return self.executor.submit(self._run, exe_path)
+
+    def stop(self):
+        with self.lock:
+            self.stopped = True
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, exe_path):
+        try:
+            warmed = self.prefetch(exe_path)
+            with self.lock:
+                self.warmed_at[exe_path] = time.monotonic()
+            return warmed
+        finally:
+            with self.lock:
+                self.in_flight.discard(exe_path)
+
+    def prefetch(self, exe_path):
+        """Warm the build's executable and data folder; returns bytes warmed."""
+        files = [(exe_path, os.path.getsize(exe_path))] if os.path.isfile(exe_path) else []
+        files += list_files(unity_vr.data_folder(exe_path))
+
+        # Take files in order; one too big for what is left is skipped, not the end
+        budget = memory_budget(self.budget_bytes)
+        selected, total = [], 0
+        for path, size in files:
+            if total + size > budget:
+                continue
+            selected.append((path, size))
+            total += size
+        if not selected:
+            return 0
+
+        local = threading.local()
+
+        def warm(item):
+            if not hasattr(local, "buffer"):
+                local.buffer = bytearray(CHUNK_SIZE)
+            if self.stopped:
+                return 0
+            return warm_file(item[0], item[1], local.buffer)
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="prefetch-io") as pool:
+            return sum(pool.map(warm, selected))
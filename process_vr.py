@@ -0,0 +1,595 @@
+"""
+Process supervisor for launched simulations.
+
+Owns every child process the launcher starts, tracks its state without
+blocking the caller (one small reaper thread per child waits on it) and
+refuses to start a second copy of a module that is already running,
+whichever launcher (GUI, command line, agent) started the first one: each
+running module has a pid file in the data folder. Each child can be given
+its own CPU affinity and scheduling priority.
+No Qt here: the GUI subscribes through the on_change callback.
+"""
+import contextlib
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import storage_vr
+import system_vr
+
+RUNNING = "running"
+EXITED = "exited"
+CRASHED = "crashed"
+
+# Scheduling priorities, lowest first. Realtime is left out on purpose: a
+# module at realtime priority can starve the VR compositor and the input stack.
+PRIORITIES = ("idle", "below_normal", "normal", "above_normal", "high")
+# POSIX nice value used for each priority (raising above normal needs privileges)
+NICE_VALUES = {"idle": 19, "below_normal": 10, "normal": 0, "above_normal": -5, "high": -10}
+# Win32 priority classes
+PRIORITY_CLASSES = {"idle": 0x40, "below_normal": 0x4000, "normal": 0x20, "above_normal": 0x8000, "high": 0x80}
+# Data folder subfolder with one pid file per running module
+RUNNING_DIRNAME = "running"
+
+
+class AlreadyRunningError(RuntimeError):
+    """Raised when a module is launched while a previous instance is still alive."""
+
+    def __init__(self, record):
+        super().__init__(f"'{record.name}' is already running (PID {record.pid})")
+        self.record = record
+
+
+def parse_cpus(text):
+    """'0-3,6' -> [0, 1, 2, 3, 6]. Raises ValueError on bad input."""
+    cpus = set()
+    for part in filter(None, (p.strip() for p in str(text).split(","))):
+        first, _, last = part.partition("-")
+        first, last = int(first), int(last or first)
+        if first < 0 or last < first:
+            raise ValueError(f"bad CPU range '{part}'")
+        cpus.update(range(first, last + 1))
+    return sorted(cpus)
+
+
+def format_cpus(cpus):
+    """[0, 1, 2, 3, 6] -> '0-3,6'"""
+    ranges = []
+    for cpu in sorted(cpus):
+        if ranges and cpu == ranges[-1][1] + 1:
+            ranges[-1][1] = cpu
+        else:
+            ranges.append([cpu, cpu])
+    return ",".join(str(a) if a == b else f"{a}-{b}" for a, b in ranges)
+
+
+class ProcessOptions:
+    """
+    Scheduling options applied to a module right after it starts.
+    affinity is a list of CPU numbers, priority one of PRIORITIES, nice a
+    POSIX nice value that overrides the priority's (ignored on Windows).
+    None means leave as inherited.
+    """
+
+    def __init__(self, affinity=None, priority=None, nice=None):
+        if priority is not None and priority not in PRIORITIES:
+            raise ValueError(f"priority must be one of {', '.join(PRIORITIES)}")
+        if nice is not None and not -20 <= int(nice) <= 19:
+            raise ValueError("nice must be between -20 and 19")
+        self.affinity = sorted(set(affinity)) if affinity else None
+        self.priority = priority
+        self.nice = int(nice) if nice is not None else None
+
+    @classmethod
+    def from_dict(cls, data):
+        data = data or {}
+        affinity = data.get("affinity")
+        if isinstance(affinity, str):
+            affinity = parse_cpus(affinity)
+        return cls(affinity, data.get("priority"), data.get("nice"))
+
+    def as_dict(self):
+        return {"affinity": self.affinity, "priority": self.priority, "nice": self.nice}
+
+    def merged(self, other):
+        """These options with every field set in *other* replaced."""
+        return ProcessOptions(
+            other.affinity or self.affinity,
+            other.priority or self.priority,
+            other.nice if other.nice is not None else self.nice,
+        )
+
+    def __bool__(self):
+        return bool(self.affinity) or self.priority is not None or self.nice is not None
+
+
+def _windows_process_handle(pid, access):
+    import ctypes
+    handle = ctypes.windll.kernel32.OpenProcess(access, False, pid)
+    if not handle:
+        raise OSError(f"cannot open process {pid}")
+    return handle
+
+
+def set_priority(pid, priority=None, nice=None):
+    """Set a process's scheduling priority (or, on POSIX, an explicit nice value). Raises OSError."""
+    if sys.platform == "win32":
+        if priority is None:
+            return
+        import ctypes
+        PROCESS_SET_INFORMATION = 0x0200
+        handle = _windows_process_handle(pid, PROCESS_SET_INFORMATION)
+        try:
+            if not ctypes.windll.kernel32.SetPriorityClass(handle, PRIORITY_CLASSES[priority]):
+                raise ctypes.WinError()
+        finally:
+            ctypes.windll.kernel32.CloseHandle(handle)
+        return
+    value = nice if nice is not None else NICE_VALUES.get(priority)
+    if value is not None:
+        os.setpriority(os.PRIO_PROCESS, pid, value)
+
+
+def set_affinity(pid, cpus):
+    """Restrict a process to the given CPU numbers. Raises OSError (or ValueError for unknown CPUs)."""
+    if sys.platform == "win32":
+        import ctypes
+        PROCESS_SET_INFORMATION = 0x0200
+        handle = _windows_process_handle(pid, PROCESS_SET_INFORMATION)
+        try:
+            mask = sum(1 << cpu for cpu in cpus)
+            if not ctypes.windll.kernel32.SetProcessAffinityMask(handle, ctypes.c_size_t(mask)):
+                raise ctypes.WinError()
+        finally:
+            ctypes.windll.kernel32.CloseHandle(handle)
+        return
+    if not hasattr(os, "sched_setaffinity"):
+        raise OSError("CPU affinity is not supported on this platform")
+    os.sched_setaffinity(pid, cpus)
+
+
+def apply_options(pid, options):
+    """Apply ProcessOptions to a running process. Returns a list of problems (empty if all applied)."""
+    problems = []
+    if options.affinity:
+        try:
+            set_affinity(pid, options.affinity)
+        except (OSError, ValueError) as e:
+            problems.append(f"affinity {format_cpus(options.affinity)}: {e}")
+    if options.priority is not None or options.nice is not None:
+        try:
+            set_priority(pid, options.priority, options.nice)
+        except OSError as e:
+            label = options.priority if options.nice is None else f"nice {options.nice}"
+            problems.append(f"priority {label}: {e}")
+    return problems
+
+
+def terminate_pid(pid, timeout=5.0):
+    """
+    Ask a process this launcher didn't start to close, killing it if it
+    doesn't within timeout (on Windows it is ended at once: there is no
+    gentle way for a process we don't own). Returns False if it was already
+    gone. Raises OSError, e.g. if it belongs to another user.
+    """
+    if sys.platform == "win32":
+        import ctypes
+        PROCESS_TERMINATE = 0x0001
+        try:
+            handle = _windows_process_handle(pid, PROCESS_TERMINATE)
+        except OSError:
+            if system_vr.process_started(pid) is None:
+                return False
+            raise
+        try:
+            if not ctypes.windll.kernel32.TerminateProcess(handle, 1):
+                raise ctypes.WinError()
+        finally:
+            ctypes.windll.kernel32.CloseHandle(handle)
+        return True
+    import signal
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except ProcessLookupError:
+        return False
+    deadline = time.monotonic() + timeout
+    while system_vr.process_started(pid) is not None:
+        if time.monotonic() >= deadline:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGKILL)
+            break
+        time.sleep(0.1)
+    return True
+
+
+class ProcessRecord:
+    """State of one launched simulation."""
+
+    def __init__(self, name, exe_path, process):
+        self.name = name
+        self.exe_path = exe_path
+        self.process = process
+        self.pid = process.pid
+        self.started_at = time.monotonic()
+        self.ended_at = None
+        self.returncode = None
+        # ProcessOptions that could not be applied, as messages
+        self.option_problems = []
+        # Set when the launcher closed it, so a non-zero exit isn't taken for a crash
+        self.stop_requested = False
+        # Launch profile it was started with (profiles_vr), if any
+        self.profile = None
+
+    @property
+    def state(self):
+        if self.returncode is None:
+            return RUNNING
+        return EXITED if self.returncode == 0 else CRASHED
+
+    @property
+    def runtime(self):
+        """Seconds since launch (frozen once the process has ended)."""
+        end = self.ended_at if self.ended_at is not None else time.monotonic()
+        return end - self.started_at
+
+    def as_dict(self):
+        return {
+            "name": self.name,
+            "exe_path": self.exe_path,
+            "pid": self.pid,
+            "state": self.state,
+            "returncode": self.returncode,
+            "runtime": round(self.runtime, 3),
+            "profile": self.profile,
+        }
+
+
+class RunningProcess:
+    """A module started by another launcher on this machine, from its pid file."""
+
+    state = RUNNING
+
+    def __init__(self, name, exe_path, pid, started=None):
+        self.name = name
+        self.exe_path = exe_path
+        self.pid = pid
+        self.started = started
+
+    def as_dict(self):
+        return {"name": self.name, "exe_path": self.exe_path, "pid": self.pid, "state": self.state}
+
+
+@contextlib.contextmanager
+def file_lock(path, wait=True):
+    """
+    Hold an exclusive lock on path (created if missing), across processes.
+    Yields True; with wait=False it yields False at once, without the lock,
+    if someone else holds it.
+    """
+    with open(path, "a+b") as f:
+        if sys.platform == "win32":
+            import msvcrt
+            f.seek(0)
+            try:
+                # LK_LOCK retries for about ten seconds before raising OSError
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK if wait else msvcrt.LK_NBLCK, 1)
+            except OSError:
+                if wait:
+                    raise
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX if wait else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class RunningRegistry:
+    """
+    One pid file per running module, shared by every launcher using the same
+    data folder. A pid file whose process is gone (or whose PID now belongs
+    to another process) is stale and ignored.
+    """
+
+    def __init__(self, folder=None):
+        self.folder = folder or os.path.join(storage_vr.data_dir(), RUNNING_DIRNAME)
+        os.makedirs(self.folder, exist_ok=True)
+
+    def _path(self, name, suffix):
+        digest = hashlib.sha1(name.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.folder, digest + suffix)
+
+    def lock(self, name):
+        """Context manager serialising check-and-start of one module across processes."""
+        return file_lock(self._path(name, ".lock"))
+
+    @staticmethod
+    def _load(path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            pid, recorded = int(data["pid"]), data.get("started")
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        started = system_vr.process_started(pid)
+        if started is None:
+            return None
+        # 0.0 means the platform can't tell; trust the PID then
+        if started and recorded and abs(started - recorded) > 1.0:
+            return None
+        return RunningProcess(data.get("name"), data.get("exe_path"), pid, recorded)
+
+    def find(self, name):
+        """RunningProcess of the module if some launcher's instance of it is alive, else None."""
+        record = self._load(self._path(name, ".json"))
+        if record is not None:
+            record.name = name
+        return record
+
+    def running(self):
+        """RunningProcess of every module some launcher has running."""
+        try:
+            paths = [entry.path for entry in os.scandir(self.folder) if entry.name.endswith(".json")]
+        except OSError:
+            return []
+        return [record for record in map(self._load, paths) if record is not None]
+
+    def add(self, record):
+        data = {
+            "name": record.name,
+            "exe_path": record.exe_path,
+            "pid": record.pid,
+            "started": system_vr.process_started(record.pid),
+            "launcher_pid": os.getpid(),
+        }
+        path = self._path(record.name, ".json")
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(path + ".tmp", path)
+
+    def remove(self, record):
+        """Drop the module's pid file if it still describes *record*."""
+        path = self._path(record.name, ".json")
+        with self.lock(record.name):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    if json.load(f).get("pid") != record.pid:
+                        return
+                os.remove(path)
+            except (OSError, ValueError):
+                pass
+
+
+class ProcessSupervisor:
+    """
+    Starts simulations and keeps a record per module name.
+    on_change(name) is called from the reaper thread whenever a module
+    starts or ends; GUI code must marshal it to the UI thread.
+    options(name), if given, returns the ProcessOptions for a module.
+    registry (a RunningRegistry, by default the data folder's) is where
+    launchers in other processes see this one's modules, and it theirs.
+    """
+
+    def __init__(self, on_change=None, options=None, registry=None):
+        self.on_change = on_change
+        self.options = options
+        self.registry = registry or RunningRegistry()
+        self.records = {}
+        self.lock = threading.Lock()
+
+    def get(self, name):
+        with self.lock:
+            return self.records.get(name)
+
+    def is_running(self, name):
+        record = self.get(name)
+        return record is not None and record.state == RUNNING
+
+    def running(self):
+        with self.lock:
+            return [r for r in self.records.values() if r.state == RUNNING]
+
+    def options_for(self, name):
+        options = self.options(name) if self.options is not None else None
+        return options or ProcessOptions()
+
+    def launch(self, name, exe_path, args=(), options=None, **popen_kwargs):
+        """
+        Start exe_path for module *name* with its folder as working directory,
+        then apply its ProcessOptions (*options*, else the supervisor's).
+        Raises AlreadyRunningError if the module is still running, started
+        by this launcher or any other.
+        """
+        options = options or self.options_for(name)
+        # The cross-process lock can take a while: self.lock is only held for
+        # the dict, so get()/running() on the UI thread never wait behind it
+        with self.registry.lock(name):
+            current = self.get(name)
+            if current is not None and current.state == RUNNING:
+                raise AlreadyRunningError(current)
+            current = self.registry.find(name)
+            if current is not None:
+                raise AlreadyRunningError(current)
+
+            # The *_Data folder must sit next to the exe, so run from there
+            popen_kwargs.setdefault("cwd", os.path.dirname(exe_path) or None)
+            if sys.platform == "win32" and options.priority is None:
+                # Otherwise a child inherits the launcher's lowered priority class (see gui low-power mode)
+                popen_kwargs["creationflags"] = popen_kwargs.get("creationflags", 0) | subprocess.NORMAL_PRIORITY_CLASS
+            process = subprocess.Popen([exe_path, *args], **popen_kwargs)
+            record = ProcessRecord(name, exe_path, process)
+            with self.lock:
+                self.records[name] = record
+            try:
+                self.registry.add(record)
+            except OSError as e:
+                print(f"Could not record '{name}' as running: {e}")
+
+        if options:
+            # Applied right after spawn: the player is still loading, well before its first frame
+            record.option_problems = apply_options(record.pid, options)
+
+        reaper = threading.Thread(target=self._reap, args=(record,), name=f"reaper-{name}", daemon=True)
+        reaper.start()
+        self._notify(name)
+        return record
+
+    def terminate(self, name, timeout=5.0, wait=True):
+        """
+        Ask a running module to close, killing it if it doesn't within timeout.
+        With wait=False this returns at once and the kill, if needed, follows
+        from a background thread; on_change reports the exit either way.
+        """
+        record = self.get(name)
+        if record is None or record.state != RUNNING:
+            return False
+        record.stop_requested = True
+        record.process.terminate()
+        if wait:
+            self._kill_after(record, timeout)
+        else:
+            threading.Thread(target=self._kill_after, args=(record, timeout), name=f"terminate-{name}",
+                             daemon=True).start()
+        return True
+
+    @staticmethod
+    def _kill_after(record, timeout):
+        try:
+            record.process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            record.process.kill()
+
+    def _reap(self, record):
+        returncode = record.process.wait()
+        with self.lock:
+            record.ended_at = time.monotonic()
+            record.returncode = returncode
+        try:
+            self.registry.remove(record)
+        finally:
+            # The card must leave "running" even if the pid file can't be cleared
+            self._notify(record.name)
+
+    def _notify(self, name):
+        if self.on_change is not None:
+            self.on_change(name)
+
+
+def format_runtime(seconds):
+    """Format a duration as m:ss or h:mm:ss."""
+    seconds = int(seconds)
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
+
+
+def find_window(pid):
+    """Handle of the first visible top-level window owned by *pid*, or None (Windows only)."""
+    if sys.platform != "win32":
+        return None
+
+    import ctypes
+    from ctypes import wintypes
+
+    user32 = ctypes.windll.user32
+    found = []
+
+    @ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+    def enum_proc(hwnd, _lparam):
+        window_pid = wintypes.DWORD()
+        user32.GetWindowThreadProcessId(hwnd, ctypes.byref(window_pid))
+        if window_pid.value == pid and user32.IsWindowVisible(hwnd):
+            found.append(hwnd)
+            return False
+        return True
+
+    user32.EnumWindows(enum_proc, 0)
+    return found[0] if found else None
+
+
+def focus_process(pid):
+    """Bring the main window of *pid* to the front. Returns True if a window was found."""
+    hwnd = find_window(pid)
+    if hwnd is None:
+        return False
+
+    import ctypes
+    user32 = ctypes.windll.user32
+    SW_RESTORE = 9
+    if user32.IsIconic(hwnd):
+        user32.ShowWindow(hwnd, SW_RESTORE)
+    user32.SetForegroundWindow(hwnd)
+    return True
+
+
+def fill_screen(pid):
+    """
+    Show the main window of *pid* borderless over its whole monitor (as
+    Unity's fullscreen-window mode does) and bring it to the front.
+    Returns True if a window was found.
+    """
+    hwnd = find_window(pid)
+    if hwnd is None:
+        return False
+
+    import ctypes
+    from ctypes import wintypes
+
+    class MONITORINFO(ctypes.Structure):
+        _fields_ = [
+            ("cbSize", wintypes.DWORD),
+            ("rcMonitor", wintypes.RECT),
+            ("rcWork", wintypes.RECT),
+            ("dwFlags", wintypes.DWORD),
+        ]
+
+    user32 = ctypes.windll.user32
+    SW_RESTORE = 9
+    GWL_STYLE = -16
+    WS_CAPTION = 0x00C00000
+    WS_THICKFRAME = 0x00040000
+    MONITOR_DEFAULTTONEAREST = 2
+    SWP_FRAMECHANGED = 0x0020
+    if user32.IsIconic(hwnd):
+        user32.ShowWindow(hwnd, SW_RESTORE)
+    style = user32.GetWindowLongW(hwnd, GWL_STYLE)
+    user32.SetWindowLongW(hwnd, GWL_STYLE, style & ~(WS_CAPTION | WS_THICKFRAME))
+    user32.MonitorFromWindow.restype = wintypes.HMONITOR
+    info = MONITORINFO()
+    info.cbSize = ctypes.sizeof(info)
+    user32.GetMonitorInfoW(user32.MonitorFromWindow(hwnd, MONITOR_DEFAULTTONEAREST), ctypes.byref(info))
+    screen = info.rcMonitor
+    user32.SetWindowPos(hwnd, None, screen.left, screen.top, screen.right - screen.left,
+                        screen.bottom - screen.top, SWP_FRAMECHANGED)
+    user32.SetForegroundWindow(hwnd)
+    return True
+
+
+def minimize_process(pid):
+    """Minimise the main window of *pid* without activating it. Returns True if a window was found."""
+    hwnd = find_window(pid)
+    if hwnd is None:
+        return False
+
+    import ctypes
+    SW_SHOWMINNOACTIVE = 7
+    ctypes.windll.user32.ShowWindow(hwnd, SW_SHOWMINNOACTIVE)
+    return True
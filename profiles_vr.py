@@ -0,0 +1,275 @@
+"""
+Launch profiles: Unity player arguments matched to the machine.
+
+A profile is a set of standard Unity player command-line arguments
+(-screen-width/-screen-height, -screen-quality, -screen-fullscreen). The
+tiers go from "low" to "ultra"; "default" passes nothing and leaves the
+build's own settings alone.
+
+Which profile a module gets, per machine:
+
+1. the profile chosen for it in the settings, if any, else
+2. the profile learned for it here: when a module keeps crashing with a
+   profile (MIN_RUNS sessions, more than MAX_CRASH_RATE of them crashed),
+   it steps down one tier, else
+3. the machine's tier, from a one-time hardware probe (logical CPUs,
+   RAM and a short single-core benchmark).
+
+Settings, probe and learned profiles live in the catalogue settings,
+tagged with the station name so a copied data folder probes again.
+No Qt here.
+"""
+import socket
+import threading
+import time
+
+import system_vr
+import telemetry_vr
+
+SETTINGS_KEY = "launch_profiles"
+AUTO = "auto"
+DEFAULT = "default"
+TIERS = ("low", "medium", "high", "ultra")
+# Arguments of each tier; "quality" is a quality level name from the build's
+# Quality settings (Unity's defaults are used here, override per station)
+PRESETS = {
+    "low": {"width": 1280, "height": 720, "quality": "Low", "fullscreen": False},
+    "medium": {"width": 1600, "height": 900, "quality": "Medium", "fullscreen": True},
+    "high": {"width": 1920, "height": 1080, "quality": "High", "fullscreen": True},
+    "ultra": {"width": 2560, "height": 1440, "quality": "Ultra", "fullscreen": True},
+}
+# cpu_benchmark() result of a mid-range desktop core: CPU score 1.0
+REFERENCE_CPU_RATE = 40.0
+GB = 1024 ** 3
+# Lowest (cores, RAM in GB, CPU score) for each tier above "low"
+TIER_REQUIREMENTS = (
+    ("ultra", 12, 32, 1.3),
+    ("high", 8, 16, 1.0),
+    ("medium", 4, 8, 0.6),
+)
+# A profile is judged after this many sessions with it
+MIN_RUNS = 3
+MAX_CRASH_RATE = 0.34
+# How long headless callers (command line) wait for the one-time hardware probe
+PROBE_WAIT = 5.0
+
+# Where a module's profile came from
+CHOSEN = "chosen"
+LEARNED = "learned"
+MACHINE = "machine"
+
+
+class LaunchProfile:
+    """Named Unity player arguments."""
+
+    def __init__(self, name, width=None, height=None, quality=None, fullscreen=None):
+        self.name = name
+        self.width = width
+        self.height = height
+        self.quality = quality
+        self.fullscreen = fullscreen
+
+    @classmethod
+    def from_dict(cls, name, data):
+        return cls(name, data.get("width"), data.get("height"), data.get("quality"), data.get("fullscreen"))
+
+    def args(self):
+        args = []
+        if self.width and self.height:
+            args += ["-screen-width", str(self.width), "-screen-height", str(self.height)]
+        if self.quality:
+            args += ["-screen-quality", str(self.quality)]
+        if self.fullscreen is not None:
+            args += ["-screen-fullscreen", "1" if self.fullscreen else "0"]
+        return args
+
+    def describe(self):
+        if self.name == DEFAULT:
+            return "build defaults"
+        parts = []
+        if self.width and self.height:
+            parts.append(f"{self.width}×{self.height}")
+        if self.quality:
+            parts.append(f"{self.quality} quality")
+        if self.fullscreen is not None:
+            parts.append("fullscreen" if self.fullscreen else "windowed")
+        return ", ".join(parts)
+
+
+def combine(profile_args, args):
+    """Profile arguments followed by args; a flag given in args replaces the profile's."""
+    flags = {arg for arg in args if arg.startswith("-")}
+    combined, position = [], 0
+    while position < len(profile_args):
+        # Profile arguments are always flag/value pairs
+        flag, value = profile_args[position], profile_args[position + 1]
+        if flag not in flags:
+            combined += [flag, value]
+        position += 2
+    return combined + list(args)
+
+
+def probe_hardware():
+    """Cores, RAM and CPU score of this machine (takes about a tenth of a second)."""
+    memory = system_vr.total_memory()
+    return {
+        "station": socket.gethostname(),
+        "cores": system_vr.cpu_count(),
+        "memory_gb": round(memory / GB, 1) if memory else None,
+        "cpu_score": round(system_vr.cpu_benchmark() / REFERENCE_CPU_RATE, 2),
+        "probed_at": time.time(),
+    }
+
+
+def tier_for(probe):
+    """The highest tier whose requirements the probed machine meets."""
+    memory = probe.get("memory_gb") or 0
+    for tier, cores, memory_gb, cpu_score in TIER_REQUIREMENTS:
+        if probe["cores"] >= cores and memory >= memory_gb and probe["cpu_score"] >= cpu_score:
+            return tier
+    return "low"
+
+
+def step_down(tier):
+    return TIERS[max(0, TIERS.index(tier) - 1)]
+
+
+class ProfileManager:
+    """
+    Picks each module's launch profile and learns from how its sessions end.
+    Subscribe to a telemetry_vr.SessionLog with watch(); on_change(name,
+    old, new) is called (from the session thread) when a module is moved to
+    a lower profile. Until the one-time hardware probe has finished, the
+    machine's profile is DEFAULT; on_probed() is called (from the probe
+    thread) once it has.
+    """
+
+    def __init__(self, catalog, on_change=None, on_probed=None):
+        self.catalog = catalog
+        self.on_change = on_change
+        self.on_probed = on_probed
+        self.lock = threading.Lock()
+        self.station = socket.gethostname()
+        self.settings = self._load()
+        self.active = {}      # module -> profile name of the session running now
+        self.probed = threading.Event()
+        self.thread = None
+        if self.settings.get("probe"):
+            self.probed.set()
+        else:
+            # One-time probe, off the caller's thread
+            self.thread = threading.Thread(target=self.probe, name="hardware-probe", daemon=True)
+            self.thread.start()
+
+    def _load(self):
+        settings = self.catalog.get_setting(SETTINGS_KEY) or {}
+        if settings.get("station") != self.station:
+            # New machine (or a data folder copied from another one): probe and learn afresh
+            settings = {"station": self.station, "modules": settings.get("modules", {}),
+                        "presets": settings.get("presets", {})}
+        settings.setdefault("modules", {})
+        settings.setdefault("learned", {})
+        settings.setdefault("stats", {})
+        settings.setdefault("presets", {})
+        return settings
+
+    def _save(self):
+        self.catalog.set_setting(SETTINGS_KEY, self.settings)
+
+    def probe(self):
+        """Run the hardware probe (again) and keep its result."""
+        probe = probe_hardware()
+        with self.lock:
+            self.settings["probe"] = probe
+            self._save()
+        self.probed.set()
+        if self.on_probed is not None:
+            self.on_probed()
+
+    def stop(self):
+        """Let a running probe save its result (call before closing the catalogue)."""
+        if self.thread is not None:
+            self.thread.join()
+
+    # ==========================================
+    # 🔹 PROFILES
+    # ==========================================
+    def hardware(self, timeout=0):
+        """
+        The probe results, or None while the one-time probe is still running.
+        Waits up to *timeout* seconds for it (never on the UI thread).
+        """
+        if timeout:
+            self.probed.wait(timeout)
+        with self.lock:
+            return self.settings.get("probe")
+
+    def machine_tier(self):
+        """The tier this machine's probe points to; DEFAULT until the probe is done."""
+        probe = self.hardware()
+        return tier_for(probe) if probe else DEFAULT
+
+    def profile(self, name):
+        """LaunchProfile for a profile name (a tier or "default")."""
+        if name == DEFAULT or name not in TIERS:
+            return LaunchProfile(DEFAULT)
+        with self.lock:
+            preset = dict(PRESETS[name], **self.settings["presets"].get(name, {}))
+        return LaunchProfile.from_dict(name, preset)
+
+    def choice(self, module):
+        """(profile name, where it came from) for a module."""
+        with self.lock:
+            chosen = self.settings["modules"].get(module, AUTO)
+            learned = self.settings["learned"].get(module)
+        if chosen != AUTO:
+            return chosen, CHOSEN
+        if learned:
+            return learned, LEARNED
+        return self.machine_tier(), MACHINE
+
+    def choose(self, module, profile):
+        """Set a module's profile (AUTO: pick by machine, and forget what was learned)."""
+        with self.lock:
+            if profile == AUTO:
+                self.settings["modules"].pop(module, None)
+                self.settings["learned"].pop(module, None)
+                self.settings["stats"].pop(module, None)
+            else:
+                self.settings["modules"][module] = profile
+            self._save()
+
+    def args_for(self, module, override=None):
+        """(profile name, Unity arguments) to launch module with; override is a profile name."""
+        name = override or self.choice(module)[0]
+        return name, self.profile(name).args()
+
+    # ==========================================
+    # 🔹 LEARNING
+    # ==========================================
+    def launched(self, module, profile):
+        """Note the profile a module's session runs with, to judge it when the session ends."""
+        with self.lock:
+            self.active[module] = profile
+
+    def watch(self, sessions):
+        """Learn from the sessions logged in a telemetry_vr.SessionLog."""
+        sessions.listeners.append(self.on_session)
+
+    def on_session(self, module, outcome, duration):
+        with self.lock:
+            profile = self.active.pop(module, None)
+            if profile is None or outcome == telemetry_vr.LAUNCH_FAILED:
+                return
+            runs, crashes = self.settings["stats"].setdefault(module, {}).get(profile, (0, 0))
+            runs, crashes = runs + 1, crashes + (outcome == telemetry_vr.CRASHED)
+            self.settings["stats"][module][profile] = (runs, crashes)
+            lower = None
+            # Only automatic choices move, and only down the tiers
+            if (self.settings["modules"].get(module, AUTO) == AUTO and profile in TIERS[1:]
+                    and runs >= MIN_RUNS and crashes / runs > MAX_CRASH_RATE):
+                lower = step_down(profile)
+                self.settings["learned"][module] = lower
+            self._save()
+        if lower is not None and self.on_change is not None:
+            self.on_change(module, profile, lower)
@@ -0,0 +1,370 @@
+"""
+Resource-aware launch scheduling.
+
+Sits between the UI and the process supervisor. Before a module starts,
+its expected cost (memory and CPU, learned from its previous runs) is
+compared with what the machine has free right now:
+
+* it fits: the launch is admitted and started at once;
+* it doesn't fit yet, but the shortage should pass by itself (another
+  module is still loading, or the load comes from outside the launcher):
+  the launch is queued and started as soon as it fits;
+* it doesn't fit because of modules the launcher is running: the user is
+  asked to close one of them first (or to launch anyway);
+* it can't fit even with the machine as idle as it has been seen: it is
+  rejected at once (the user can still launch anyway).
+
+A queued launch that still doesn't fit after QUEUE_TIMEOUT is handed back
+to the user like a blocked one. A monitor thread samples the machine
+about once a second, records each running module's peak memory and CPU
+time, and drains the queue.
+No Qt here: the GUI subscribes through the on_event callback.
+"""
+import threading
+import time
+
+import launch_vr
+import process_vr
+import storage_vr
+import system_vr
+
+ADMITTED = "admitted"
+QUEUED = "queued"
+BLOCKED = "blocked"
+REJECTED = "rejected"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+DB_FILENAME = "scheduler.sqlite3"
+GB = 1024 ** 3
+# Assumed cost of a module that has never run here: a typical Unity VR build
+DEFAULT_MEMORY = 2 * GB
+DEFAULT_CPU = 0.35
+# Memory that must stay free after a launch, for the OS and the VR runtime
+MEMORY_HEADROOM = 1 * GB
+# Busiest the CPUs may be (0..1) once the new module is counted in
+CPU_LIMIT = 0.9
+# A module is still loading (and not yet at its peak) this long after spawn
+WARMUP_SECONDS = 45.0
+# Shorter runs are not used to learn costs (crashes, wrong clicks)
+MIN_LEARN_SECONDS = 20.0
+# Weight of the newest run in the learned cost
+LEARN_RATE = 0.3
+SAMPLE_INTERVAL = 1.0
+# A queued launch waits at most this long before the user decides instead
+QUEUE_TIMEOUT = 300.0
+
+
+class ModuleCost:
+    """Expected peak memory (bytes) and CPU share (0..1 of the whole machine) of one module."""
+
+    def __init__(self, memory=DEFAULT_MEMORY, cpu=DEFAULT_CPU, runs=0):
+        self.memory = memory
+        self.cpu = cpu
+        self.runs = runs
+
+
+class CostStore:
+    """Learned module costs, kept across restarts."""
+
+    def __init__(self, path=None):
+        self.path = path or storage_vr.data_path(DB_FILENAME)
+        self.lock = threading.Lock()
+        self.db = storage_vr.connect(self.path)
+        self.db.execute(
+            """CREATE TABLE IF NOT EXISTS module_costs (
+                   module TEXT PRIMARY KEY,
+                   memory_bytes INTEGER NOT NULL,
+                   cpu_fraction REAL NOT NULL,
+                   runs INTEGER NOT NULL
+               )"""
+        )
+        self.db.commit()
+
+    def get(self, module):
+        with self.lock:
+            row = self.db.execute(
+                "SELECT memory_bytes, cpu_fraction, runs FROM module_costs WHERE module = ?", (module,)
+            ).fetchone()
+        return ModuleCost(*row) if row else ModuleCost()
+
+    def learn(self, module, peak_memory, cpu):
+        """Blend one observed run into the module's cost (the first run replaces the default)."""
+        cost = self.get(module)
+        if cost.runs:
+            memory = round(cost.memory + LEARN_RATE * (peak_memory - cost.memory))
+            cpu = cost.cpu + LEARN_RATE * (cpu - cost.cpu)
+        else:
+            memory = peak_memory
+        with self.lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO module_costs VALUES (?, ?, ?, ?)",
+                (module, int(memory), float(cpu), cost.runs + 1),
+            )
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+
+class Decision:
+    """Outcome of submitting a launch."""
+
+    def __init__(self, state, reason="", record=None, position=None, blockers=()):
+        self.state = state
+        self.reason = reason
+        self.record = record
+        self.position = position
+        self.blockers = list(blockers)
+
+
+class Usage:
+    """Peak memory and CPU time seen for one running module."""
+
+    def __init__(self, record):
+        self.record = record
+        self.memory = 0
+        self.peak_memory = 0
+        self.cpu_time = 0.0
+
+
+class LaunchScheduler:
+    """
+    Admits, queues or blocks launches based on free resources.
+    on_event(name, state, detail) is called from the monitor thread when a
+    queued launch is admitted, fails or is cancelled.
+    """
+
+    def __init__(self, supervisor, metrics=None, costs=None, on_event=None, logs=None, sessions=None,
+                 profiles=None, check=None):
+        self.supervisor = supervisor
+        self.metrics = metrics
+        self.logs = logs
+        self.sessions = sessions
+        self.profiles = profiles
+        # Run again on a queued launch before it starts (the build may have
+        # changed meanwhile); raises launch_vr.LaunchError
+        self.check = check or launch_vr.check
+        # Optional callable(name) that starts freeing resources (e.g. closes a
+        # standby instance) without waiting, and returns True if some are on
+        # their way back; the launch is queued meanwhile
+        self.reclaim = None
+        self.costs = costs or CostStore()
+        self.on_event = on_event
+        self.lock = threading.Lock()
+        self.queue = []
+        self.usage = {}
+        self.cpu = system_vr.CpuSampler()
+        self.cpus = system_vr.cpu_count()
+        self.busy = None
+        # Most memory seen free to the launcher (free RAM plus what its own
+        # modules use): about what the machine has to spare when idle
+        self.idle_memory = 0
+        self.stopping = threading.Event()
+        self.monitor = threading.Thread(target=self._monitor, name="launch-scheduler", daemon=True)
+        self.monitor.start()
+
+    # ==========================================
+    # 🔹 ADMISSION
+    # ==========================================
+    def assess(self, name):
+        """Decision (without side effects) for starting module *name* now."""
+        cost = self.costs.get(name)
+        available = system_vr.available_memory()
+        busy = self.busy
+
+        warming, settled = [], []
+        reserved = ours = 0
+        with self.lock:
+            usage = list(self.usage.values())
+        for item in usage:
+            if item.record.state != process_vr.RUNNING:
+                continue
+            ours += item.memory
+            if item.record.runtime < WARMUP_SECONDS:
+                warming.append(item.record.name)
+                # Still loading: count what it is expected to grow into
+                reserved += max(0, self.costs.get(item.record.name).memory - item.memory)
+            else:
+                settled.append(item.record.name)
+
+        problems = []
+        if available is not None and available - reserved - cost.memory < MEMORY_HEADROOM:
+            problems.append(
+                f"needs ~{cost.memory / GB:.1f} GB RAM, {max(0, available - reserved) / GB:.1f} GB free"
+            )
+        if busy is not None and busy + cost.cpu > CPU_LIMIT:
+            problems.append(f"CPU {busy:.0%} busy")
+        if not problems:
+            return Decision(ADMITTED)
+
+        reason = "; ".join(problems)
+        # Waiting can't help if it wouldn't fit even on the machine at its idlest
+        idle = self.note_idle(available, ours)
+        if idle is not None and idle - cost.memory < MEMORY_HEADROOM:
+            return Decision(REJECTED, f"needs ~{cost.memory / GB:.1f} GB RAM, this machine has "
+                                      f"{max(0, idle - MEMORY_HEADROOM) / GB:.1f} GB to spare")
+        if cost.cpu > CPU_LIMIT:
+            return Decision(REJECTED, f"needs {cost.cpu:.0%} of the CPU")
+        if warming or not settled:
+            # A module is still loading, or the load isn't ours: it should pass
+            return Decision(QUEUED, reason + (f" (waiting for {', '.join(warming)} to load)" if warming else ""))
+        return Decision(BLOCKED, reason, blockers=settled)
+
+    def note_idle(self, available, ours):
+        """Fold a reading into idle_memory and return it (None while memory can't be read)."""
+        if available is None:
+            return None
+        self.idle_memory = max(self.idle_memory, available + ours)
+        return self.idle_memory
+
+    def submit(self, entry, trace=None, force=False):
+        """
+        Start entry now if it fits (or if force, even if it is queued),
+        otherwise queue, block or reject it.
+        Raises process_vr.AlreadyRunningError or OSError from the launch.
+        """
+        name = entry["name"]
+        if force:
+            self.cancel(name, notify=False)
+        position = self.position(name)
+        if position is not None:
+            return Decision(QUEUED, "already queued", position=position)
+        decision = Decision(ADMITTED, "forced") if force else self.assess_reclaiming(name)
+        if decision.state == ADMITTED:
+            decision.record = self._start(entry, trace)
+        elif decision.state == QUEUED:
+            with self.lock:
+                # The click's trace goes along, so the launch is timed from the click
+                self.queue.append((entry, decision.reason, time.monotonic(), trace))
+                decision.position = len(self.queue)
+        return decision
+
+    def assess_reclaiming(self, name):
+        """
+        assess(); if the launch doesn't fit and resources are being reclaimed
+        for it, QUEUED until they're back (the monitor assesses it again).
+        """
+        decision = self.assess(name)
+        if decision.state != ADMITTED and self.reclaim is not None and self.reclaim(name):
+            return Decision(QUEUED, f"{decision.reason} (closing a standby instance to make room)")
+        return decision
+
+    def _start(self, entry, trace=None):
+        record, _watcher = launch_vr.start(
+            self.supervisor, entry, trace, self.metrics, logs=self.logs, sessions=self.sessions,
+            profiles=self.profiles
+        )
+        self.track(record)
+        return record
+
+    def track(self, record):
+        """Count a running module (started here or elsewhere) in admission and cost learning."""
+        with self.lock:
+            self.usage[record.name] = Usage(record)
+
+    # ==========================================
+    # 🔹 QUEUE
+    # ==========================================
+    def position(self, name):
+        """1-based queue position of module *name*, or None."""
+        with self.lock:
+            for index, (entry, _reason, _queued_at, _trace) in enumerate(self.queue):
+                if entry["name"] == name:
+                    return index + 1
+        return None
+
+    def queued_reason(self, name):
+        with self.lock:
+            return next((reason for entry, reason, _queued_at, _trace in self.queue if entry["name"] == name), None)
+
+    def cancel(self, name, notify=True):
+        with self.lock:
+            before = len(self.queue)
+            self.queue = [item for item in self.queue if item[0]["name"] != name]
+            cancelled = len(self.queue) != before
+        if cancelled and notify:
+            self._notify(name, CANCELLED, "")
+        return cancelled
+
+    def expire(self):
+        """Hand launches queued for longer than QUEUE_TIMEOUT back to the user, as blocked."""
+        deadline = time.monotonic() - QUEUE_TIMEOUT
+        with self.lock:
+            expired = [item for item in self.queue if item[2] < deadline]
+            self.queue = [item for item in self.queue if item[2] >= deadline]
+        for entry, reason, _queued_at, _trace in expired:
+            self._notify(entry["name"], BLOCKED, f"{reason} (still waiting after {QUEUE_TIMEOUT / 60:.0f} min)")
+
+    def drain(self):
+        """Start queued launches from the front for as long as they fit."""
+        self.expire()
+        while True:
+            with self.lock:
+                if not self.queue:
+                    return
+                entry, _reason, queued_at, trace = self.queue[0]
+            decision = self.assess_reclaiming(entry["name"])
+            if decision.state == QUEUED:
+                with self.lock:
+                    if self.queue and self.queue[0][0] is entry:
+                        self.queue[0] = (entry, decision.reason, queued_at, trace)
+                return
+            with self.lock:
+                if not self.queue or self.queue[0][0] is not entry:
+                    continue
+                self.queue.pop(0)
+            if decision.state in (BLOCKED, REJECTED):
+                # Modules we run are in the way, or it can't fit: the user has to decide
+                self._notify(entry["name"], BLOCKED, decision.reason)
+                continue
+            try:
+                self.check(entry)
+                record = self._start(entry, trace)
+            except (launch_vr.LaunchError, process_vr.AlreadyRunningError, OSError) as e:
+                if self.sessions is not None and not isinstance(e, process_vr.AlreadyRunningError):
+                    self.sessions.failed(entry["name"])
+                self._notify(entry["name"], FAILED, str(e))
+            else:
+                self._notify(entry["name"], ADMITTED, f"PID {record.pid}")
+
+    # ==========================================
+    # 🔹 MONITOR
+    # ==========================================
+    def sample(self):
+        """Refresh CPU load and per-module usage; learn the cost of modules that ended."""
+        self.busy = self.cpu.busy()
+        with self.lock:
+            usage = list(self.usage.items())
+        self.note_idle(system_vr.available_memory(),
+                       sum(item.memory for _name, item in usage if item.record.state == process_vr.RUNNING))
+        for name, item in usage:
+            if item.record.state == process_vr.RUNNING:
+                measured = system_vr.process_usage(item.record.pid)
+                if measured is not None:
+                    item.memory, item.cpu_time = measured
+                    item.peak_memory = max(item.peak_memory, item.memory)
+                continue
+            with self.lock:
+                if self.usage.get(name) is item:
+                    del self.usage[name]
+            runtime = item.record.runtime
+            if runtime >= MIN_LEARN_SECONDS and item.peak_memory:
+                self.costs.learn(name, item.peak_memory, min(1.0, item.cpu_time / runtime / self.cpus))
+
+    def _monitor(self):
+        while not self.stopping.wait(SAMPLE_INTERVAL):
+            try:
+                self.sample()
+                self.drain()
+            except Exception as e:  # keep scheduling even if one probe fails
+                print(f"Launch scheduler error: {e}")
+
+    def _notify(self, name, state, detail):
+        if self.on_event is not None:
+            self.on_event(name, state, detail)
+
+    def stop(self):
+        self.stopping.set()
+        self.monitor.join(timeout=2 * SAMPLE_INTERVAL)
+        self.costs.close()
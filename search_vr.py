@@ -0,0 +1,164 @@
+"""
+In-memory search over catalogue entries (name, description and tags).
+
+Every word of an entry goes into a sorted vocabulary (for prefix matches)
+and a trigram index over that vocabulary (for fuzzy matches), with the
+entries it appears in. A query word matches vocabulary words that equal
+it, start with it, or share enough trigrams with it to survive a typo
+("sugery" finds "surgery"). An entry matches when every query word does;
+hits are ranked by how well and where they matched (name over tags over
+description). Work per keystroke depends on the vocabulary touched, not
+on the number of entries, and entries can be added, changed or removed
+one at a time. No Qt here.
+"""
+import bisect
+import re
+
+# Where a word was found, as a ranking weight
+FIELD_WEIGHTS = (("name", 3.0), ("tags", 2.0), ("description", 1.0))
+EXACT = 1.0
+PREFIX = 0.9
+# Fuzzy matches score below any prefix match
+FUZZY = 0.7
+# Minimum trigram similarity (Dice coefficient) for a fuzzy match
+FUZZY_THRESHOLD = 0.45
+# Shorter query words (and words with digits) only match as a prefix
+FUZZY_MIN_LENGTH = 3
+
+_WORD = re.compile(r"\w+")
+
+
+def words(text):
+    return _WORD.findall(text.lower())
+
+
+def trigrams(word):
+    """Trigrams of a word padded with a space at both ends, so its start and end count."""
+    padded = f" {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def entry_words(entry):
+    """{word: weight} of an entry: the weight of the best field the word appears in."""
+    found = {}
+    for field, weight in FIELD_WEIGHTS:
+        value = entry.get(field) or ""
+        text = " ".join(value) if isinstance(value, (list, tuple)) else value
+        for word in words(text):
+            if weight > found.get(word, 0.0):
+                found[word] = weight
+    return found
+
+
+class SearchIndex:
+    """Prefix and trigram index of catalogue entries, keyed by any hashable key (e.g. a model row)."""
+
+    def __init__(self):
+        self.keys = {}          # key -> {word: weight}
+        self.postings = {}      # word -> {key: weight}
+        self.vocabulary = []    # sorted words, for prefix lookups
+        self.grams = {}         # trigram -> set of words
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return key in self.keys
+
+    # ==========================================
+    # 🔹 UPDATES
+    # ==========================================
+    def add(self, key, entry):
+        """Index an entry (replacing what was indexed under key before)."""
+        self.remove(key)
+        found = entry_words(entry)
+        self.keys[key] = found
+        for word, weight in found.items():
+            posting = self.postings.get(word)
+            if posting is None:
+                posting = self.postings[word] = {}
+                bisect.insort(self.vocabulary, word)
+                for gram in trigrams(word):
+                    self.grams.setdefault(gram, set()).add(word)
+            posting[key] = weight
+
+    def add_many(self, items):
+        """Index (key, entry) pairs."""
+        for key, entry in items:
+            self.add(key, entry)
+
+    def remove(self, key):
+        """Forget an entry. Returns True if it was indexed."""
+        found = self.keys.pop(key, None)
+        if found is None:
+            return False
+        for word in found:
+            posting = self.postings[word]
+            del posting[key]
+            if not posting:
+                # Last entry with this word: drop it from the vocabulary too
+                del self.postings[word]
+                del self.vocabulary[bisect.bisect_left(self.vocabulary, word)]
+                for gram in trigrams(word):
+                    bucket = self.grams[gram]
+                    bucket.discard(word)
+                    if not bucket:
+                        del self.grams[gram]
+        return True
+
+    def clear(self):
+        self.keys.clear()
+        self.postings.clear()
+        self.vocabulary.clear()
+        self.grams.clear()
+
+    # ==========================================
+    # 🔹 QUERIES
+    # ==========================================
+    def matching_words(self, token):
+        """{vocabulary word: match score} for one query word."""
+        found = {}
+        position = bisect.bisect_left(self.vocabulary, token)
+        while position < len(self.vocabulary) and self.vocabulary[position].startswith(token):
+            word = self.vocabulary[position]
+            found[word] = EXACT if word == token else PREFIX
+            position += 1
+        # A mistyped number is a different module ("mod12" vs "mod13"), not a typo
+        if len(token) >= FUZZY_MIN_LENGTH and not any(ch.isdigit() for ch in token):
+            query = trigrams(token)
+            shared = {}
+            for gram in query:
+                for word in self.grams.get(gram, ()):
+                    shared[word] = shared.get(word, 0) + 1
+            for word, count in shared.items():
+                if word in found:
+                    continue
+                similarity = 2.0 * count / (len(query) + len(word))
+                if similarity >= FUZZY_THRESHOLD:
+                    found[word] = FUZZY * similarity
+        return found
+
+    def search(self, query, limit=None):
+        """
+        Keys of the entries matching every word of query, best first (ties in
+        key order). An empty query returns None, meaning "no filter".
+        """
+        tokens = list(dict.fromkeys(words(query)))
+        if not tokens:
+            return None
+        scores = None
+        for token in tokens:
+            token_scores = {}
+            for word, match in self.matching_words(token).items():
+                for key, weight in self.postings[word].items():
+                    score = match * weight
+                    if score > token_scores.get(key, 0.0):
+                        token_scores[key] = score
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {key: score + token_scores[key] for key, score in scores.items() if key in token_scores}
+            if not scores:
+                return []
+        ranked = sorted(scores, key=lambda key: (-scores[key], key))
+        return ranked[:limit] if limit is not None else ranked
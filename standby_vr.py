@@ -0,0 +1,294 @@
+"""
+Warm-standby pool for fast module switching.
+
+Configured modules are started ahead of time, minimised and in the
+background, while their expected memory fits a budget and the launch
+scheduler says the machine can take them. Launching a module that is on
+standby just brings its window forward, so a switch costs about a second
+instead of a full Unity cold start.
+
+Which modules stay warm follows their recorded use: the most recently
+used first ("lru") or the most often used first ("frequency"). When a
+real launch needs the room, standby instances are closed in the reverse
+order, one at a time and without waiting for them: the launch is queued
+and the scheduler starts it once the memory is back. No Qt here: the GUI subscribes through the on_event callback.
+"""
+import subprocess
+import sys
+import threading
+import time
+
+import launch_vr
+import metrics_vr
+import process_vr
+import scheduler_vr
+
+SETTINGS_KEY = "standby"
+DEFAULT_SETTINGS = {
+    "enabled": False,
+    "modules": [],        # names of the modules to keep warm
+    "budget_mb": 4096,    # expected memory of all standby instances together
+    "policy": "lru",      # "lru" or "frequency"
+}
+POLICIES = ("lru", "frequency")
+# Started windowed, so a standby instance never takes over the display;
+# claim() shows it borderless over the whole screen if its profile is fullscreen
+STANDBY_ARGS = ("-screen-fullscreen", "0")
+REFILL_INTERVAL = 30.0
+# Standby instances are started one at a time, this far apart, so each can
+# reach its real memory use before the next one is admitted
+WARM_SPACING = 15.0
+# Give a standby instance this long to open its window before minimising it
+WINDOW_WAIT_SECONDS = 60.0
+
+WARMED = "warmed"
+RELEASED = "released"
+
+
+def background_popen_kwargs():
+    """Popen options for a child that starts minimised and without taking focus (Windows)."""
+    if sys.platform != "win32":
+        return {}
+    SW_SHOWMINNOACTIVE = 7
+    info = subprocess.STARTUPINFO()
+    info.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    info.wShowWindow = SW_SHOWMINNOACTIVE
+    return {"startupinfo": info}
+
+
+class StandbyPool:
+    """
+    Keeps configured modules running in the background up to a memory budget.
+    on_event(name, state) is called from the pool's thread when an instance
+    is warmed or released.
+    """
+
+    def __init__(self, supervisor, scheduler, catalog, metrics=None, logs=None, on_event=None):
+        self.supervisor = supervisor
+        self.scheduler = scheduler
+        self.catalog = catalog
+        self.metrics = metrics
+        self.logs = logs
+        self.on_event = on_event
+        self.lock = threading.Lock()
+        self.members = {}          # name -> ProcessRecord of a standby instance
+        self.released = set()      # pids we closed on purpose (not crashes)
+        self.closing = []          # ProcessRecords closed for a launch that may not have exited yet
+        self.settings = dict(DEFAULT_SETTINGS, **(catalog.get_setting(SETTINGS_KEY) or {}))
+        self.wake = threading.Event()
+        self.stopping = threading.Event()
+        # A real launch that doesn't fit may close standby instances first
+        scheduler.reclaim = self.release_for
+        self.thread = threading.Thread(target=self._run, name="standby-pool", daemon=True)
+        self.thread.start()
+
+    # ==========================================
+    # 🔹 CONFIGURATION
+    # ==========================================
+    @property
+    def enabled(self):
+        return bool(self.settings["enabled"])
+
+    def configure(self, **changes):
+        """Update and save the settings, then rebalance the pool."""
+        with self.lock:
+            self.settings.update(changes)
+            settings = dict(self.settings)
+        self.catalog.set_setting(SETTINGS_KEY, settings)
+        self.wake.set()
+
+    # ==========================================
+    # 🔹 QUERIES
+    # ==========================================
+    def is_standby(self, name):
+        with self.lock:
+            record = self.members.get(name)
+        return record is not None and record.state == process_vr.RUNNING
+
+    def was_released(self, record):
+        """True if *record* ended because the pool closed it."""
+        return record is not None and record.pid in self.released
+
+    def ranked(self, names):
+        """Modules in keep-warm order: best first according to the policy."""
+        usage = self.metrics.usage() if self.metrics is not None else {}
+        if self.settings["policy"] == "frequency":
+            key = lambda name: (usage.get(name, (0, 0))[0], usage.get(name, (0, 0))[1] or 0)
+        else:
+            key = lambda name: usage.get(name, (0, 0))[1] or 0
+        return sorted(names, key=key, reverse=True)
+
+    # ==========================================
+    # 🔹 CLAIM / RELEASE
+    # ==========================================
+    def claim(self, name):
+        """
+        Hand a standby instance over as the user's session: bring its window
+        forward (filling the screen unless its launch profile is windowed)
+        and stop treating it as standby. Returns its ProcessRecord, or None
+        if the module isn't warm.
+        """
+        with self.lock:
+            record = self.members.pop(name, None)
+        if record is None or record.state != process_vr.RUNNING:
+            return None
+        trace = metrics_vr.LaunchTrace(name)
+        trace.mark("validated")
+        trace.mark("spawned")
+        if self.wants_fullscreen(record):
+            process_vr.fill_screen(record.pid)
+        else:
+            process_vr.focus_process(record.pid)
+        if self.metrics is not None:
+            metrics_vr.watch_launch(trace, record.process, self.metrics, record.exe_path)
+        self.scheduler.track(record)
+        if self.scheduler.sessions is not None:
+            # The session starts when the user switches to it, not when it was warmed
+            self.scheduler.sessions.begin(record, trace.clicked_wall)
+        # Something else may now fit in the budget
+        self.wake.set()
+        return record
+
+    def wants_fullscreen(self, record):
+        """
+        False if the instance's launch profile asks for a window. The
+        "default" profile leaves it to the build, and builds start
+        fullscreen unless set otherwise.
+        """
+        profiles = self.scheduler.profiles
+        if profiles is None or record.profile is None:
+            return True
+        return profiles.profile(record.profile).fullscreen is not False
+
+    def release(self, name, wait=True):
+        """
+        Close one standby instance. Returns True if it was running. With
+        wait=False it is only asked to close; the supervisor reports the exit.
+        """
+        with self.lock:
+            record = self.members.pop(name, None)
+            if record is not None:
+                self.released.add(record.pid)
+        if record is None or record.state != process_vr.RUNNING:
+            return False
+        if not wait:
+            with self.lock:
+                self.closing.append(record)
+        self.supervisor.terminate(name, wait=wait)
+        self._notify(name, RELEASED)
+        return True
+
+    def release_for(self, name):
+        """
+        Scheduler hook: start closing the least valuable standby instance (not
+        *name*'s), unless one closed earlier is still exiting. Never waits.
+        True if resources are on their way back.
+        """
+        with self.lock:
+            self.closing = [record for record in self.closing if record.state == process_vr.RUNNING]
+            if self.closing:
+                return True
+            candidates = [n for n in self.members if n != name]
+        for candidate in reversed(self.ranked(candidates)):
+            if self.release(candidate, wait=False):
+                return True
+        return False
+
+    def stop(self):
+        """Close every standby instance (running sessions are left alone)."""
+        self.stopping.set()
+        self.wake.set()
+        self.thread.join(timeout=2.0)
+        with self.lock:
+            names = list(self.members)
+        for name in names:
+            self.release(name)
+
+    # ==========================================
+    # 🔹 REFILL
+    # ==========================================
+    def rebalance(self):
+        """
+        Close instances no longer wanted or over budget, then start the best
+        wanted module that fits. Returns True if one was started.
+        """
+        with self.lock:
+            # Forget instances that ended on their own
+            for name, record in list(self.members.items()):
+                if record.state != process_vr.RUNNING:
+                    del self.members[name]
+            settings = dict(self.settings)
+
+        wanted = self.ranked(settings["modules"]) if settings["enabled"] else []
+        budget = settings["budget_mb"] * 1024 * 1024
+        keep, used = [], 0
+        for name in wanted:
+            cost = self.scheduler.costs.get(name).memory
+            if used + cost <= budget:
+                keep.append(name)
+                used += cost
+
+        with self.lock:
+            surplus = [name for name in self.members if name not in keep]
+        for name in surplus:
+            self.release(name)
+
+        for name in keep:
+            if self.stopping.is_set():
+                return False
+            with self.lock:
+                if name in self.members:
+                    continue
+            current = self.supervisor.get(name)
+            if current is not None and current.state == process_vr.RUNNING:
+                continue  # already in use as a normal session
+            if self.scheduler.position(name) is not None:
+                continue
+            entry = self.catalog.get(name)
+            if entry is None:
+                continue
+            # Never let a standby instance squeeze a running session
+            if self.scheduler.assess(name).state != scheduler_vr.ADMITTED:
+                return False
+            return self.warm(entry)
+        return False
+
+    def warm(self, entry):
+        """Start one standby instance. Returns True if it started."""
+        try:
+            launch_vr.check(entry)
+            record, _watcher = launch_vr.start(
+                self.supervisor, entry, logs=self.logs, profiles=self.scheduler.profiles, args=STANDBY_ARGS,
+                **background_popen_kwargs()
+            )
+        except (launch_vr.LaunchError, process_vr.AlreadyRunningError, OSError) as e:
+            print(f"Standby start of '{entry['name']}' failed: {e}")
+            return False
+        with self.lock:
+            self.members[entry["name"]] = record
+        self._notify(entry["name"], WARMED)
+        threading.Thread(target=self._minimise, args=(record,), name=f"standby-window-{entry['name']}",
+                         daemon=True).start()
+        return True
+
+    def _minimise(self, record):
+        """Some players ignore the minimised start-up hint: minimise the window once it appears."""
+        deadline = time.monotonic() + WINDOW_WAIT_SECONDS
+        while time.monotonic() < deadline and self.is_standby(record.name):
+            if process_vr.minimize_process(record.pid) or sys.platform != "win32":
+                return
+            time.sleep(0.5)
+
+    def _run(self):
+        while not self.stopping.is_set():
+            started = False
+            try:
+                started = self.rebalance()
+            except Exception as e:  # keep the pool alive if one start fails oddly
+                print(f"Standby pool error: {e}")
+            self.wake.wait(WARM_SPACING if started else REFILL_INTERVAL)
+            self.wake.clear()
+
+    def _notify(self, name, state):
+        if self.on_event is not None:
+            self.on_event(name, state)
@@ -0,0 +1,83 @@
+"""
+Startup profiler.
+
+Enabled with the --profile-startup flag or SURGICAL_SUITE_PROFILE=1, it
+times the phases of starting the GUI (imports, stylesheet, window and
+card construction) and the milestones a trainee actually sees (window
+shown, first paint, all visible cards filled). The report is printed to
+stderr and appended to startup_profile.jsonl in the data folder, one
+JSON object per run, so startup regressions can be tracked over time.
+When disabled every call is a no-op.
+"""
+import contextlib
+import json
+import os
+import sys
+import time
+
+import storage_vr
+
+FLAG = "--profile-startup"
+ENV_VAR = "SURGICAL_SUITE_PROFILE"
+HISTORY_FILENAME = "startup_profile.jsonl"
+
+
+class StartupProfiler:
+    """Phase durations and milestone times, in milliseconds since the profiler was created."""
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.started = time.perf_counter()
+        self.phases = {}
+        self.milestones = {}
+        self.reported = False
+
+    @classmethod
+    def from_environment(cls, argv=None):
+        argv = sys.argv if argv is None else argv
+        enabled = FLAG in argv or os.environ.get(ENV_VAR, "") not in ("", "0")
+        if FLAG in argv:
+            argv.remove(FLAG)
+        return cls(enabled)
+
+    def elapsed(self):
+        return (time.perf_counter() - self.started) * 1000.0
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Time a block; repeated phases (e.g. cards filled in batches) add up."""
+        if not self.enabled:
+            yield
+            return
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + (time.perf_counter() - begin) * 1000.0
+
+    def mark(self, name):
+        """Record the first time a milestone is reached."""
+        if self.enabled:
+            self.milestones.setdefault(name, self.elapsed())
+
+    def as_dict(self):
+        return {
+            "recorded_at": time.time(),
+            "phases_ms": {name: round(ms, 2) for name, ms in self.phases.items()},
+            "milestones_ms": {name: round(ms, 2) for name, ms in self.milestones.items()},
+        }
+
+    def report(self, stream=sys.stderr):
+        """Print the profile once and append it to the history file."""
+        if not self.enabled or self.reported:
+            return
+        self.reported = True
+        lines = ["Startup profile (ms):"]
+        lines += [f"  {name:<20} {ms:9.1f}" for name, ms in self.phases.items()]
+        lines += [f"  @ {name:<18} {ms:9.1f}" for name, ms in sorted(self.milestones.items(), key=lambda m: m[1])]
+        print("\n".join(lines), file=stream)
+        try:
+            with open(storage_vr.data_path(HISTORY_FILENAME), "a", encoding="utf-8") as f:
+                f.write(json.dumps(self.as_dict()) + "\n")
+        except OSError as e:
+            print(f"Could not save startup profile: {e}", file=stream)
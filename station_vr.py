@@ -0,0 +1,116 @@
+"""
+The launch services of one station, shared by the GUI and the network agent.
+
+Both start a module the same way:
+
+1. a warm standby instance of it is claimed (brought forward) if there is
+   one (only the GUI's station keeps a standby pool: two pools on one
+   machine would compete to warm the same modules);
+2. otherwise the build must be present, complete and, when it ships a
+   manifest, match it (integrity_vr);
+3. then the launch goes through the admission scheduler, which starts,
+   queues or blocks it depending on free resources.
+
+Builds on the share run from the local build cache: the cache service
+switches the catalogue's exe_path to the local copy once it is complete,
+so launching just follows the catalogue. Duplicate launches are refused
+across processes by the supervisor. The callbacks are called from worker
+threads. No Qt here.
+"""
+import buildcache_vr
+import integrity_vr
+import launch_vr
+import logs_vr
+import metrics_vr
+import process_vr
+import profiles_vr
+import scheduler_vr
+import standby_vr
+import telemetry_vr
+
+# Decision reason of a launch that claimed a standby instance
+WARM = "warm standby"
+
+
+class Station:
+    """
+    Supervisor, scheduler, standby pool, build cache and launch profiles of
+    one station, wired together. on_process(name), on_queue(name, state,
+    detail), on_standby(name, state), on_cache(name, state, detail),
+    on_profile(name, old, new) and on_probed() are the callbacks of the
+    services they're named after. With standby=False there is no standby
+    pool (self.standby is None).
+    """
+
+    def __init__(self, catalog, on_process=None, on_queue=None, on_standby=None, on_cache=None, on_profile=None,
+                 on_probed=None, standby=False):
+        self.catalog = catalog
+        self.supervisor = process_vr.ProcessSupervisor(on_change=on_process,
+                                                       options=launch_vr.options_lookup(catalog))
+        self.verifier = integrity_vr.BuildVerifier()
+        self.metrics = metrics_vr.MetricsStore()
+        self.sessions = telemetry_vr.SessionLog()
+        self.logs = logs_vr.LogManager()
+        self.profiles = profiles_vr.ProfileManager(catalog, on_change=on_profile, on_probed=on_probed)
+        self.profiles.watch(self.sessions)
+        self.scheduler = scheduler_vr.LaunchScheduler(
+            self.supervisor, metrics=self.metrics, on_event=on_queue, logs=self.logs, sessions=self.sessions,
+            profiles=self.profiles, check=self.check
+        )
+        self.standby = None
+        if standby:
+            self.standby = standby_vr.StandbyPool(
+                self.supervisor, self.scheduler, catalog, metrics=self.metrics, logs=self.logs, on_event=on_standby
+            )
+        self.build_cache = buildcache_vr.BuildCacheService(
+            catalog,
+            in_use=buildcache_vr.supervisor_in_use(self.supervisor),
+            last_launched=lambda: {name: last for name, (_count, last) in self.metrics.usage().items()},
+            on_event=on_cache,
+        )
+
+    def claim(self, name):
+        """ProcessRecord of the module's standby instance, now the user's session, or None."""
+        return self.standby.claim(name) if self.standby is not None else None
+
+    def check(self, entry):
+        """Raise launch_vr.LaunchError unless the build is present, complete and matches its manifest."""
+        launch_vr.check(entry)
+        result = self.verifier.verify(entry["exe_path"])
+        if result.problems:
+            raise launch_vr.LaunchError(entry["name"], launch_vr.INCOMPLETE,
+                                        f"'{entry['name']}' build is incomplete: {result.summary()}")
+
+    def submit(self, entry, trace=None, force=False):
+        """Hand a checked module to the scheduler. Returns its scheduler_vr.Decision."""
+        return self.scheduler.submit(entry, trace, force=force)
+
+    def launch(self, entry, trace=None, force=False):
+        """
+        Claim, check and submit a module. Returns a scheduler_vr.Decision
+        (ADMITTED with reason WARM when a standby instance was claimed).
+        Raises launch_vr.LaunchError, process_vr.AlreadyRunningError or OSError.
+        """
+        warm = self.claim(entry["name"])
+        if warm is not None:
+            return scheduler_vr.Decision(scheduler_vr.ADMITTED, WARM, record=warm)
+        current = self.supervisor.get(entry["name"])
+        if current is not None and current.state == process_vr.RUNNING:
+            raise process_vr.AlreadyRunningError(current)
+        try:
+            self.check(entry)
+            return self.submit(entry, trace, force)
+        except (launch_vr.LaunchError, OSError):
+            self.sessions.failed(entry["name"])
+            raise
+
+    def stop(self):
+        """Close standby instances and stop every background service (running sessions are left alone)."""
+        if self.standby is not None:
+            self.standby.stop()
+        self.build_cache.stop()
+        self.scheduler.stop()
+        self.profiles.stop()
+        self.verifier.cache.close()
+        self.sessions.close()
+        self.metrics.close()
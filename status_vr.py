@@ -0,0 +1,84 @@
+"""
+Executable status checks for the simulation launcher.
+
+Everything here is plain Python (no Qt) so it can run on a worker thread
+or from scripts. Paths are checked in batches: each distinct folder is
+listed once with os.scandir instead of calling os.path.exists per file,
+which matters when the builds live on a slow network share.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Upper bound on folders listed at the same time
+MAX_SCAN_WORKERS = 8
+
+
+def scan_directory(directory):
+    """Return the normalised entry names of *directory*, or None if it can't be read."""
+    try:
+        with os.scandir(directory or os.curdir) as entries:
+            return {os.path.normcase(entry.name) for entry in entries}
+    except OSError:
+        return None
+
+
+def group_by_directory(paths):
+    """Map each parent folder to the list of paths that live in it."""
+    groups = {}
+    for path in paths:
+        if path:
+            groups.setdefault(os.path.dirname(path), []).append(path)
+    return groups
+
+
+def scan_paths(paths):
+    """
+    Check which of *paths* exist.
+    Returns a dict {path: bool}. Each folder is listed exactly once and
+    different folders are listed in parallel.
+    """
+    results = {path: False for path in paths}
+    groups = group_by_directory(paths)
+    if not groups:
+        return results
+
+    folders = list(groups)
+    workers = min(MAX_SCAN_WORKERS, len(folders))
+    if workers == 1:
+        listings = [scan_directory(folders[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            listings = list(pool.map(scan_directory, folders))
+
+    for folder, names in zip(folders, listings):
+        for path in groups[folder]:
+            results[path] = names is not None and os.path.normcase(os.path.basename(path)) in names
+    return results
+
+
+def nearest_existing_folder(path):
+    """Walk up from *path* until an existing folder is found (used for watching missing builds)."""
+    folder = path
+    while folder and not os.path.isdir(folder):
+        parent = os.path.dirname(folder)
+        if parent == folder:
+            return None
+        folder = parent
+    return folder or None
+
+
+def watch_targets(paths):
+    """Folders to watch so that creating, replacing or deleting any of *paths* is noticed."""
+    targets = set()
+    for folder in group_by_directory(paths):
+        existing = nearest_existing_folder(folder)
+        if existing:
+            targets.add(existing)
+    return targets
+
+
+def is_under(path, folder):
+    """True if *path* is inside *folder* (case-insensitive on Windows)."""
+    path = os.path.normcase(os.path.abspath(path))
+    folder = os.path.normcase(os.path.abspath(folder))
+    return path == folder or path.startswith(folder.rstrip(os.sep) + os.sep)
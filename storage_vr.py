@@ -0,0 +1,45 @@
+"""
+Where the launcher keeps its local state (metrics, settings, caches).
+
+The folder defaults to the per-user application data directory and can be
+moved with the SURGICAL_SUITE_HOME environment variable, which is also
+handy for running several isolated launchers on one machine.
+"""
+import os
+import sqlite3
+import sys
+import urllib.request
+
+APP_DIR_NAME = "SurgicalSimulationSuite"
+HOME_ENV = "SURGICAL_SUITE_HOME"
+
+
+def data_dir():
+    """Return (and create) the launcher's data folder."""
+    folder = os.environ.get(HOME_ENV)
+    if not folder:
+        if sys.platform == "win32":
+            base = os.environ.get("LOCALAPPDATA") or os.path.expanduser(r"~\AppData\Local")
+        else:
+            base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+        folder = os.path.join(base, APP_DIR_NAME)
+    os.makedirs(folder, exist_ok=True)
+    return folder
+
+
+def data_path(filename):
+    return os.path.join(data_dir(), filename)
+
+
+def connect(path):
+    """Open a SQLite database tuned for a small, frequently appended local store."""
+    connection = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+def connect_read_only(path):
+    """Open another station's SQLite file for reading, without changing it (no WAL switch, no new file)."""
+    uri = "file:" + urllib.request.pathname2url(os.path.abspath(path)) + "?mode=ro"
+    return sqlite3.connect(uri, uri=True, timeout=5.0)
@@ -0,0 +1,279 @@
+"""
+Small, dependency-free probes of the local machine (memory, CPU, processes).
+
+psutil is used when it is installed; otherwise we fall back to
+/proc on Linux and the Win32 API on Windows.
+"""
+import os
+import sys
+import time
+
+try:
+    import psutil
+except ImportError:  # optional dependency
+    psutil = None
+
+
+def _windows_memory_status():
+    import ctypes
+
+    class MEMORYSTATUSEX(ctypes.Structure):
+        _fields_ = [
+            ("dwLength", ctypes.c_ulong),
+            ("dwMemoryLoad", ctypes.c_ulong),
+            ("ullTotalPhys", ctypes.c_ulonglong),
+            ("ullAvailPhys", ctypes.c_ulonglong),
+            ("ullTotalPageFile", ctypes.c_ulonglong),
+            ("ullAvailPageFile", ctypes.c_ulonglong),
+            ("ullTotalVirtual", ctypes.c_ulonglong),
+            ("ullAvailVirtual", ctypes.c_ulonglong),
+            ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+        ]
+
+    status = MEMORYSTATUSEX()
+    status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+    ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status))
+    return status
+
+
+def _proc_meminfo():
+    info = {}
+    with open("/proc/meminfo") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            info[key] = int(value.split()[0]) * 1024
+    return info
+
+
+def total_memory():
+    """Physical RAM in bytes, or None if it can't be determined."""
+    try:
+        if psutil is not None:
+            return psutil.virtual_memory().total
+        if sys.platform == "win32":
+            return _windows_memory_status().ullTotalPhys
+        return _proc_meminfo()["MemTotal"]
+    except (OSError, KeyError, AttributeError):
+        return None
+
+
+def available_memory():
+    """RAM in bytes that can be used without pushing anything out, or None if unknown."""
+    try:
+        if psutil is not None:
+            return psutil.virtual_memory().available
+        if sys.platform == "win32":
+            return _windows_memory_status().ullAvailPhys
+        return _proc_meminfo()["MemAvailable"]
+    except (OSError, KeyError, AttributeError):
+        return None
+
+
+def cpu_count():
+    """Usable logical CPUs."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _windows_filetime(ft):
+    return ((ft.dwHighDateTime << 32) | ft.dwLowDateTime) / 1e7
+
+
+def cpu_times():
+    """(idle, total) CPU seconds summed over all CPUs since boot, or None if unknown."""
+    try:
+        if psutil is not None:
+            times = psutil.cpu_times()
+            return times.idle, sum(times)
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+            idle, kernel, user = wintypes.FILETIME(), wintypes.FILETIME(), wintypes.FILETIME()
+            if not ctypes.windll.kernel32.GetSystemTimes(ctypes.byref(idle), ctypes.byref(kernel), ctypes.byref(user)):
+                return None
+            # Kernel time already includes idle time
+            return _windows_filetime(idle), _windows_filetime(kernel) + _windows_filetime(user)
+        with open("/proc/stat") as f:
+            values = [int(v) for v in f.readline().split()[1:]]
+        # idle + iowait count as idle
+        return values[3] + values[4], sum(values[:8])
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class CpuSampler:
+    """System-wide CPU load between successive calls to busy()."""
+
+    def __init__(self):
+        self.last = cpu_times()
+
+    def busy(self):
+        """Fraction (0..1) of all CPUs busy since the previous call, or None if unknown."""
+        current = cpu_times()
+        previous, self.last = self.last, current
+        if current is None or previous is None or current[1] <= previous[1]:
+            return None
+        idle = current[0] - previous[0]
+        total = current[1] - previous[1]
+        return min(1.0, max(0.0, 1.0 - idle / total))
+
+
+def _windows_process_handle(pid):
+    import ctypes
+    PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+    handle = ctypes.windll.kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        raise OSError(f"cannot open process {pid}")
+    return handle
+
+
+def process_usage(pid):
+    """(resident memory in bytes, CPU seconds used) of one process, or None if unknown."""
+    try:
+        if psutil is not None:
+            process = psutil.Process(pid)
+            times = process.cpu_times()
+            return process.memory_info().rss, times.user + times.system
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [
+                    ("cb", wintypes.DWORD),
+                    ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            handle = _windows_process_handle(pid)
+            try:
+                counters = PROCESS_MEMORY_COUNTERS()
+                counters.cb = ctypes.sizeof(counters)
+                ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb)
+                times = [wintypes.FILETIME() for _ in range(4)]
+                ctypes.windll.kernel32.GetProcessTimes(handle, *(ctypes.byref(t) for t in times))
+                cpu = _windows_filetime(times[2]) + _windows_filetime(times[3])
+                return counters.WorkingSetSize, cpu
+            finally:
+                ctypes.windll.kernel32.CloseHandle(handle)
+        with open(f"/proc/{pid}/stat") as f:
+            # Fields after the parenthesised command name; utime/stime are 14th/15th overall
+            fields = f.read().rpartition(")")[2].split()
+        ticks = os.sysconf("SC_CLK_TCK")
+        rss = int(fields[21]) * os.sysconf("SC_PAGE_SIZE")
+        return rss, (int(fields[11]) + int(fields[12])) / ticks
+    except Exception:  # the process may be gone, or access denied
+        return None
+
+
+def process_started(pid):
+    """
+    When a process started (seconds, only comparable with other results on
+    this machine), or None if it isn't running. Telling start times apart
+    catches a PID reused by an unrelated process.
+    """
+    try:
+        if psutil is not None:
+            process = psutil.Process(pid)
+            if process.status() == psutil.STATUS_ZOMBIE:
+                return None
+            return process.create_time()
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+            STILL_ACTIVE = 259
+            handle = _windows_process_handle(pid)
+            try:
+                code = wintypes.DWORD()
+                ctypes.windll.kernel32.GetExitCodeProcess(handle, ctypes.byref(code))
+                if code.value != STILL_ACTIVE:
+                    return None
+                times = [wintypes.FILETIME() for _ in range(4)]
+                ctypes.windll.kernel32.GetProcessTimes(handle, *(ctypes.byref(t) for t in times))
+                return _windows_filetime(times[0])
+            finally:
+                ctypes.windll.kernel32.CloseHandle(handle)
+        if os.path.isdir("/proc"):
+            with open(f"/proc/{pid}/stat") as f:
+                fields = f.read().rpartition(")")[2].split()
+            # State is the 3rd field overall (Z: exited, waiting to be reaped), starttime the 22nd
+            if fields[0] in ("Z", "X"):
+                return None
+            return int(fields[19]) / os.sysconf("SC_CLK_TCK")
+        os.kill(pid, 0)
+        return 0.0  # alive, start time unknown
+    except PermissionError:
+        return 0.0
+    except Exception:  # gone (or never existed)
+        return None
+
+
+def process_executables():
+    """
+    Executable paths of the running processes we may inspect (best effort:
+    processes of other users may be missing, and the set is empty where
+    there's no way to list them).
+    """
+    paths = set()
+    try:
+        if psutil is not None:
+            for process in psutil.process_iter(["exe"]):
+                if process.info["exe"]:
+                    paths.add(process.info["exe"])
+        elif sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+            pids = (wintypes.DWORD * 4096)()
+            returned = wintypes.DWORD()
+            ctypes.windll.psapi.EnumProcesses(pids, ctypes.sizeof(pids), ctypes.byref(returned))
+            for pid in pids[:returned.value // ctypes.sizeof(wintypes.DWORD)]:
+                try:
+                    handle = _windows_process_handle(pid)
+                except OSError:
+                    continue
+                try:
+                    buffer = ctypes.create_unicode_buffer(32768)
+                    size = wintypes.DWORD(len(buffer))
+                    if ctypes.windll.kernel32.QueryFullProcessImageNameW(handle, 0, buffer, ctypes.byref(size)):
+                        paths.add(buffer.value)
+                finally:
+                    ctypes.windll.kernel32.CloseHandle(handle)
+        elif os.path.isdir("/proc"):
+            for pid in os.listdir("/proc"):
+                if pid.isdigit():
+                    try:
+                        paths.add(os.readlink(f"/proc/{pid}/exe"))
+                    except OSError:
+                        pass
+    except Exception:  # listing processes must never break the caller
+        pass
+    return paths
+
+
+def _benchmark_workload():
+    total = 0
+    for i in range(200_000):
+        total += (i * i) % 7
+    return total
+
+
+def cpu_benchmark(rounds=5):
+    """
+    Single-core speed as passes per second of a fixed pure-Python workload
+    (best of *rounds*, about 20 ms each on a current desktop CPU).
+    """
+    best = None
+    for _ in range(rounds):
+        started = time.perf_counter()
+        _benchmark_workload()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return 1.0 / best
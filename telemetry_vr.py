@@ -0,0 +1,291 @@
+"""
+Session telemetry: who ran which module, for how long, and how it ended.
+
+Every launch becomes one row in an append-only session log, written when
+the session ends (or fails to start). In the same transaction the row is
+added to two rollup tables, per day and per module, so usage reports over
+a year of sessions from many stations read a few hundred pre-summed rows
+instead of scanning the log:
+
+    sessions       one immutable row per session
+    daily_usage    (day, station, module) -> sessions, failures, seconds, longest
+    module_usage   (station, module)      -> the same over all time
+
+Each station keeps its own log; copies from other stations are merged
+with import_from(), which skips sessions it already has. No Qt here.
+"""
+import csv
+import datetime
+import json
+import socket
+import threading
+import time
+
+import storage_vr
+
+DB_FILENAME = "sessions.sqlite3"
+
+COMPLETED = "completed"          # exited with code 0
+CRASHED = "crashed"              # exited with any other code
+STOPPED = "stopped"              # closed from the launcher, console or agent
+LAUNCH_FAILED = "launch_failed"  # never started (missing build, spawn error)
+UNFINISHED = "unfinished"        # still running when the launcher closed
+OUTCOMES = (COMPLETED, CRASHED, STOPPED, LAUNCH_FAILED, UNFINISHED)
+# Outcomes counted in the failure rate
+FAILURES = (CRASHED, LAUNCH_FAILED)
+
+GROUPS = ("day", "station", "module")
+SESSION_FIELDS = ("station", "module", "started_at", "ended_at", "duration", "outcome", "exit_code", "pid")
+ROLLUP_FIELDS = ("sessions", "failures", "failure_rate", "hours", "average_minutes", "longest_minutes")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    station TEXT NOT NULL,
+    module TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    ended_at REAL,
+    duration REAL NOT NULL,
+    outcome TEXT NOT NULL,
+    exit_code INTEGER,
+    pid INTEGER,
+    UNIQUE (station, module, started_at)
+);
+CREATE TABLE IF NOT EXISTS daily_usage (
+    day TEXT NOT NULL,
+    station TEXT NOT NULL,
+    module TEXT NOT NULL,
+    sessions INTEGER NOT NULL,
+    failures INTEGER NOT NULL,
+    seconds REAL NOT NULL,
+    longest REAL NOT NULL,
+    PRIMARY KEY (day, station, module)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS module_usage (
+    station TEXT NOT NULL,
+    module TEXT NOT NULL,
+    sessions INTEGER NOT NULL,
+    failures INTEGER NOT NULL,
+    seconds REAL NOT NULL,
+    longest REAL NOT NULL,
+    first_at REAL NOT NULL,
+    last_at REAL NOT NULL,
+    PRIMARY KEY (station, module)
+) WITHOUT ROWID;
+"""
+
+
+def local_day(timestamp):
+    return time.strftime("%Y-%m-%d", time.localtime(timestamp))
+
+
+def day_start(day):
+    """'YYYY-MM-DD' -> timestamp of local midnight. Raises ValueError."""
+    return time.mktime(datetime.datetime.strptime(day, "%Y-%m-%d").timetuple())
+
+
+def outcome_of(returncode, stop_requested=False):
+    if stop_requested:
+        return STOPPED
+    return COMPLETED if returncode == 0 else CRASHED
+
+
+class SessionLog:
+    """Append-only session log with per-day and per-module rollups."""
+
+    def __init__(self, path=None, station=None):
+        self.path = path or storage_vr.data_path(DB_FILENAME)
+        self.station = station or socket.gethostname()
+        self.lock = threading.Lock()
+        self.db = storage_vr.connect(self.path)
+        self.db.executescript(SCHEMA)
+        self.open = {}       # pid -> (ProcessRecord, started_at) of sessions still running
+        self.closed = False
+        # callable(module, outcome, duration) run after each session of this station is logged
+        self.listeners = []
+
+    # ==========================================
+    # 🔹 RECORDING
+    # ==========================================
+    def begin(self, record, started_at=None):
+        """Follow a running process_vr.ProcessRecord; its session is written when it ends."""
+        started_at = started_at or time.time()
+        with self.lock:
+            self.open[record.pid] = (record, started_at)
+        threading.Thread(target=self._follow, args=(record, started_at), name=f"session-{record.name}",
+                         daemon=True).start()
+
+    def _follow(self, record, started_at):
+        returncode = record.process.wait()
+        with self.lock:
+            if self.open.pop(record.pid, None) is None:
+                return  # already written as unfinished by close()
+        self.append(record.name, started_at, time.time(), outcome_of(returncode, record.stop_requested),
+                    returncode, record.pid)
+
+    def wait(self, timeout=5.0):
+        """Block until every followed session that has ended is written (or timeout)."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self.lock:
+                if all(record.process.poll() is None for record, _started in self.open.values()):
+                    return
+            time.sleep(0.01)
+
+    def failed(self, module, when=None):
+        """Record a launch that never started."""
+        when = when or time.time()
+        self.append(module, when, when, LAUNCH_FAILED)
+
+    def append(self, module, started_at, ended_at, outcome, exit_code=None, pid=None, station=None):
+        """Write one finished session and fold it into the rollups. Returns False if it was already logged."""
+        row = (station or self.station, module, started_at, ended_at,
+               max(0.0, (ended_at or started_at) - started_at), outcome, exit_code, pid)
+        with self.lock:
+            if self.closed:
+                return False
+            with self.db:
+                added = self._insert(row)
+        if added:
+            for listener in self.listeners:
+                listener(module, outcome, row[4])
+        return added
+
+    def _insert(self, row):
+        """Insert a session row and update the rollups; caller holds the lock and the transaction."""
+        station, module, started_at, _ended_at, duration, outcome, _exit_code, _pid = row
+        cursor = self.db.execute(
+            f"INSERT OR IGNORE INTO sessions ({', '.join(SESSION_FIELDS)}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", row
+        )
+        if not cursor.rowcount:
+            return False
+        failure = 1 if outcome in FAILURES else 0
+        self.db.execute(
+            """INSERT INTO daily_usage VALUES (?, ?, ?, 1, ?, ?, ?)
+               ON CONFLICT (day, station, module) DO UPDATE SET
+                   sessions = sessions + 1, failures = failures + excluded.failures,
+                   seconds = seconds + excluded.seconds, longest = MAX(longest, excluded.longest)""",
+            (local_day(started_at), station, module, failure, duration, duration),
+        )
+        self.db.execute(
+            """INSERT INTO module_usage VALUES (?, ?, 1, ?, ?, ?, ?, ?)
+               ON CONFLICT (station, module) DO UPDATE SET
+                   sessions = sessions + 1, failures = failures + excluded.failures,
+                   seconds = seconds + excluded.seconds, longest = MAX(longest, excluded.longest),
+                   first_at = MIN(first_at, excluded.first_at), last_at = MAX(last_at, excluded.last_at)""",
+            (station, module, failure, duration, duration, started_at, started_at),
+        )
+        return True
+
+    # ==========================================
+    # 🔹 QUERIES
+    # ==========================================
+    def rollup(self, by=("module",), since=None, until=None, station=None):
+        """
+        Usage summed over the columns in *by* (any of GROUPS), for local days
+        since..until inclusive ('YYYY-MM-DD', either may be None). Returns
+        dicts with the group columns plus ROLLUP_FIELDS, busiest first.
+        """
+        by = [column for column in GROUPS if column in by] or ["module"]
+        # The all-time table answers most questions; day ranges need the daily one
+        table = "daily_usage" if "day" in by or since or until else "module_usage"
+        where, params = [], []
+        if since:
+            where.append("day >= ?")
+            params.append(since)
+        if until:
+            where.append("day <= ?")
+            params.append(until)
+        if station:
+            where.append("station = ?")
+            params.append(station)
+        query = (f"SELECT {', '.join(by)}, SUM(sessions), SUM(failures), SUM(seconds), MAX(longest) FROM {table}"
+                 + (f" WHERE {' AND '.join(where)}" if where else "")
+                 + f" GROUP BY {', '.join(by)} ORDER BY {'day, ' if 'day' in by else ''}SUM(seconds) DESC")
+        with self.lock:
+            rows = self.db.execute(query, params).fetchall()
+        result = []
+        for row in rows:
+            keys, (sessions, failures, seconds, longest) = row[:len(by)], row[len(by):]
+            result.append(dict(
+                zip(by, keys),
+                sessions=sessions,
+                failures=failures,
+                failure_rate=round(failures / sessions, 4) if sessions else 0.0,
+                hours=round(seconds / 3600.0, 2),
+                average_minutes=round(seconds / sessions / 60.0, 1) if sessions else 0.0,
+                longest_minutes=round(longest / 60.0, 1),
+            ))
+        return result
+
+    def sessions(self, since=None, until=None):
+        """Session rows (dicts, oldest first) that started on local days since..until inclusive."""
+        where, params = [], []
+        if since:
+            where.append("started_at >= ?")
+            params.append(day_start(since))
+        if until:
+            where.append("started_at < ?")
+            params.append(day_start(until) + 86400)
+        query = (f"SELECT {', '.join(SESSION_FIELDS)} FROM sessions"
+                 + (f" WHERE {' AND '.join(where)}" if where else "") + " ORDER BY started_at")
+        with self.lock:
+            rows = self.db.execute(query, params).fetchall()
+        return [dict(zip(SESSION_FIELDS, row)) for row in rows]
+
+    # ==========================================
+    # 🔹 EXPORT / MERGE
+    # ==========================================
+    def export(self, path, fmt="csv", rollup_by=None, since=None, until=None):
+        """
+        Write sessions (or, with rollup_by, the rollup grouped by those columns)
+        to a CSV or JSON-lines file. Returns the number of rows written.
+        """
+        if rollup_by:
+            rows = self.rollup(rollup_by, since, until)
+            fields = [column for column in GROUPS if column in rollup_by] + list(ROLLUP_FIELDS)
+        else:
+            rows = self.sessions(since, until)
+            fields = list(SESSION_FIELDS)
+            for row in rows:
+                row["started_at"] = iso_time(row["started_at"])
+                row["ended_at"] = iso_time(row["ended_at"])
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            if fmt == "jsonl":
+                for row in rows:
+                    f.write(json.dumps(row, ensure_ascii=False) + "\n")
+            else:
+                writer = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
+                writer.writeheader()
+                writer.writerows(rows)
+        return len(rows)
+
+    def import_from(self, path):
+        """Merge the sessions of another station's log file. Returns the number of new sessions."""
+        source = storage_vr.connect_read_only(path)
+        try:
+            rows = source.execute(f"SELECT {', '.join(SESSION_FIELDS)} FROM sessions ORDER BY started_at").fetchall()
+        finally:
+            source.close()
+        added = 0
+        with self.lock, self.db:
+            for row in rows:
+                added += self._insert(row)
+        return added
+
+    def close(self):
+        """Log sessions that are still running as unfinished, then close the database."""
+        now = time.time()
+        with self.lock:
+            still_open, self.open = list(self.open.values()), {}
+        for record, started_at in still_open:
+            self.append(record.name, started_at, now, UNFINISHED, None, record.pid)
+        with self.lock:
+            self.closed = True
+            self.db.close()
+
+
+def iso_time(timestamp):
+    if timestamp is None:
+        return None
+    return datetime.datetime.fromtimestamp(timestamp).isoformat(timespec="seconds")
@@ -0,0 +1,36 @@
+import os
+import sys
+
+import pytest
+
+# The modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import storage_vr
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    """An empty data folder, so tests never touch the real catalogue and settings."""
+    folder = tmp_path / "home"
+    folder.mkdir()
+    monkeypatch.setenv(storage_vr.HOME_ENV, str(folder))
+    return folder
+
+
+def make_build(folder, name="Player", seconds=0):
+    """A stub Unity build (POSIX shell script + *_Data folder) that runs for *seconds*. Returns the exe path."""
+    folder = str(folder)
+    os.makedirs(os.path.join(folder, f"{name}_Data"), exist_ok=True)
+    with open(os.path.join(folder, f"{name}_Data", "globalgamemanagers"), "wb") as f:
+        f.write(b"\0" * 1024)
+    exe_path = os.path.join(folder, f"{name}.exe")
+    with open(exe_path, "w") as f:
+        f.write(f"#!/bin/sh\nexec sleep {seconds}\n")
+    os.chmod(exe_path, 0o755)
+    return exe_path
+
+
+@pytest.fixture
+def stub_build():
+    return make_build
@@ -0,0 +1,154 @@
+"""Round trips against a real agent listening on localhost."""
+import asyncio
+import json
+import sys
+
+import pytest
+
+import agent_vr
+import catalog_vr
+import process_vr
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="stub builds are shell scripts")
+
+TOKEN = "s3cret"
+
+
+@pytest.fixture
+def agent(home, stub_build, tmp_path):
+    catalog = catalog_vr.Catalog(seed=[])
+    catalog.add_many([
+        {"name": "Heart", "icon": "❤️", "description": "Cardiac", "color": "#D64545",
+         "exe_path": stub_build(tmp_path / "heart", seconds=30)},
+        {"name": "Missing", "icon": "🦴", "description": "Not installed", "color": "#3182CE",
+         "exe_path": str(tmp_path / "missing" / "Missing.exe")},
+    ])
+    agent = agent_vr.Agent(catalog=catalog, token=TOKEN)
+    yield agent
+    agent.supervisor.terminate("Heart")
+    agent.close()
+
+
+class Client:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.ids = 0
+
+    async def call(self, method, **params):
+        self.ids += 1
+        self.writer.write(agent_vr.encode({"id": self.ids, "method": method, "params": params}))
+        await self.writer.drain()
+        reply = json.loads(await asyncio.wait_for(self.reader.readline(), 10))
+        assert reply["id"] == self.ids
+        return reply
+
+
+def run_session(agent, scenario):
+    """Serve on a free localhost port and run scenario(client) against it."""
+    async def main():
+        server = await agent.serve("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            return await scenario(Client(reader, writer))
+        finally:
+            writer.close()
+            server.close()
+            await server.wait_closed()
+
+    return asyncio.run(main())
+
+
+def test_requests_need_hello_with_the_token(agent):
+    async def scenario(client):
+        assert (await client.call("status"))["error"]["type"] == "unauthorized"
+        assert (await client.call("hello", token="wrong"))["error"]["type"] == "unauthorized"
+        hello = await client.call("hello", token=TOKEN)
+        assert hello["result"]["protocol"] == agent_vr.PROTOCOL_VERSION
+        assert "result" in await client.call("ping")
+
+    run_session(agent, scenario)
+
+
+def test_status_reports_ready_and_missing_builds(agent):
+    async def scenario(client):
+        await client.call("hello", token=TOKEN)
+        states = {s["name"]: s["state"] for s in (await client.call("status"))["result"]}
+        assert states == {"Heart": "ready", "Missing": "not_found"}
+        only = (await client.call("status", names=["heart"]))["result"]
+        assert [s["name"] for s in only] == ["Heart"]
+
+    run_session(agent, scenario)
+
+
+def test_launch_status_and_stop(agent):
+    async def scenario(client):
+        await client.call("hello", token=TOKEN)
+        # Forced, so the test doesn't depend on this machine's free RAM and CPU
+        launched = (await client.call("launch", name="heart", force=True))["result"]
+        assert launched["name"] == "Heart" and launched["state"] == "launched" and launched["pid"]
+
+        again = await client.call("launch", name="Heart", force=True)
+        assert again["error"]["type"] == "already_running"
+        status = (await client.call("status", names=["Heart"]))["result"][0]
+        assert status["state"] == "running" and status["pid"] == launched["pid"]
+
+        stopped = (await client.call("stop", name="Heart", timeout=5))["result"]
+        assert stopped == {"name": "Heart", "stopped": True}
+        for _ in range(100):
+            status = (await client.call("status", names=["Heart"]))["result"][0]
+            if status["state"] != "running":
+                break
+            await asyncio.sleep(0.05)
+        assert status["state"] == "ready"
+        assert status["last_run"]["pid"] == launched["pid"]
+
+    run_session(agent, scenario)
+
+
+def test_launch_errors(agent):
+    async def scenario(client):
+        await client.call("hello", token=TOKEN)
+        assert (await client.call("launch", name="Nope"))["error"]["type"] == "unknown_module"
+        assert (await client.call("launch", name="Missing"))["error"]["type"] == "not_found"
+        assert (await client.call("launch"))["error"]["type"] == "bad_request"
+
+    run_session(agent, scenario)
+
+
+def test_stop_reaches_a_module_another_launcher_started(agent):
+    # The GUI on the same station: its own supervisor, the same data folder
+    gui = process_vr.ProcessSupervisor()
+    record = gui.launch("Heart", agent.catalog.get("Heart")["exe_path"])
+
+    async def scenario(client):
+        await client.call("hello", token=TOKEN)
+        stopped = (await client.call("stop", name="Heart", timeout=5))["result"]
+        assert stopped == {"name": "Heart", "stopped": True}
+        for _ in range(100):
+            if record.state != process_vr.RUNNING:
+                break
+            await asyncio.sleep(0.05)
+        assert record.state != process_vr.RUNNING
+        assert (await client.call("stop", name="Heart"))["result"]["stopped"] is False
+
+    run_session(agent, scenario)
+
+
+def test_bad_params_are_bad_requests(agent, monkeypatch):
+    async def scenario(client):
+        await client.call("hello", token=TOKEN)
+        assert (await client.call("status", nmes=["Heart"]))["error"]["type"] == "bad_request"
+        assert (await client.call("status", names="Heart"))["error"]["type"] == "bad_request"
+        assert (await client.call("stop", name="Heart", timeout="soon"))["error"]["type"] == "bad_request"
+        assert (await client.call("logs", name="Heart", lines=None))["error"]["type"] == "bad_request"
+
+        # A TypeError inside a method is the agent's fault, not the request's
+        def broken():
+            raise TypeError("internal slip")
+
+        monkeypatch.setattr(agent.catalog, "all", broken)
+        assert (await client.call("list"))["error"]["type"] == "internal"
+
+    run_session(agent, scenario)
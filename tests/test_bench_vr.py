@@ -0,0 +1,10 @@
+import pytest
+
+import bench_vr
+
+
+def test_help_renders(capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        bench_vr.build_parser().parse_args(["--help"])
+    assert exit_info.value.code == 0
+    assert "(default: 25%)" in capsys.readouterr().out
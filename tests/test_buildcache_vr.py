@@ -0,0 +1,151 @@
+"""The local build cache, with a plain local folder standing in for the share."""
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+import buildcache_vr
+import catalog_vr
+import process_vr
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="stub builds are shell scripts")
+
+
+@pytest.fixture
+def share(tmp_path):
+    folder = tmp_path / "share"
+    folder.mkdir()
+    return folder
+
+
+@pytest.fixture
+def service(home, share, stub_build):
+    catalog = catalog_vr.Catalog(seed=[])
+    catalog.add_many([
+        {"name": name, "icon": "🫀", "description": name, "color": "#D64545",
+         "exe_path": stub_build(share / name.lower(), name=name, seconds=30)}
+        for name in ("Heart", "Brain")
+    ])
+    service = buildcache_vr.BuildCacheService(catalog, background=False)
+    service.configure(enabled=True, share_roots=[str(share)])
+    yield service
+    service.stop()
+    catalog.close()
+
+
+def write(path, data):
+    with open(path, "wb") as f:
+        f.write(data)
+    # Same-second rewrites must still look changed
+    os.utime(path, ns=(time.time_ns(), time.time_ns() + 1_000_000_000))
+
+
+def test_sync_switches_exe_path_once_the_copy_is_complete(service, share):
+    source = service.catalog.get("Heart")["exe_path"]
+    result = service.sync("Heart", source)
+    assert result.state == buildcache_vr.SYNCED
+    cached = service.catalog.get("Heart")["exe_path"]
+    assert cached == result.exe_path and service.cache.is_cached_path(cached)
+    assert os.path.isfile(os.path.join(os.path.dirname(cached), "Heart_Data", "globalgamemanagers"))
+    assert service.source_of(service.catalog.get("Heart")) == source
+
+    assert service.sync("Heart", source).state == buildcache_vr.UNCHANGED
+
+
+def test_resync_reuses_unchanged_files_and_drops_the_old_version(service, share):
+    source = service.catalog.get("Heart")["exe_path"]
+    first = service.sync("Heart", source)
+    write(share / "heart" / "Heart_Data" / "level0", b"new level")
+
+    second = service.sync("Heart", source)
+    assert second.state == buildcache_vr.SYNCED and second.exe_path != first.exe_path
+    assert second.reused == 2 and second.fetched_bytes == len(b"new level")
+    assert not os.path.exists(first.exe_path)
+    assert service.catalog.get("Heart")["exe_path"] == second.exe_path
+
+
+def test_chunk_manifest_fetches_only_changed_chunks(service, share, monkeypatch):
+    monkeypatch.setattr(buildcache_vr, "CHUNK_SIZE", 1024)
+    resources = share / "heart" / "Heart_Data" / "resources.assets"
+    write(resources, b"a" * 1024 + b"b" * 1024 + b"c" * 1024)
+    source = service.catalog.get("Heart")["exe_path"]
+    service.sync("Heart", source)
+
+    write(resources, b"a" * 1024 + b"B" * 1024 + b"c" * 1024)
+    manifest = buildcache_vr.write_chunk_manifest(source)
+    result = service.sync("Heart", source)
+    # The changed chunk, plus the new manifest itself (part of the build folder)
+    assert result.fetched_bytes == 1024 + os.path.getsize(manifest)
+    with open(os.path.join(os.path.dirname(result.exe_path), "Heart_Data", "resources.assets"), "rb") as f:
+        assert f.read() == b"a" * 1024 + b"B" * 1024 + b"c" * 1024
+
+
+def test_quota_evicts_the_least_recently_launched_build(service, share):
+    launched = {"Heart": 100.0, "Brain": 200.0}
+    service.cache.last_launched = lambda: launched
+    heart = service.catalog.get("Heart")["exe_path"]
+    service.sync("Heart", heart)
+    service.cache.quota_bytes = service.cache.used_bytes() + 512
+
+    service.sync("Brain", service.catalog.get("Brain")["exe_path"])
+    assert set(service.cache.builds()) == {"Brain"}
+    # Heart launches from the share again
+    assert service.catalog.get("Heart")["exe_path"] == heart
+
+
+def test_builds_running_from_another_launcher_are_not_evicted(service, share):
+    service.sync("Heart", service.catalog.get("Heart")["exe_path"])
+    cached = service.catalog.get("Heart")["exe_path"]
+    # Another launcher process: its own supervisor, the same data folder
+    other = process_vr.ProcessSupervisor()
+    other.launch("Heart", cached)
+    try:
+        assert not service.cache.evict("Heart")
+        assert os.path.isfile(cached)
+    finally:
+        other.terminate("Heart")
+    for _ in range(100):
+        if not other.running():
+            break
+        time.sleep(0.05)
+    assert service.cache.evict("Heart")
+    assert not os.path.exists(cached)
+
+
+def test_launchers_take_turns_syncing_a_build(service, share):
+    source = service.catalog.get("Heart")["exe_path"]
+    # Another launcher's cache over the same folder, syncing Heart right now
+    other = buildcache_vr.BuildCache(root=service.cache.root)
+    results = []
+    try:
+        with other.sync_lock("Heart"):
+            thread = threading.Thread(target=lambda: results.append(service.cache.sync("Heart", source)))
+            thread.start()
+            time.sleep(0.3)
+            assert thread.is_alive() and not results
+            # Nor can its files be deleted meanwhile
+            assert not service.cache.evict("Heart")
+            first = other._sync("Heart", source)
+        thread.join(10)
+        # Started from the state the other launcher left: nothing left to copy
+        assert results[0].state == buildcache_vr.UNCHANGED and results[0].exe_path == first.exe_path
+    finally:
+        other.close()
+
+
+def test_stop_cancels_a_running_sync_and_drops_its_copy(service, share, monkeypatch):
+    source = service.catalog.get("Heart")["exe_path"]
+    assemble = service.cache.assemble
+
+    def cancelled_assemble(*args):
+        service.cache.cancelled.set()  # as stop() would, halfway through
+        return assemble(*args)
+
+    monkeypatch.setattr(service.cache, "assemble", cancelled_assemble)
+    with pytest.raises(buildcache_vr.SyncError, match="cancelled"):
+        service.cache.sync("Heart", source)
+    assert service.cache.load_state("Heart") is None
+    assert not os.path.exists(os.path.join(service.cache.build_dir("Heart"), "v1"))
+    assert service.catalog.get("Heart")["exe_path"] == source
@@ -0,0 +1,49 @@
+"""Structure checks and the background checker."""
+import os
+import threading
+
+import integrity_vr
+import unity_vr
+
+
+def test_structure_result_is_reused_until_the_data_folder_changes(tmp_path, stub_build, monkeypatch):
+    exe_path = stub_build(tmp_path / "heart")
+    data = unity_vr.data_folder(exe_path)
+    walks = []
+    real = integrity_vr.structure_problems
+    monkeypatch.setattr(integrity_vr, "structure_problems", lambda path: walks.append(path) or real(path))
+
+    assert integrity_vr.cached_structure_problems(exe_path) == []
+    assert integrity_vr.cached_structure_problems(exe_path) == []
+    assert len(walks) == 1
+
+    open(os.path.join(data, "sharedassets0.assets"), "wb").close()
+    assert integrity_vr.cached_structure_problems(exe_path) == ["empty asset sharedassets0.assets"]
+    assert len(walks) == 2
+    assert integrity_vr.cached_structure_problems(exe_path, refresh=True) == ["empty asset sharedassets0.assets"]
+    assert len(walks) == 3
+
+
+def test_stop_waits_for_the_running_check_before_closing_the_cache(home, tmp_path, stub_build):
+    exe_path = stub_build(tmp_path / "heart")
+    started, release, results, outcomes = threading.Event(), threading.Event(), [], []
+    checker = integrity_vr.IntegrityChecker(on_result=results.append)
+    checker.verifier.write_manifest(exe_path)
+    verify = checker.verifier.verify
+
+    def slow_verify(path):
+        started.set()
+        release.wait(5)
+        outcomes.append(verify(path))  # looks digests up in the hash cache's database
+        return outcomes[-1]
+
+    checker.verifier.verify = slow_verify
+    checker.request(exe_path)
+    assert started.wait(5)
+    threading.Timer(0.2, release.set).start()
+    checker.stop()
+    # The check finished against an open database, and its result was dropped
+    assert [result.problems for result in outcomes] == [[]]
+    assert results == []
+    checker.request(exe_path)
+    assert checker.pending == set()
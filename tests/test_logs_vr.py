@@ -0,0 +1,84 @@
+"""Output capture through files, and locating a build's Player.log."""
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+import logs_vr
+import unity_vr
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="children are shell commands")
+
+
+def wait_for_readers(log):
+    for thread in log.readers:
+        thread.join(10)
+        assert not thread.is_alive()
+
+
+def test_output_goes_through_capture_files(home):
+    logs = logs_vr.LogManager(tail_player_log=False)
+    kwargs = logs.popen_kwargs("Heart")
+    assert kwargs["stdout"] is not subprocess.PIPE and kwargs["stderr"] is not subprocess.PIPE
+    process = subprocess.Popen(["sh", "-c", "echo one; echo two >&2; printf three"], **kwargs)
+    log = logs.attach("Heart", process, time.time())
+    process.wait()
+    wait_for_readers(log)
+
+    lines = {(line.source, line.text) for line in log.buffer.snapshot()}
+    assert lines == {(logs_vr.STDOUT, "one"), (logs_vr.STDERR, "two"), (logs_vr.STDOUT, "three")}
+    # Read to the end after the exit, so the capture files are gone
+    folder = logs_vr.module_log_dir("Heart")
+    assert not [name for name in os.listdir(folder) if not name.endswith(".log")]
+
+
+def test_abandon_removes_unused_capture_files(home):
+    logs = logs_vr.LogManager()
+    logs.popen_kwargs("Heart")
+    logs.abandon("Heart")
+    assert os.listdir(logs_vr.module_log_dir("Heart")) == []
+
+
+def test_player_log_comes_from_app_info(tmp_path, monkeypatch, stub_build):
+    monkeypatch.setattr(unity_vr, "player_log_root", lambda: str(tmp_path / "logs"))
+    exe_path = stub_build(tmp_path / "heart")
+    assert unity_vr.find_player_log(exe_path, 0) is None
+
+    with open(os.path.join(unity_vr.data_folder(exe_path), "app.info"), "w") as f:
+        f.write("Hospital VR\nHeart Surgery\n")
+    path = tmp_path / "logs" / "Hospital VR" / "Heart Surgery" / "Player.log"
+    assert unity_vr.player_log_path(exe_path) == str(path)
+    # Another build's fresh log is not this one's
+    (tmp_path / "logs" / "Hospital VR" / "Brain Surgery").mkdir(parents=True)
+    (tmp_path / "logs" / "Hospital VR" / "Brain Surgery" / "Player.log").write_text("other")
+    assert unity_vr.find_player_log(exe_path, 0) is None
+
+    path.parent.mkdir(parents=True)
+    path.write_text("Initialize engine")
+    assert unity_vr.find_player_log(exe_path, 0) == str(path)
+    assert unity_vr.find_player_log(exe_path, time.time() + 60) is None
+
+
+def test_capture_files_are_emptied_once_read(home, monkeypatch):
+    monkeypatch.setattr(logs_vr, "CAPTURE_TRUNCATE_BYTES", 64)
+    monkeypatch.setattr(logs_vr, "TAIL_INTERVAL", 0.01)
+    logs = logs_vr.LogManager(tail_player_log=False)
+    kwargs = logs.popen_kwargs("Heart")
+    capture = logs.captures["Heart"].paths[logs_vr.STDOUT]
+    script = "for i in $(seq 1 40); do echo line-$i-padding-padding; sleep 0.02; done"
+    process = subprocess.Popen(["sh", "-c", script], **kwargs)
+    log = logs.attach("Heart", process, time.time())
+    largest = 0
+    while process.poll() is None:
+        try:
+            largest = max(largest, os.path.getsize(capture))
+        except OSError:
+            pass
+        time.sleep(0.005)
+    wait_for_readers(log)
+
+    texts = [line.text for line in log.buffer.snapshot() if line.source == logs_vr.STDOUT]
+    assert texts == [f"line-{i}-padding-padding" for i in range(1, 41)]
+    assert largest < 40 * len("line-1-padding-padding\n") // 2
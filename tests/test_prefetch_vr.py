@@ -0,0 +1,34 @@
+import os
+
+import prefetch_vr
+
+
+def write(path, size):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"\0" * size)
+
+
+def test_files_come_in_cold_start_order(tmp_path):
+    data = tmp_path / "Player_Data"
+    for rel, size in [("StreamingAssets/intro.mp4", 10), ("level1", 5), ("sharedassets0.assets", 50),
+                      ("Managed/Assembly-CSharp.dll", 40), ("level0", 30), ("globalgamemanagers", 20)]:
+        write(str(data / rel), size)
+    order = [os.path.relpath(path, str(data)).replace(os.sep, "/") for path, _size in prefetch_vr.list_files(str(data))]
+    assert order == ["globalgamemanagers", "Managed/Assembly-CSharp.dll", "level0", "sharedassets0.assets",
+                     "level1", "StreamingAssets/intro.mp4"]
+
+
+def test_a_file_over_the_remaining_budget_is_skipped(tmp_path, monkeypatch):
+    exe_path = str(tmp_path / "Player.exe")
+    write(exe_path, 10)
+    write(str(tmp_path / "Player_Data" / "globalgamemanagers"), 30)
+    write(str(tmp_path / "Player_Data" / "level0"), 100)
+    write(str(tmp_path / "Player_Data" / "level1"), 40)
+    monkeypatch.setattr(prefetch_vr, "memory_budget", lambda limit: 85)
+    prefetcher = prefetch_vr.Prefetcher()
+    try:
+        # level0 doesn't fit; level1 still does
+        assert prefetcher.prefetch(exe_path) == 10 + 30 + 40
+    finally:
+        prefetcher.stop()
@@ -0,0 +1,66 @@
+import sys
+import threading
+import time
+
+import pytest
+
+import process_vr
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="stub builds are shell scripts")
+
+
+def test_queries_do_not_wait_behind_a_launch_holding_the_registry_lock(home, tmp_path, stub_build):
+    exe_path = stub_build(tmp_path / "heart", seconds=30)
+    supervisor = process_vr.ProcessSupervisor()
+    other = process_vr.RunningRegistry()   # another launcher, same data folder
+    launched = threading.Event()
+
+    def launch():
+        supervisor.launch("Heart", exe_path)
+        launched.set()
+
+    with other.lock("Heart"):
+        threading.Thread(target=launch, daemon=True).start()
+        time.sleep(0.2)
+        started = time.monotonic()
+        assert supervisor.running() == [] and supervisor.get("Heart") is None
+        assert time.monotonic() - started < 0.1
+        assert not launched.is_set()
+    assert launched.wait(5)
+    supervisor.terminate("Heart")
+
+
+def test_reaper_notifies_even_if_the_pid_file_cannot_be_cleared(home, tmp_path, stub_build, monkeypatch):
+    changes = []
+    supervisor = process_vr.ProcessSupervisor(on_change=changes.append)
+
+    def broken(record):
+        raise OSError("read-only data folder")
+
+    monkeypatch.setattr(supervisor.registry, "remove", broken)
+    monkeypatch.setattr(threading, "excepthook", lambda args: None)
+    record = supervisor.launch("Heart", stub_build(tmp_path / "heart"))
+    for _ in range(100):
+        if len(changes) == 2:
+            break
+        time.sleep(0.05)
+    assert changes == ["Heart", "Heart"] and record.state != process_vr.RUNNING
+
+
+def test_terminate_without_waiting_kills_a_stubborn_child_in_the_background(home, tmp_path, stub_build):
+    exe_path = stub_build(tmp_path / "heart", seconds=30)
+    with open(exe_path, "w") as f:
+        f.write("#!/bin/sh\ntrap '' TERM\nexec sleep 30\n")
+    changes = []
+    supervisor = process_vr.ProcessSupervisor(on_change=changes.append)
+    record = supervisor.launch("Heart", exe_path)
+    time.sleep(0.2)  # let it install the trap
+
+    started = time.monotonic()
+    assert supervisor.terminate("Heart", timeout=0.5, wait=False)
+    assert time.monotonic() - started < 0.1
+    for _ in range(100):
+        if record.state != process_vr.RUNNING and len(changes) == 2:
+            break
+        time.sleep(0.05)
+    assert record.state != process_vr.RUNNING and changes == ["Heart", "Heart"]
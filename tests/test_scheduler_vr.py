@@ -0,0 +1,122 @@
+"""Admission decisions, with the machine's free memory and CPU load faked."""
+import pytest
+
+import launch_vr
+import metrics_vr
+import process_vr
+import scheduler_vr
+import system_vr
+
+GB = scheduler_vr.GB
+
+
+@pytest.fixture
+def scheduler(home, monkeypatch):
+    monkeypatch.setattr(system_vr, "available_memory", lambda: 6 * GB)
+    scheduler = scheduler_vr.LaunchScheduler(process_vr.ProcessSupervisor())
+    # Decisions are driven by the test, not the monitor thread
+    scheduler.stopping.set()
+    scheduler.monitor.join()
+    scheduler.busy = 0.1
+    # The machine has been seen with 6 GB free
+    scheduler.note_idle(6 * GB, 0)
+    yield scheduler
+    scheduler.costs.close()
+
+
+def entry(name):
+    return {"name": name, "exe_path": f"/builds/{name}/{name}.exe"}
+
+
+def test_fitting_launch_is_admitted(scheduler):
+    assert scheduler.assess("Heart").state == scheduler_vr.ADMITTED
+
+
+def test_shortage_from_outside_is_queued(scheduler, monkeypatch):
+    monkeypatch.setattr(system_vr, "available_memory", lambda: int(1.2 * GB))
+    scheduler.costs.learn("Heart", int(0.5 * GB), 0.2)
+    decision = scheduler.submit(entry("Heart"))
+    assert decision.state == scheduler_vr.QUEUED and decision.position == 1
+
+
+def test_launch_that_can_never_fit_is_rejected_not_queued(scheduler):
+    scheduler.costs.learn("Huge", int(5.5 * GB), 0.2)
+    decision = scheduler.submit(entry("Huge"))
+    assert decision.state == scheduler_vr.REJECTED
+    assert scheduler.position("Huge") is None
+
+
+def test_too_much_cpu_is_rejected(scheduler):
+    scheduler.costs.learn("Busy", GB, 0.95)
+    assert scheduler.assess("Busy").state == scheduler_vr.REJECTED
+
+
+def test_queued_launch_expires_to_the_user(scheduler, monkeypatch):
+    monkeypatch.setattr(system_vr, "available_memory", lambda: int(1.2 * GB))
+    scheduler.costs.learn("Heart", int(0.5 * GB), 0.2)
+    events = []
+    scheduler.on_event = lambda name, state, detail: events.append((name, state))
+    scheduler.submit(entry("Heart"))
+    scheduler.expire()
+    assert scheduler.position("Heart") == 1
+
+    monkeypatch.setattr(scheduler_vr, "QUEUE_TIMEOUT", 0.0)
+    scheduler.drain()
+    assert scheduler.position("Heart") is None
+    assert events == [("Heart", scheduler_vr.BLOCKED)]
+
+
+def test_force_takes_a_queued_launch_out_of_the_queue(scheduler, monkeypatch):
+    monkeypatch.setattr(system_vr, "available_memory", lambda: int(1.2 * GB))
+    scheduler.costs.learn("Heart", int(0.5 * GB), 0.2)
+    scheduler.submit(entry("Heart"))
+    started = []
+    monkeypatch.setattr(scheduler, "_start", lambda entry, trace=None: started.append(entry["name"]))
+    decision = scheduler.submit(entry("Heart"), force=True)
+    assert decision.state == scheduler_vr.ADMITTED
+    assert started == ["Heart"] and scheduler.position("Heart") is None
+
+
+def test_reclaiming_queues_the_launch_instead_of_waiting(scheduler, monkeypatch):
+    free = {"memory": int(1.2 * GB)}
+    monkeypatch.setattr(system_vr, "available_memory", lambda: free["memory"])
+    scheduler.costs.learn("Heart", int(0.5 * GB), 0.2)
+    closing = []
+    # A standby instance is asked to close and exits later
+    scheduler.reclaim = lambda name: closing.append(name) or len(closing) == 1
+    decision = scheduler.submit(entry("Heart"))
+    assert decision.state == scheduler_vr.QUEUED and "standby" in decision.reason
+    assert closing == ["Heart"]
+
+    events = []
+    scheduler.on_event = lambda name, state, detail: events.append((name, state))
+    scheduler.check = lambda entry: None
+    monkeypatch.setattr(scheduler, "_start", lambda entry, trace=None: process_vr.RunningProcess(
+        entry["name"], entry["exe_path"], 4242, None))
+    free["memory"] = 6 * GB   # it has exited
+    scheduler.drain()
+    assert events == [("Heart", scheduler_vr.ADMITTED)] and scheduler.position("Heart") is None
+
+
+def test_queued_launch_keeps_its_trace_and_is_checked_again(scheduler, monkeypatch):
+    free = {"memory": int(1.2 * GB)}
+    monkeypatch.setattr(system_vr, "available_memory", lambda: free["memory"])
+    scheduler.costs.learn("Heart", int(0.5 * GB), 0.2)
+    scheduler.costs.learn("Brain", int(0.5 * GB), 0.2)
+    trace = metrics_vr.LaunchTrace("Heart")
+    scheduler.submit(entry("Heart"), trace)
+    scheduler.submit(entry("Brain"))
+
+    def check(entry):
+        if entry["name"] == "Brain":
+            raise launch_vr.LaunchError("Brain", launch_vr.INCOMPLETE, "build changed while queued")
+
+    started, events = [], []
+    scheduler.check = check
+    scheduler.on_event = lambda name, state, detail: events.append((name, state))
+    monkeypatch.setattr(scheduler, "_start", lambda entry, trace=None: started.append((entry["name"], trace))
+                        or process_vr.RunningProcess(entry["name"], entry["exe_path"], 4242, None))
+    free["memory"] = 6 * GB
+    scheduler.drain()
+    assert started == [("Heart", trace)]
+    assert events == [("Heart", scheduler_vr.ADMITTED), ("Brain", scheduler_vr.FAILED)]
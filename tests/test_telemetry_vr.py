@@ -0,0 +1,37 @@
+import os
+import sqlite3
+
+import pytest
+
+import telemetry_vr
+
+
+def test_import_reads_the_other_log_without_changing_it(home, tmp_path):
+    other_path = str(tmp_path / "other.sqlite3")
+    other = telemetry_vr.SessionLog(other_path, station="station-2")
+    other.append("Heart", 1000.0, 1600.0, telemetry_vr.COMPLETED)
+    other.close()
+    with sqlite3.connect(other_path) as db:
+        db.execute("PRAGMA journal_mode=DELETE")
+    before = os.stat(other_path).st_mtime_ns
+
+    sessions = telemetry_vr.SessionLog(station="station-1")
+    try:
+        assert sessions.import_from(other_path) == 1
+        assert sessions.import_from(other_path) == 0
+    finally:
+        sessions.close()
+    with sqlite3.connect(other_path) as db:
+        assert db.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    assert os.stat(other_path).st_mtime_ns == before
+    assert not os.path.exists(other_path + "-wal")
+
+
+def test_import_of_a_missing_file_creates_nothing(home, tmp_path):
+    sessions = telemetry_vr.SessionLog()
+    try:
+        with pytest.raises(sqlite3.Error):
+            sessions.import_from(str(tmp_path / "missing.sqlite3"))
+    finally:
+        sessions.close()
+    assert not os.path.exists(tmp_path / "missing.sqlite3")
@@ -0,0 +1,58 @@
+"""
+Knowledge about the layout of Unity player builds.
+"""
+import os
+import sys
+
+
+def data_folder(exe_path):
+    """The '<name>_Data' folder Unity places next to '<name>.exe'."""
+    stem = os.path.splitext(os.path.basename(exe_path))[0]
+    return os.path.join(os.path.dirname(exe_path), f"{stem}_Data")
+
+
+def player_log_root():
+    """Folder under which Unity players write '<Company>/<Product>/Player.log'."""
+    if sys.platform == "win32":
+        return os.path.expanduser(r"~\AppData\LocalLow")
+    if sys.platform == "darwin":
+        return os.path.expanduser("~/Library/Logs")
+    return os.path.expanduser("~/.config/unity3d")
+
+
+def app_info(exe_path):
+    """
+    (company, product) from '<name>_Data/app.info', which Unity writes into
+    every player build, or None if it is missing or unreadable.
+    """
+    try:
+        with open(os.path.join(data_folder(exe_path), "app.info"), encoding="utf-8", errors="replace") as f:
+            lines = [line.strip() for line in f.read().splitlines()]
+    except OSError:
+        return None
+    if len(lines) < 2 or not lines[0] or not lines[1]:
+        return None
+    return lines[0], lines[1]
+
+
+def player_log_path(exe_path):
+    """Where the build at exe_path writes its Player.log, or None if its app.info can't be read."""
+    info = app_info(exe_path)
+    if info is None:
+        return None
+    return os.path.join(player_log_root(), *info, "Player.log")
+
+
+def find_player_log(exe_path, since):
+    """
+    The build's Player.log if it was written after *since* (a time.time()
+    value), else None. Unity truncates and rewrites the log on every start,
+    so a fresh mtime tells us this launch has come up.
+    """
+    path = player_log_path(exe_path)
+    if path is None:
+        return None
+    try:
+        return path if os.path.getmtime(path) >= since else None
+    except OSError:
+        return None